@@ -0,0 +1,250 @@
+from collections import Counter
+from datetime import date
+from heapq import nsmallest
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+from Backend.entries import AnalysisEntry
+from Backend.lazy_imports import LazyImport
+from Backend.metrics import default_metrics
+from Backend.noun_phrases import NounPhraseExtractor, TextBlobNounPhraseExtractor
+from Backend.sentiment import LexiconSentimentAnalyzer, SentimentAnalyzer
+from Backend.space_saving import SpaceSavingCounter
+
+if TYPE_CHECKING:
+    from Backend.score_cache import ScoreCache  # score cache imports this module
+
+TextBlob = LazyImport('textblob', 'TextBlob')  # imported on first use, as it imports NLTK
+
+# version of NLP analysis done by score_text, cached scores of other versions are not reused
+analyzer_version = f'textblob-{version("textblob")}'
+
+
+def score_text(text: str) -> tuple[float, list[str]]:
+    """
+    Does NLP analysis of article text.
+
+    :param text: text of article.
+    :return: tuple of text sentiment polarity and list of recognized noun phrases.
+    """
+
+    blob = TextBlob(text)
+    return blob.sentiment.polarity, blob.noun_phrases
+
+
+class TextAnalyzer:
+    """
+    Does NLP analysis of batches of article texts with pluggable backends: sentiment polarities of all texts of batch
+    are computed at once by sentiment analyzer and noun phrases are recognized by noun phrase extractor.
+
+    Attributes:
+    - sentiment_analyzer (SentimentAnalyzer): Backend of sentiment analysis.
+    - noun_phrase_extractor (NounPhraseExtractor): Backend of noun phrases extraction.
+    - version (str): Version of NLP analysis, cached results of other versions are not reused.
+    """
+
+    def __init__(
+            self,
+            sentiment_analyzer: SentimentAnalyzer = None,
+            noun_phrase_extractor: NounPhraseExtractor = None):
+        """
+        Constructor for TextAnalyzer.
+
+        :param sentiment_analyzer: backend of sentiment analysis, LexiconSentimentAnalyzer by default.
+        :param noun_phrase_extractor: backend of noun phrases extraction, TextBlobNounPhraseExtractor by default.
+        """
+
+        self.sentiment_analyzer = sentiment_analyzer or LexiconSentimentAnalyzer()
+        self.noun_phrase_extractor = noun_phrase_extractor or TextBlobNounPhraseExtractor()
+
+    @property
+    def version(self) -> str:
+        return f'{self.sentiment_analyzer.version}/{self.noun_phrase_extractor.version}'
+
+    def score_batch(self, texts: list[str]) -> tuple[np.ndarray, list[list[str]]]:
+        """
+        Does NLP analysis of batch of article texts.
+
+        :param texts: list of texts of articles.
+        :return: tuple of array of sentiment polarities of texts and lists of noun phrases, recognized in every text.
+        """
+
+        with default_metrics.span('sentiment'):
+            polarities = self.sentiment_analyzer.polarities(texts)
+        with default_metrics.span('noun_phrases'):
+            noun_phrases = self.noun_phrase_extractor.extract(texts)
+        default_metrics.increment('texts_scored', len(texts))
+        return polarities, noun_phrases
+
+    def score(self, text: str) -> tuple[float, list[str]]:
+        """
+        Does NLP analysis of single article text.
+
+        :param text: text of article.
+        :return: tuple of text sentiment polarity and list of recognized noun phrases.
+        """
+
+        polarities, noun_phrases = self.score_batch([text])
+        return float(polarities[0]), noun_phrases[0]
+
+
+default_analyzer = TextAnalyzer()  # NLP analysis, used when no other analyzer is passed
+
+
+def score_texts(texts: list[str], score_cache: 'ScoreCache | None', analyzer: TextAnalyzer) \
+        -> tuple[np.ndarray, list[list[str]]]:
+    """
+    Does NLP analysis on texts with score cache, if it is given.
+
+    :param texts: list of texts to analyze.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param analyzer: NLP analyzer of texts.
+    :return: tuple of polarities of texts and lists of their noun phrases.
+    """
+
+    if score_cache is not None:
+        return score_cache.score_batch(texts, analyzer)
+    return analyzer.score_batch(texts)
+
+
+class AnalysisAccumulator:
+    """
+    A class for accumulating NLP analysis results of articles by publishing date.
+    Results are kept per date, so they can be merged and summarized for any date range.
+
+    Attributes:
+    - daily (dict[datetime.date, AnalysisEntry]): Sentiment counts for every date.
+    - daily_nouns (dict[datetime.date, Counter | SpaceSavingCounter]): Noun phrases counts for every date.
+    - nouns_capacity (int): Capacity of approximate noun phrases counters, None to count all noun phrases exactly.
+    """
+
+    def __init__(self, nouns_capacity: int = None):
+        """
+        Constructor for AnalysisAccumulator. Sets daily and daily_nouns to empty dictionaries.
+
+        :param nouns_capacity: capacity of approximate noun phrases counters, which keep memory bounded,
+         None to count all noun phrases exactly.
+        """
+
+        self.daily = {}
+        self.daily_nouns = {}
+        self.nouns_capacity = nouns_capacity
+
+    def add(self, post_date: date, polarity: float, noun_phrases: list[str]) -> None:
+        """
+        Adds analysis results of single article.
+
+        :param post_date: publishing date of article.
+        :param polarity: sentiment polarity of article text.
+        :param noun_phrases: noun phrases, recognized in article text.
+        """
+
+        entry = self.get_entry(post_date)
+
+        # get text sentiment data
+        if polarity > 0.2:
+            entry.positive_count += 1
+        elif polarity < -0.2:
+            entry.negative_count += 1
+        else:
+            entry.neutral_count += 1
+        entry.total_count += 1
+
+        self.daily_nouns[post_date].update(noun_phrases)
+
+    def add_batch(self, dates: Iterable[int], polarities: np.ndarray, noun_phrases: list[list[str]]) -> None:
+        """
+        Adds analysis results of batch of articles. Sentiments are bucketed and counted for the whole batch at once.
+
+        :param dates: publishing dates of articles as ordinals, e.g. DataBatch.dates.
+        :param polarities: array of sentiment polarities of articles texts.
+        :param noun_phrases: noun phrases, recognized in every article text.
+        """
+
+        # buckets are 0 for positive, 1 for neutral and 2 for negative texts
+        ordinals, dates_indices = np.unique(np.asarray(dates, dtype=np.int64), return_inverse=True)
+        buckets = np.where(polarities > 0.2, 0, np.where(polarities < -0.2, 2, 1))
+        counts = np.bincount(dates_indices * 3 + buckets, minlength=3 * len(ordinals)).reshape(-1, 3)
+
+        days = [date.fromordinal(ordinal) for ordinal in ordinals.tolist()]
+        for day, (positive, neutral, negative) in zip(days, counts.tolist()):
+            entry = self.get_entry(day)
+            entry.positive_count += positive
+            entry.neutral_count += neutral
+            entry.negative_count += negative
+            entry.total_count += positive + neutral + negative
+
+        for dates_index, text_noun_phrases in zip(dates_indices.tolist(), noun_phrases):
+            self.daily_nouns[days[dates_index]].update(text_noun_phrases)
+
+    def merge(self, other: 'AnalysisAccumulator') -> None:
+        """
+        Adds all analysis results of another accumulator.
+
+        :param other: AnalysisAccumulator to add results of.
+        """
+
+        for post_date, other_entry in other.daily.items():
+            entry = self.get_entry(post_date)
+            entry.total_count += other_entry.total_count
+            entry.positive_count += other_entry.positive_count
+            entry.neutral_count += other_entry.neutral_count
+            entry.negative_count += other_entry.negative_count
+            self.daily_nouns[post_date].update(other.daily_nouns[post_date])
+
+    def get_entry(self, post_date: date) -> AnalysisEntry:
+        # receive or create new AnalysisEntry for certain day
+        entry = self.daily.get(post_date)
+        if entry is None:
+            entry = self.daily[post_date] = AnalysisEntry()
+            self.daily_nouns[post_date] = self.create_counter()
+        return entry
+
+    def create_counter(self) -> Counter | SpaceSavingCounter:
+        return Counter() if self.nouns_capacity is None else SpaceSavingCounter(self.nouns_capacity)
+
+    def summary(self, min_date: date = None, top_nouns: int = 20) -> dict:
+        """
+        Builds summary results of analysis in the format of get_analysis result.
+
+        :param min_date: minimum publishing date of articles to summarize, None to summarize all of them.
+        :param top_nouns: number of the most common noun phrases in result.
+        :return: dictionary in the format of get_analysis result without 'failed_providers' key.
+        """
+
+        total_entry = AnalysisEntry()  # entry for holding total statistics data
+        nouns = self.create_counter()  # counts of all nouns, recognized in articles
+
+        # sort daily entries by date
+        dates_entries = {d: e for d, e in sorted(self.daily.items()) if min_date is None or d >= min_date}
+        for post_date, entry in dates_entries.items():
+            total_entry.total_count += entry.total_count
+            total_entry.positive_count += entry.positive_count
+            total_entry.neutral_count += entry.neutral_count
+            total_entry.negative_count += entry.negative_count
+            nouns.update(self.daily_nouns[post_date])
+
+        # order nouns with equal counts alphabetically, so result doesn't depend on order of articles
+        most_common_nouns = nsmallest(top_nouns, nouns.items(), key=lambda item: (-item[1], item[0]))
+
+        return {
+            'total': {
+                'count': total_entry.total_count,
+                'positive': total_entry.positive_count,
+                'negative': total_entry.negative_count,
+                'neutral': total_entry.neutral_count
+            },
+            'daily': {
+                'dates': [published_date for published_date in dates_entries.keys()],
+                'count': [entry.total_count for entry in dates_entries.values()],
+                'positive': [entry.positive_count for entry in dates_entries.values()],
+                'negative': [entry.negative_count for entry in dates_entries.values()],
+                'neutral': [entry.neutral_count for entry in dates_entries.values()],
+            },
+            f'top{top_nouns}_nouns': {
+                'nouns': [item[0] for item in most_common_nouns],
+                'count': [item[1] for item in most_common_nouns],
+            }
+        }
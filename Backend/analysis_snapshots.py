@@ -0,0 +1,245 @@
+import json
+import os
+from datetime import date
+from typing import Iterable
+
+import numpy as np
+
+from Backend.analysis import AnalysisAccumulator
+
+snapshot_format_version = 1
+epoch_ordinal = date(1970, 1, 1).toordinal()  # datetime64[D] values are days since epoch
+
+
+class ScoredArticles:
+    """
+    A columnar table of NLP analysis results of single articles. Noun phrases are dictionary encoded: noun phrases
+    of every article are a slice of noun_ids, which are indices in vocabulary, so the whole table is a few flat
+    NumPy arrays, which can be saved and memory mapped as they are.
+
+    Attributes:
+    - dates (np.ndarray): Publishing dates of articles, datetime64[D] array.
+    - polarities (np.ndarray): Sentiment polarities of article texts, float64 array.
+    - noun_offsets (np.ndarray): Start of noun phrases of every article in noun_ids followed by the end of the last
+     one, int64 array.
+    - noun_ids (np.ndarray): Indices of noun phrases of all articles in vocabulary, int32 array.
+    - vocabulary (np.ndarray): Distinct noun phrases, unicode array.
+    """
+
+    columns = ('dates', 'polarities', 'noun_offsets', 'noun_ids', 'vocabulary')
+
+    def __init__(self, dates: np.ndarray, polarities: np.ndarray, noun_offsets: np.ndarray, noun_ids: np.ndarray,
+                 vocabulary: np.ndarray):
+        """
+        Constructor for ScoredArticles.
+        """
+
+        self.dates = dates
+        self.polarities = polarities
+        self.noun_offsets = noun_offsets
+        self.noun_ids = noun_ids
+        self.vocabulary = vocabulary
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def get_noun_phrases(self, index: int) -> list[str]:
+        """
+        Returns noun phrases of article.
+
+        :param index: index of article in the table.
+        :return: list of noun phrases.
+        """
+
+        return self.vocabulary[self.noun_ids[self.noun_offsets[index]:self.noun_offsets[index + 1]]].tolist()
+
+    def to_accumulator(self, nouns_capacity: int = None) -> AnalysisAccumulator:
+        """
+        Builds accumulated analysis results of all articles of the table, so they can be summarized again,
+        e.g. for another date range or number of top nouns.
+
+        :param nouns_capacity: capacity of approximate noun phrases counters, None to count all noun phrases exactly.
+        :return: AnalysisAccumulator object.
+        """
+
+        accumulator = AnalysisAccumulator(nouns_capacity)
+        ordinals = self.dates.astype(np.int64) + epoch_ordinal
+        noun_phrases = [self.get_noun_phrases(index) for index in range(len(self))]
+        accumulator.add_batch(ordinals, np.asarray(self.polarities), noun_phrases)
+        return accumulator
+
+
+class ScoredArticlesRecorder(AnalysisAccumulator):
+    """
+    AnalysisAccumulator, which also keeps analysis results of every added article, so they can be built
+    into ScoredArticles table. Results of articles are kept only, when they are added one by one or in batches,
+    so it can't be used by ParallelScorer, which merges accumulators of its workers.
+    """
+
+    def __init__(self, nouns_capacity: int = None):
+        """
+        Constructor for ScoredArticlesRecorder.
+
+        :param nouns_capacity: capacity of approximate noun phrases counters, None to count all noun phrases exactly.
+        """
+
+        super().__init__(nouns_capacity)
+        self.ordinals = []
+        self.polarities = []
+        self.noun_phrases = []
+
+    def add(self, post_date: date, polarity: float, noun_phrases: list[str]) -> None:
+        super().add(post_date, polarity, noun_phrases)
+        self.ordinals.append(post_date.toordinal())
+        self.polarities.append(polarity)
+        self.noun_phrases.append(noun_phrases)
+
+    def add_batch(self, dates: Iterable[int], polarities: np.ndarray, noun_phrases: list[list[str]]) -> None:
+        dates = list(dates)
+        super().add_batch(dates, polarities, noun_phrases)
+        self.ordinals += dates
+        self.polarities += np.asarray(polarities, dtype=np.float64).tolist()
+        self.noun_phrases += noun_phrases
+
+    def merge(self, other: AnalysisAccumulator) -> None:
+        raise ValueError('ScoredArticlesRecorder keeps results of single articles, so accumulators can\'t be merged')
+
+    def to_table(self) -> ScoredArticles:
+        """
+        Builds table of analysis results of all added articles.
+
+        :return: ScoredArticles object.
+        """
+
+        vocabulary = {}  # index of every noun phrase in vocabulary
+        noun_ids = [vocabulary.setdefault(noun, len(vocabulary)) for nouns in self.noun_phrases for noun in nouns]
+        noun_offsets = np.zeros(len(self.noun_phrases) + 1, dtype=np.int64)
+        np.cumsum([len(nouns) for nouns in self.noun_phrases], out=noun_offsets[1:])
+
+        return ScoredArticles(
+            (np.array(self.ordinals, dtype=np.int64) - epoch_ordinal).astype('datetime64[D]'),
+            np.array(self.polarities, dtype=np.float64),
+            noun_offsets,
+            np.array(noun_ids, dtype=np.int32),
+            np.array(list(vocabulary), dtype=str))
+
+
+class AnalysisSnapshot:
+    """
+    A class for saved results of analysis with analysis results of its single articles.
+
+    Snapshot is saved as a directory of .npy files, one per column, and meta.json with scalar values.
+    Unlike members of .npz archive, .npy files can be memory mapped, so loading doesn't read daily series and
+    articles table until they are used, and they aren't copied into memory of the process.
+
+    Attributes:
+    - keyword (str): Keyword/phrase, the analysis is done for.
+    - min_date (datetime.date): Minimum published date of analyzed articles.
+    - analysis (dict): Results in the format of get_analysis result. Daily series of loaded snapshot are NumPy arrays,
+     dates are datetime64[D] array.
+    - articles (ScoredArticles): Analysis results of single articles, None if they weren't recorded.
+    """
+
+    def __init__(self, keyword: str, min_date: date, analysis: dict, articles: ScoredArticles = None):
+        """
+        Constructor for AnalysisSnapshot.
+
+        :param keyword: keyword/phrase, the analysis is done for.
+        :param min_date: minimum published date of analyzed articles.
+        :param analysis: results in the format of get_analysis result.
+        :param articles: analysis results of single articles, None if they weren't recorded.
+        """
+
+        self.keyword = keyword
+        self.min_date = min_date
+        self.analysis = analysis
+        self.articles = articles
+
+    def save(self, path: str) -> None:
+        """
+        Saves snapshot to directory, replacing snapshot, which was saved there before.
+
+        :param path: path to directory of snapshot, it is created if it doesn't exist.
+        """
+
+        # meta of replaced snapshot is removed first and written last, so incomplete snapshot is never loaded
+        meta_path = os.path.join(path, 'meta.json')
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        daily = self.analysis['daily']
+        top_nouns_key = get_top_nouns_key(self.analysis)
+        top_nouns = self.analysis[top_nouns_key]
+
+        columns = {
+            'daily_dates': np.array(daily['dates'], dtype='datetime64[D]'),
+            # every row of the matrix is a contiguous series, so loaded series are views without copying
+            'daily_counts': np.array([daily['count'], daily['positive'], daily['negative'], daily['neutral']],
+                                     dtype=np.int64).reshape(4, -1),
+            'top_nouns': np.array(top_nouns['nouns'], dtype=str),
+            'top_nouns_count': np.array(top_nouns['count'], dtype=np.int64),
+        }
+        if self.articles is not None:
+            columns |= {f'articles_{column}': getattr(self.articles, column) for column in ScoredArticles.columns}
+        for name, values in columns.items():
+            np.save(os.path.join(path, f'{name}.npy'), values)
+
+        meta = {
+            'version': snapshot_format_version,
+            'keyword': self.keyword,
+            'min_date': self.min_date.isoformat(),
+            'total': self.analysis['total'],
+            'top_nouns_key': top_nouns_key,
+            'duplicates': self.analysis.get('duplicates', 0),
+            'failed_providers': self.analysis.get('failed_providers', []),
+            'has_articles': self.articles is not None,
+        }
+        with open(meta_path, 'w', encoding='utf-8') as file:
+            json.dump(meta, file)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> 'AnalysisSnapshot':
+        """
+        Loads snapshot, saved by save.
+
+        :param path: path to directory of snapshot.
+        :param mmap: if True, arrays are memory mapped read-only, otherwise they are read into memory.
+        :return: AnalysisSnapshot object.
+        """
+
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as file:
+            meta = json.load(file)
+        if meta['version'] != snapshot_format_version:
+            raise ValueError(f'Snapshot format version {meta["version"]} is not supported')
+
+        def load_column(name: str) -> np.ndarray:
+            return np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r' if mmap else None)
+
+        counts = load_column('daily_counts')
+        analysis = {
+            'total': meta['total'],
+            'daily': {
+                'dates': load_column('daily_dates'),
+                'count': counts[0],
+                'positive': counts[1],
+                'negative': counts[2],
+                'neutral': counts[3],
+            },
+            meta['top_nouns_key']: {
+                'nouns': load_column('top_nouns').tolist(),
+                'count': load_column('top_nouns_count').tolist(),
+            },
+            'duplicates': meta['duplicates'],
+            'failed_providers': meta['failed_providers'],
+        }
+
+        articles = None
+        if meta['has_articles']:
+            articles = ScoredArticles(*(load_column(f'articles_{column}') for column in ScoredArticles.columns))
+        return AnalysisSnapshot(meta['keyword'], date.fromisoformat(meta['min_date']), analysis, articles)
+
+
+def get_top_nouns_key(analysis: dict) -> str:
+    # key of top nouns depends on their number, e.g. 'top20_nouns'
+    return next(key for key in analysis if key.startswith('top') and key.endswith('_nouns'))
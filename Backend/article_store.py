@@ -0,0 +1,249 @@
+import re
+import sqlite3
+from datetime import date, datetime
+from hashlib import sha1
+from threading import Lock
+from typing import Iterable, Iterator
+
+from Backend.data_providers import DataProvider, iter_provider_articles
+from Backend.deduplication import normalize_url
+from Backend.entries import Article
+from Backend.metrics import default_metrics
+
+token_pattern = re.compile(r'\w+')
+
+
+class ArticleStore:
+    """
+    Local full-text store of articles in SQLite database with an inverted index of their tokens and an index of
+    publishing dates, so keyword and date range queries over historical articles are answered without APIs.
+
+    Articles are identified by normalized URL, or by text without URL, so the same article, loaded by several
+    providers or queries, is stored once.
+
+    Attributes:
+    - path (str): Path to SQLite database file, ':memory:' to keep articles in memory only.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        Constructor for ArticleStore. Opens database, creating its tables if needed.
+
+        :param path: path to SQLite database file, ':memory:' to keep articles in memory only.
+        """
+
+        self.path = path
+
+        # connection is shared by threads of concurrent fetches, so access to it is serialized with lock
+        self.lock = Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        # every page of fetched articles is committed, WAL without fsync on every commit keeps it from slowing fetches
+        self.connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                key TEXT UNIQUE,
+                date TEXT,
+                published_at TEXT,
+                title TEXT,
+                url TEXT,
+                description TEXT,
+                text TEXT,
+                provider TEXT
+            );
+            CREATE INDEX IF NOT EXISTS articles_date ON articles (date);
+            CREATE TABLE IF NOT EXISTS tokens (
+                token TEXT,
+                article_id INTEGER,
+                PRIMARY KEY (token, article_id)
+            ) WITHOUT ROWID;
+            """)
+        self.connection.commit()
+
+    def add(self, articles: Iterable[Article], provider: str = None) -> int:
+        """
+        Stores articles, which aren't stored yet, and indexes their tokens.
+
+        :param articles: iterable of Article objects.
+        :param provider: name of provider, articles were loaded from.
+        :return: number of newly stored articles.
+        """
+
+        rows = [(get_store_key(article), article.date.isoformat(),
+                 article.published_at and article.published_at.isoformat(), article.title, article.url,
+                 article.description, article.text, provider) for article in articles]
+        added = 0
+        with self.lock:
+            for row in rows:
+                cursor = self.connection.execute(
+                    'INSERT INTO articles (key, date, published_at, title, url, description, text, provider) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO NOTHING', row)
+                if not cursor.rowcount:
+                    continue
+                added += 1
+                self.connection.executemany(
+                    'INSERT OR IGNORE INTO tokens VALUES (?, ?)',
+                    ((token, cursor.lastrowid) for token in get_tokens(row[3], row[5], row[6])))
+            self.connection.commit()
+        return added
+
+    def search(self, keyword: str, min_date: date, max_date: date = None, max_items: int = None) \
+            -> Iterator[Article]:
+        """
+        Finds articles, which contain all words of keyword in title, description or text, newest first.
+
+        :param keyword: keyword/phrase to do search on.
+        :param min_date: minimum published date of articles.
+        :param max_date: maximum published date of articles, None for no limit.
+        :param max_items: max number of articles, None for no limit.
+        :return: iterator over Article objects.
+        """
+
+        tokens = sorted(get_tokens(keyword))
+        if not tokens:
+            return iter([])
+
+        # the inverted index gives articles with all tokens, dates are checked by date index of articles table
+        condition, parameters = 'date >= ?', [min_date.isoformat()]
+        if max_date is not None:
+            condition += ' AND date <= ?'
+            parameters.append(max_date.isoformat())
+        query = f"""
+            SELECT date, title, url, description, text, published_at FROM articles
+            WHERE id IN (
+                SELECT article_id FROM tokens WHERE token IN ({', '.join('?' * len(tokens))})
+                GROUP BY article_id HAVING COUNT(*) = ?)
+            AND {condition}
+            ORDER BY date DESC, published_at DESC, id DESC
+            LIMIT ?"""
+
+        with self.lock:
+            rows = self.connection.execute(
+                query, [*tokens, len(tokens), *parameters, -1 if max_items is None else max_items]).fetchall()
+        return (Article(date.fromisoformat(d), title, url, description, text,
+                        published_at and datetime.fromisoformat(published_at))
+                for d, title, url, description, text, published_at in rows)
+
+    def count(self) -> int:
+        """
+        Returns number of stored articles.
+        """
+
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    def get_latest_date(self, keyword: str) -> date | None:
+        """
+        Returns the latest published date of stored articles, which contain all words of keyword,
+        so remote providers can be queried only for fresher articles.
+
+        :param keyword: keyword/phrase to do search on.
+        :return: date or None if there are no such articles.
+        """
+
+        latest = next(self.search(keyword, date.min, max_items=1), None)
+        return latest and latest.date
+
+    def clear(self) -> None:
+        """
+        Removes all stored articles.
+        """
+
+        with self.lock:
+            self.connection.execute('DELETE FROM tokens')
+            self.connection.execute('DELETE FROM articles')
+            self.connection.commit()
+
+
+class LocalIndexDataProvider(DataProvider):
+    """
+    Data provider, which answers queries from ArticleStore instead of remote API, so they are answered offline
+    in milliseconds. Articles contain all words of keyword and are returned newest first.
+
+    Attributes:
+    - store (ArticleStore): Store, which articles are searched in.
+    """
+
+    def __init__(self, store: ArticleStore):
+        """
+        Constructor for LocalIndexDataProvider.
+
+        :param store: store, which articles are searched in.
+        """
+
+        self.store = store
+
+    def iter_articles(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[Article]:
+        return self.store.search(keyword, min_published_date, max_items=max_items)
+
+
+class StoringDataProvider(DataProvider):
+    """
+    Wraps another data provider and stores every article it loads in ArticleStore, page by page,
+    so they can be queried later with LocalIndexDataProvider.
+
+    Attributes:
+    - provider (DataProvider): Wrapped data provider.
+    - store (ArticleStore): Store of loaded articles.
+    - name (str): Name of wrapped provider, stored with its articles.
+    """
+
+    def __init__(self, provider: DataProvider, store: ArticleStore, name: str = None):
+        """
+        Constructor for StoringDataProvider.
+
+        :param provider: data provider to wrap.
+        :param store: store of loaded articles.
+        :param name: name of wrapped provider, its class name by default.
+        """
+
+        self.provider = provider
+        self.store = store
+        self.name = name or type(provider).__name__
+        self.batch_size = getattr(provider, 'batch_size', DataProvider.batch_size)
+
+    def iter_articles(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[Article]:
+        page = []
+        try:
+            for article in iter_provider_articles(self.provider, keyword, min_published_date, max_items):
+                page.append(article)
+                if len(page) == self.batch_size:
+                    self.store_page(page)
+                    page = []
+                yield article
+        finally:
+            # articles of the last page are stored, even if consumer stops iteration before the end
+            self.store_page(page)
+
+    def store_page(self, page: list[Article]) -> None:
+        if page:
+            default_metrics.increment('articles_stored', self.store.add(page, self.name), provider=self.name)
+
+
+def with_article_store(data_providers: list[DataProvider], store: ArticleStore) -> list[DataProvider]:
+    """
+    Wraps every provider, so all articles they load are stored.
+
+    :param data_providers: list of DataProvider objects.
+    :param store: store of loaded articles.
+    :return: list of StoringDataProvider objects in the order of providers.
+    """
+
+    return [StoringDataProvider(provider, store) for provider in data_providers]
+
+
+def get_store_key(article: Article) -> str:
+    # normalized URL, so links of the same article from different providers are stored once
+    return normalize_url(article.url) if article.url else 'text:' + sha1(article.text.encode('utf-8')).hexdigest()
+
+
+def get_tokens(*texts: str | None) -> set[str]:
+    """
+    Splits texts into lowercase word tokens.
+
+    :param texts: texts to split, None values are skipped.
+    :return: set of distinct tokens.
+    """
+
+    return {token for text in texts if text for token in token_pattern.findall(text.lower())}
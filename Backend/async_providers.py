@@ -0,0 +1,172 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date
+from typing import Awaitable, Callable, TypeVar
+
+from Backend.data_providers import DataProvider, iter_provider_articles, iter_provider_batches, \
+    iter_provider_data, iter_provider_feed
+from Backend.entries import Article, DataBatch, DataEntry, FeedEntry, to_batches
+
+T = TypeVar('T')
+
+# loads of timed out blocking providers can't be interrupted and keep running, so they are run by own bounded executor
+# instead of default executor of event loop, which is also used by asyncio.to_thread and joined by asyncio.run
+default_provider_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix='provider')
+
+
+class AsyncDataProvider:
+    """
+    Provides a base class for news posts data providers with async loading methods, which can be awaited
+    by many requests at once from single event loop.
+
+    Like DataProvider, data and feed entries are built out of articles by default, so implementing load_articles
+    is enough.
+    """
+
+    batch_size = DataProvider.batch_size  # max number of posts in batches, built by load_batches
+
+    async def load_articles(self, keyword: str, min_published_date: date, max_items: int) -> list[Article]:
+        """
+        Loads data from underlying API and returns data as a list of Article objects.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: list of Article objects
+        """
+
+        raise NotImplementedError(f'{type(self).__name__} must implement load_articles')
+
+    async def load_data(self, keyword: str, min_published_date: date, max_items: int) -> list[DataEntry]:
+        """
+        Loads data from underlying API and returns data as a list of DataEntry objects.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: list of DataEntry objects
+        """
+
+        articles = await self.load_articles(keyword, min_published_date, max_items)
+        return [article.to_data_entry() for article in articles if article.date >= min_published_date]
+
+    async def load_batches(self, keyword: str, min_published_date: date, max_items: int) -> list[DataBatch]:
+        """
+        Loads data from underlying API and returns data as a list of DataBatch objects.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: list of DataBatch objects
+        """
+
+        articles = await self.load_articles(keyword, min_published_date, max_items)
+        return list(to_batches((article for article in articles if article.date >= min_published_date),
+                               self.batch_size))
+
+    async def load_feed(self, keyword: str, min_published_date: date, max_items: int) -> list[FeedEntry]:
+        """
+        Loads data from underlying API and returns data as a list of FeedEntry objects.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: list of FeedEntry objects
+        """
+
+        articles = await self.load_articles(keyword, min_published_date, max_items)
+        return [article.to_feed_entry() for article in articles]
+
+
+class SyncProviderAdapter(AsyncDataProvider):
+    """
+    Adapts blocking DataProvider to AsyncDataProvider interface by running its loading methods in worker threads
+    of bounded executor, so event loop isn't blocked while provider waits for API. Provider and its pooled HTTP
+    session are reused by all calls.
+
+    Loads, which aren't awaited anymore, because they timed out or were cancelled, keep running until provider
+    returns and hold their worker thread meanwhile, if all threads are held, next loads wait for a free one.
+
+    Attributes:
+    - provider (DataProvider): Adapted blocking provider.
+    - executor (Executor): Executor of loading methods.
+    """
+
+    def __init__(self, provider: DataProvider, executor: Executor = default_provider_executor):
+        """
+        Constructor for SyncProviderAdapter.
+
+        :param provider: blocking provider to adapt.
+        :param executor: executor of loading methods, shared bounded thread pool by default.
+        """
+
+        self.provider = provider
+        self.executor = executor
+
+    async def load_articles(self, keyword: str, min_published_date: date, max_items: int) -> list[Article]:
+        return await self.run(
+            lambda: list(iter_provider_articles(self.provider, keyword, min_published_date, max_items)))
+
+    async def load_data(self, keyword: str, min_published_date: date, max_items: int) -> list[DataEntry]:
+        return await self.run(
+            lambda: list(iter_provider_data(self.provider, keyword, min_published_date, max_items)))
+
+    async def load_batches(self, keyword: str, min_published_date: date, max_items: int) -> list[DataBatch]:
+        # provider's own batches are used, so implemented providers don't build Article objects
+        return await self.run(
+            lambda: list(iter_provider_batches(self.provider, keyword, min_published_date, max_items)))
+
+    async def load_feed(self, keyword: str, min_published_date: date, max_items: int) -> list[FeedEntry]:
+        return await self.run(
+            lambda: list(iter_provider_feed(self.provider, keyword, min_published_date, max_items)))
+
+    async def run(self, function: Callable[[], T]) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function)
+
+
+def to_async_provider(provider: AsyncDataProvider | DataProvider) -> AsyncDataProvider:
+    """
+    Returns async interface of provider.
+
+    :param provider: async provider or blocking provider.
+    :return: provider itself, if it is async, otherwise SyncProviderAdapter of it.
+    """
+
+    return provider if isinstance(provider, AsyncDataProvider) else SyncProviderAdapter(provider)
+
+
+async def gather_from_providers(
+        load: Callable[[AsyncDataProvider], Awaitable[list]],
+        data_providers: list[AsyncDataProvider | DataProvider],
+        timeout: float = None,
+        allow_partial_results: bool = False) -> tuple[list[list], list, list[Exception]]:
+    """
+    Awaits load coroutine of every provider at the same time, the async counterpart of fetch_from_providers.
+
+    :param load: function, returning coroutine, which loads list of items from single async provider.
+    :param data_providers: list of AsyncDataProvider or DataProvider objects, from which data must be loaded.
+    :param timeout: max number of seconds to wait for every provider, None to wait without limit.
+    :param allow_partial_results: if True, failed or timed out providers are skipped and reported in result,
+     otherwise their error is raised.
+    :return: tuple of lists of results of providers, that responded in time, failed providers and their errors.
+    """
+
+    async def load_in_time(provider: AsyncDataProvider | DataProvider) -> list:
+        try:
+            return await asyncio.wait_for(load(to_async_provider(provider)), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f'{type(provider).__name__} did not respond in {timeout} seconds') from None
+
+    results = await asyncio.gather(*map(load_in_time, data_providers), return_exceptions=True)
+
+    # results are collected in providers order, so output doesn't depend on response timings
+    loaded, failed_providers, errors = [], [], []
+    for provider, result in zip(data_providers, results):
+        if not isinstance(result, Exception):
+            loaded.append(result)
+            continue
+        if not allow_partial_results:
+            raise result
+        failed_providers.append(provider)
+        errors.append(result)
+    return loaded, failed_providers, errors
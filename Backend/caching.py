@@ -0,0 +1,178 @@
+import json
+import sqlite3
+from datetime import date, datetime
+from threading import Lock
+from time import time
+from typing import Callable
+
+from Backend.data_providers import DataProvider
+from Backend.entries import Article
+from Backend.metrics import default_metrics
+
+
+class CachedDataProvider(DataProvider):
+    """
+    Wraps another data provider and caches articles it loads in SQLite database,
+    so repeated queries don't spend API quota.
+
+    Cached query answers a new one, if it was done for the same keyword, with the same or earlier minimum
+    published date and enough articles, in which case cached articles are filtered instead of refetching them.
+
+    Attributes:
+    - provider (DataProvider): Wrapped data provider. It must implement load_articles method.
+    - name (str): Name of wrapped provider, used as a part of cache key.
+    - ttl (float): Number of seconds cached articles stay valid.
+    - max_entries (int): Max number of cached queries. Least recently used ones are evicted first.
+    - hits (int): Number of queries answered from cache.
+    - misses (int): Number of queries passed to wrapped provider.
+    """
+
+    def __init__(
+            self,
+            provider: DataProvider,
+            path: str = ':memory:',
+            ttl: float = 3600,
+            max_entries: int = 1000,
+            name: str = None,
+            clock: Callable[[], float] = time):
+        """
+        Constructor for CachedDataProvider. Opens cache database, creating it if needed.
+
+        :param provider: data provider to wrap.
+        :param path: path to SQLite database file, ':memory:' to keep cache in memory only.
+        :param ttl: number of seconds cached articles stay valid.
+        :param max_entries: max number of cached queries.
+        :param name: name of wrapped provider, its class name by default.
+        :param clock: function returning current time in seconds.
+        """
+
+        self.provider = provider
+        self.name = name or type(provider).__name__
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.clock = clock
+
+        # connection is shared by threads of concurrent fetches, so access to it is serialized with lock
+        self.lock = Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                provider TEXT,
+                keyword TEXT,
+                min_published_date TEXT,
+                max_items INTEGER,
+                complete INTEGER,
+                articles TEXT,
+                created_at REAL,
+                accessed_at REAL,
+                PRIMARY KEY (provider, keyword, min_published_date, max_items)
+            )""")
+        self.connection.commit()
+
+    def load_articles(self, keyword: str, min_published_date: date, max_items: int) -> list[Article]:
+        articles = self.get_cached(keyword, min_published_date, max_items)
+        if articles is not None:
+            self.hits += 1
+            default_metrics.increment('provider_cache_hits', provider=type(self.provider).__name__)
+            return articles
+
+        self.misses += 1
+        default_metrics.increment('provider_cache_misses', provider=type(self.provider).__name__)
+        articles = self.provider.load_articles(keyword, min_published_date, max_items)
+        self.put(keyword, min_published_date, max_items, articles)
+        return articles
+
+    def get_cached(self, keyword: str, min_published_date: date, max_items: int) -> list[Article] | None:
+        """
+        Looks for cached query, that covers requested one, and returns its articles filtered for requested one.
+
+        :param keyword: keyword/phrase to do search on.
+        :param min_published_date: minimum published date for articles.
+        :param max_items: max number of articles to retrieve.
+        :return: list of Article objects or None if there is no suitable cached query.
+        """
+
+        now = self.clock()
+        with self.lock:
+            rows = self.connection.execute("""
+                SELECT rowid, max_items, complete, articles FROM responses
+                WHERE provider = ? AND keyword = ? AND min_published_date <= ? AND created_at > ?
+                ORDER BY min_published_date DESC, max_items""",
+                (self.name, keyword, min_published_date.isoformat(), now - self.ttl)).fetchall()
+
+            for rowid, cached_max_items, complete, cached_articles in rows:
+                if not complete and cached_max_items < max_items:
+                    continue
+
+                articles = [a for a in deserialize_articles(cached_articles) if a.date >= min_published_date]
+
+                # query that hit max_items limit may miss articles of narrower date range, unless there are enough
+                if not complete and len(articles) < max_items:
+                    continue
+
+                self.connection.execute('UPDATE responses SET accessed_at = ? WHERE rowid = ?', (now, rowid))
+                self.connection.commit()
+                return articles[:max_items]
+
+        return None
+
+    def put(self, keyword: str, min_published_date: date, max_items: int, articles: list[Article]) -> None:
+        """
+        Caches articles of query and evicts expired and least recently used queries.
+
+        :param keyword: keyword/phrase, search was done on.
+        :param min_published_date: minimum published date for articles.
+        :param max_items: max number of articles, that were requested.
+        :param articles: list of loaded Article objects.
+        """
+
+        now = self.clock()
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (self.name, keyword, min_published_date.isoformat(), max_items, len(articles) < max_items,
+                 serialize_articles(articles), now, now))
+            self.connection.execute('DELETE FROM responses WHERE created_at <= ?', (now - self.ttl,))
+            self.connection.execute("""
+                DELETE FROM responses WHERE rowid NOT IN
+                (SELECT rowid FROM responses ORDER BY accessed_at DESC LIMIT ?)""", (self.max_entries,))
+            self.connection.commit()
+
+    def clear(self) -> None:
+        """
+        Removes all cached queries and resets hit/miss counters.
+        """
+
+        with self.lock:
+            self.connection.execute('DELETE FROM responses')
+            self.connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+
+def serialize_articles(articles: list[Article]) -> str:
+    """
+    Converts articles to JSON string.
+
+    :param articles: list of Article objects.
+    :return: JSON string.
+    """
+
+    return json.dumps([[a.date.isoformat(), a.title, a.url, a.description, a.text,
+                        a.published_at and a.published_at.isoformat()] for a in articles])
+
+
+def deserialize_articles(data: str) -> list[Article]:
+    """
+    Converts JSON string, created by serialize_articles, back to articles.
+
+    :param data: JSON string.
+    :return: list of Article objects.
+    """
+
+    # articles cached before publishing time was kept have no time
+    return [Article(date.fromisoformat(d), title, url, description, text,
+                    datetime.fromisoformat(published_at[0]) if published_at and published_at[0] else None)
+            for d, title, url, description, text, *published_at in json.loads(data)]
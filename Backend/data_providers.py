@@ -1,17 +1,104 @@
-from datetime import date
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import islice
+from math import ceil
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
-from eventregistry import EventRegistry, QueryArticlesIter
-from newsapi import NewsApiClient
-from pandas import DataFrame, to_datetime
+import requests
 
-from Backend.entries import DataEntry, FeedEntry
+from Backend.entries import Article, DataBatch, DataEntry, FeedEntry, to_batches
+from Backend.http_session import get_shared_session
+from Backend.lazy_imports import LazyImport
+from Backend.metrics import default_metrics
+from Backend.scheduling import RequestScheduler, classify_error, default_scheduler, throttling_statuses, \
+    transient_statuses
+
+# API clients are imported, when providers are created, so modules, which only use base classes, are imported fast
+EventRegistry = LazyImport('eventregistry', 'EventRegistry')
+QueryArticlesIter = LazyImport('eventregistry', 'QueryArticlesIter')
+NewsApiClient = LazyImport('newsapi', 'NewsApiClient')
+
+T = TypeVar('T')
+
+# EventRegistry raises errors of failed requests without response, only their message has HTTP status
+event_registry_status_pattern = re.compile(r'HTTP status code (\d+)')
 
 
 class DataProvider:
     """
     Provides a base class for all news posts data providers.
+
+    Every loading method has a list-returning load_* and a streaming iter_* version, which are implemented
+    on top of each other, so subclasses must override at least one method of a pair.
+    By default data and feed entries are built out of articles, so implementing load_articles or
+    iter_articles is enough, while subclasses overriding load_data or load_feed still work with iter_* methods.
+
+    Providers, calling remote APIs, send requests through send_request, so requests of all providers
+    are rate limited, retried and counted by shared scheduler, and their time and number of loaded pages
+    are recorded in metrics.
     """
 
+    batch_size = 100  # max number of posts in batches, built by iter_batches
+    scheduler = default_scheduler  # scheduler of API requests, providers may have their own
+
+    def send_request(self, request: Callable[[], T]) -> T:
+        """
+        Sends request to underlying API through scheduler, which limits rate of requests, retries them on
+        transient errors and counts them in provider quota. Requests are limited and counted by provider class name.
+
+        :param request: function, sending request and returning its result.
+        :return: result of request.
+        """
+
+        name = type(self).__name__
+        with default_metrics.span('provider_request', provider=name):
+            result = self.scheduler.call(name, request, self.classify_error)
+        default_metrics.increment('pages', provider=name)
+        return result
+
+    @staticmethod
+    def classify_error(error: Exception) -> str | None:
+        """
+        Tells whether request, which raised error, is worth retrying. Providers add errors of their API clients.
+
+        :param error: error of request.
+        :return: 'throttled' if provider rejected request because of rate limits, 'transient' if request may succeed
+         on retry, None if it will fail again.
+        """
+
+        return classify_error(error)
+
+    def load_articles(self, keyword: str, min_published_date: date, max_items: int) -> list[Article]:
+        """
+        Loads data from underlying API and returns data as a list of Article objects.
+        Both load_data and load_feed are built on top of this method by default,
+        so callers needing both analysis and feed data can fetch articles only once.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: list of Article objects
+        """
+
+        return list(self.iter_articles(keyword, min_published_date, max_items))
+
+    def iter_articles(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[Article]:
+        """
+        Loads data from underlying API and yields Article objects as soon as they are received,
+        so callers can process first articles while the rest of them are still loading.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: iterator over Article objects
+        """
+
+        if type(self).load_articles is DataProvider.load_articles:
+            raise NotImplementedError(f'{type(self).__name__} must implement load_articles or iter_articles')
+        yield from self.load_articles(keyword, min_published_date, max_items)
+
     def load_data(self, keyword: str, min_published_date: date, max_items: int) -> list[DataEntry]:
         """
         Loads data from underlying API and returns data as a list of DataEntry objects.
@@ -21,7 +108,61 @@ class DataProvider:
         :param max_items: max number of articles to retrieve
         :return: list of DataEntry objects
         """
-        pass
+
+        return list(self.iter_data(keyword, min_published_date, max_items))
+
+    def iter_data(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[DataEntry]:
+        """
+        Loads data from underlying API and yields DataEntry objects as soon as they are received.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: iterator over DataEntry objects
+        """
+
+        if type(self).load_data is not DataProvider.load_data:
+            yield from self.load_data(keyword, min_published_date, max_items)
+            return
+
+        for article in self.iter_articles(keyword, min_published_date, max_items):
+            if article.date >= min_published_date:
+                yield article.to_data_entry()
+
+    def load_batch(self, keyword: str, min_published_date: date, max_items: int) -> DataBatch:
+        """
+        Loads data from underlying API and returns data as a single DataBatch object.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: DataBatch object
+        """
+
+        result = DataBatch()
+        for batch in self.iter_batches(keyword, min_published_date, max_items):
+            result.dates.extend(batch.dates)
+            result.texts.extend(batch.texts)
+            result.urls.extend(batch.urls)
+        return result
+
+    def iter_batches(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[DataBatch]:
+        """
+        Loads data from underlying API and yields DataBatch objects as soon as they are received.
+        By default batches are built out of Article or DataEntry objects, which implemented providers avoid.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: iterator over DataBatch objects
+        """
+
+        if type(self).load_data is not DataProvider.load_data or type(self).iter_data is not DataProvider.iter_data:
+            return to_batches(self.iter_data(keyword, min_published_date, max_items), self.batch_size)
+
+        # batches are built out of articles, so they keep links of news posts
+        articles = self.iter_articles(keyword, min_published_date, max_items)
+        return to_batches((article for article in articles if article.date >= min_published_date), self.batch_size)
 
     def load_feed(self, keyword: str, min_published_date: date, max_items: int) -> list[FeedEntry]:
         """
@@ -32,7 +173,138 @@ class DataProvider:
         :param max_items: max number of articles to retrieve
         :return: list of FeedEntry objects
         """
-        pass
+
+        return list(self.iter_feed(keyword, min_published_date, max_items))
+
+    def iter_feed(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[FeedEntry]:
+        """
+        Loads data from underlying API and yields FeedEntry objects as soon as they are received.
+
+        :param keyword: keyword/phrase to do search on
+        :param min_published_date: minimum published date for articles
+        :param max_items: max number of articles to retrieve
+        :return: iterator over FeedEntry objects
+        """
+
+        if type(self).load_feed is not DataProvider.load_feed:
+            yield from self.load_feed(keyword, min_published_date, max_items)
+            return
+
+        for article in self.iter_articles(keyword, min_published_date, max_items):
+            yield article.to_feed_entry()
+
+
+def parse_date(value: str) -> date:
+    """
+    Parses date of ISO 8601 date or timestamp string, like '2022-01-01' or '2022-01-01T12:00:00Z'.
+    Date is taken as it is written, in time zone of timestamp.
+
+    :param value: ISO 8601 date or timestamp string.
+    :return: date of timestamp.
+    """
+
+    return date.fromisoformat(value[:10])
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    """
+    Parses ISO 8601 timestamp string, like '2022-01-01T12:00:00Z'. Time is taken as it is written,
+    in time zone of timestamp, like date of parse_date.
+
+    :param value: ISO 8601 timestamp string or None.
+    :return: naive datetime of timestamp or None if value is None or has no time.
+    """
+
+    if value is None or len(value) < 13:
+        return None
+    return datetime.fromisoformat(value[:19])
+
+
+def iter_provider_articles(provider: DataProvider, keyword: str, min_published_date: date, max_items: int) \
+        -> Iterable[Article]:
+    """
+    Streams articles of provider. Duck-typed providers, which aren't DataProvider subclasses
+    and only implement load_articles, are supported too.
+
+    :param provider: data provider.
+    :param keyword: keyword/phrase to do search on
+    :param min_published_date: minimum published date for articles
+    :param max_items: max number of articles to retrieve
+    :return: iterable of Article objects
+    """
+
+    if isinstance(provider, DataProvider):
+        articles = provider.iter_articles(keyword, min_published_date, max_items)
+    else:
+        articles = provider.load_articles(keyword, min_published_date, max_items)
+    return default_metrics.count_items(articles, 'articles_loaded', provider=type(provider).__name__)
+
+
+def iter_provider_data(provider: DataProvider, keyword: str, min_published_date: date, max_items: int) \
+        -> Iterable[DataEntry]:
+    """
+    Streams data entries of provider. Duck-typed providers, which aren't DataProvider subclasses
+    and only implement load_data, are supported too.
+
+    :param provider: data provider.
+    :param keyword: keyword/phrase to do search on
+    :param min_published_date: minimum published date for articles
+    :param max_items: max number of articles to retrieve
+    :return: iterable of DataEntry objects
+    """
+
+    if isinstance(provider, DataProvider):
+        entries = provider.iter_data(keyword, min_published_date, max_items)
+    else:
+        entries = provider.load_data(keyword, min_published_date, max_items)
+    return default_metrics.count_items(entries, 'articles_loaded', provider=type(provider).__name__)
+
+
+def iter_provider_batches(provider: DataProvider, keyword: str, min_published_date: date, max_items: int) \
+        -> Iterable[DataBatch]:
+    """
+    Streams data batches of provider. Duck-typed providers, which aren't DataProvider subclasses
+    and only implement load_data, are supported too.
+
+    :param provider: data provider.
+    :param keyword: keyword/phrase to do search on
+    :param min_published_date: minimum published date for articles
+    :param max_items: max number of articles to retrieve
+    :return: iterable of DataBatch objects
+    """
+
+    if isinstance(provider, DataProvider):
+        batches = provider.iter_batches(keyword, min_published_date, max_items)
+    else:
+        batches = [DataBatch.from_entries(provider.load_data(keyword, min_published_date, max_items))]
+
+    name = type(provider).__name__
+    batches = default_metrics.count_items(batches, 'articles_loaded', len, provider=name)
+    return default_metrics.count_items(batches, 'text_bytes', get_text_bytes, provider=name)
+
+
+def iter_provider_feed(provider: DataProvider, keyword: str, min_published_date: date, max_items: int) \
+        -> Iterable[FeedEntry]:
+    """
+    Streams feed entries of provider. Duck-typed providers, which aren't DataProvider subclasses
+    and only implement load_feed, are supported too.
+
+    :param provider: data provider.
+    :param keyword: keyword/phrase to do search on
+    :param min_published_date: minimum published date for articles
+    :param max_items: max number of articles to retrieve
+    :return: iterable of FeedEntry objects
+    """
+
+    if isinstance(provider, DataProvider):
+        entries = provider.iter_feed(keyword, min_published_date, max_items)
+    else:
+        entries = provider.load_feed(keyword, min_published_date, max_items)
+    return default_metrics.count_items(entries, 'articles_loaded', provider=type(provider).__name__)
+
+
+def get_text_bytes(batch: DataBatch) -> int:
+    return sum(len(text.encode('utf-8')) for text in batch.texts if text)
 
 
 class NewsApiDataProvider(DataProvider):
@@ -41,62 +313,126 @@ class NewsApiDataProvider(DataProvider):
 
     Attributes:
     - client (NewsApiClient): API Client for NewsAPI.
+    - max_pages_in_flight (int): Max number of pages requested at the same time.
+    - scheduler (RequestScheduler): Scheduler of API requests.
     """
 
-    def __init__(self, api_key: str):
+    page_size = 100  # max page size allowed by NewsAPI
+
+    def __init__(
+            self,
+            api_key: str,
+            max_pages_in_flight: int = 4,
+            scheduler: RequestScheduler = default_scheduler,
+            session: requests.Session = None):
         """
         Constructor for NewsApiDataProvider. Inits NewsApiClient from provided API key.
 
         :param api_key: API key for NewsAPI.
+        :param max_pages_in_flight: max number of pages requested at the same time.
+        :param scheduler: scheduler of API requests, shared by all providers by default.
+        :param session: HTTP session, which keeps connections alive, session shared by all providers by default.
         """
 
-        self.client = NewsApiClient(api_key=api_key)
-
-    def load_data(self, keyword: str, min_published_date: date, max_items: int) -> list[DataEntry]:
-        # construct data frame from all articles
-        articles = self.get_articles(keyword, min_published_date, max_items)
-        df = DataFrame(articles)
-
-        # transform articles text and date data
-        df['date'] = to_datetime(df['publishedAt']).dt.date
-        df = df[df['date'] >= min_published_date]
-        df['text'] = df['description'].fillna(df['content'])
-        return [DataEntry(r['date'], r['text']) for _, r in df.iterrows()]
-
-    def load_feed(self, keyword: str, min_published_date: date, max_items: int) -> list[FeedEntry]:
-        # construct data frame from all articles
-        articles = self.get_articles(keyword, min_published_date, max_items)
-        df = DataFrame(articles)
-
-        # transform articles text and date data
-        df['date'] = to_datetime(df['publishedAt']).dt.date
-        df['description'] = df['description'].fillna(df['content'])
-        return [FeedEntry(r['title'], r['url'], r['description'], r['date']) for _, r in df.iterrows()]
+        self.client = NewsApiClient(api_key=api_key, session=session or get_shared_session())
+        self.max_pages_in_flight = max_pages_in_flight
+        self.scheduler = scheduler
+
+    def iter_articles(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[Article]:
+        for page in self.iter_pages(keyword, min_published_date, max_items):
+            yield from map(self.to_article, page)
+
+    def iter_batches(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[DataBatch]:
+        min_ordinal = min_published_date.toordinal()
+        for page in self.iter_pages(keyword, min_published_date, max_items):
+            # columns are built straight out of page, without creating Article and DataEntry objects
+            batch = DataBatch()
+            with default_metrics.span('normalize', provider=type(self).__name__):
+                for article in page:
+                    ordinal = parse_date(article['publishedAt']).toordinal()
+                    if ordinal >= min_ordinal:
+                        batch.dates.append(ordinal)
+                        description = article.get('description')
+                        batch.texts.append(description if description is not None else article.get('content'))
+                        batch.urls.append(article.get('url'))
+            yield batch
+
+    @staticmethod
+    def to_article(article: dict) -> Article:
+        # articles without description have only content
+        description = article.get('description')
+        if description is None:
+            description = article.get('content')
+        return Article(parse_date(article['publishedAt']), article.get('title'), article.get('url'),
+                       description, description, parse_timestamp(article['publishedAt']))
 
     def get_articles(self, keyword: str, min_published_date: date, max_items: int) -> list[dict]:
-        articles = []  # list of all retrieved articles
-        page = 1  # current page
-
-        # because of pagination, we do get requests until we loaded max_items articles or loaded them all
-        while True:
-
-            # request for current page
-            data = self.client.get_everything(q=keyword,
-                                              from_param=min_published_date,
-                                              page=page,
-                                              page_size=min(100, max_items - len(articles)),
-                                              language='en')
-
-            # add articles and move to the next page
-            articles += data['articles']
+        return [article for page in self.iter_pages(keyword, min_published_date, max_items) for article in page]
+
+    def iter_pages(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[list[dict]]:
+        page_size = min(self.page_size, max_items)
+        items_left = max_items  # number of articles, that can still be yielded
+
+        # first page tells how many articles are available, so we know how many pages to request
+        data = self.get_page(keyword, min_published_date, 1, page_size)
+        items_count = min(data['totalResults'], max_items)
+        loaded_count = len(data['articles'])
+        page = 2  # next page to request
+        yield data['articles'][:items_left]
+        items_left -= loaded_count
+
+        # if first page was full, request remaining pages concurrently, keeping at most max_pages_in_flight requests
+        if loaded_count == page_size < items_count:
+            pages = range(page, ceil(items_count / page_size) + 1)
+            next_pages = iter(pages)
+            with ThreadPoolExecutor(max_workers=self.max_pages_in_flight) as executor:
+                def request_next_pages(count: int) -> None:
+                    for next_page in islice(next_pages, count):
+                        in_flight.append(
+                            executor.submit(self.get_page, keyword, min_published_date, next_page, page_size))
+
+                # pages are yielded in order of requests, and the next page is requested, when one is received,
+                # so loaded pages don't pile up in memory, if consumer is slower than API
+                in_flight = deque()
+                request_next_pages(self.max_pages_in_flight)
+                try:
+                    while in_flight:
+                        data = in_flight.popleft().result()
+                        request_next_pages(1)
+                        loaded_count += len(data['articles'])
+                        yield data['articles'][:max(0, items_left)]
+                        items_left -= len(data['articles'])
+                finally:
+                    # pages, which weren't requested yet, are not requested, if consumer stops iteration
+                    for future in in_flight:
+                        future.cancel()
+            page += len(pages)
+
+        # if API returned fewer articles than requested, load the rest page by page,
+        # until we loaded all available articles or reached the max_items limit
+        while loaded_count < items_count and data['articles']:
+            data = self.get_page(keyword, min_published_date, page, page_size)
+            loaded_count += len(data['articles'])
             page += 1
+            yield data['articles'][:max(0, items_left)]
+            items_left -= len(data['articles'])
 
-            # break if we loaded all available articles or reached the max_items limit
-            articles_len = len(articles)
-            if articles_len >= data['totalResults'] or articles_len >= max_items:
-                break
+    def get_page(self, keyword: str, min_published_date: date, page: int, page_size: int) -> dict:
+        return self.send_request(lambda: self.client.get_everything(q=keyword,
+                                                                    from_param=min_published_date,
+                                                                    page=page,
+                                                                    page_size=page_size,
+                                                                    language='en'))
 
-        return articles
+    @staticmethod
+    def classify_error(error: Exception) -> str | None:
+        from newsapi.newsapi_exception import NewsAPIException
+
+        # NewsAPI reports errors with codes instead of HTTP statuses
+        if isinstance(error, NewsAPIException):
+            code = error.get_exception().get('code')
+            return 'throttled' if code == 'rateLimited' else 'transient' if code == 'unexpectedError' else None
+        return classify_error(error)
 
 
 class EventRegistryDataProvider(DataProvider):
@@ -105,41 +441,105 @@ class EventRegistryDataProvider(DataProvider):
 
     Attributes:
     - event_registry (EventRegistry): API Client for EventRegistry.
+    - scheduler (RequestScheduler): Scheduler of API requests.
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+            self,
+            api_key: str,
+            scheduler: RequestScheduler = default_scheduler,
+            session: requests.Session = None) -> None:
         """
         Constructor for EventRegistry. Inits EventRegistry from provided API key.
 
         :param api_key: API key for EventRegistry.
+        :param scheduler: scheduler of API requests, shared by all providers by default.
+        :param session: HTTP session, which keeps connections alive, session shared by all providers by default.
         """
 
-        self.event_registry = EventRegistry(apiKey=api_key)
-
-    def load_data(self, keyword: str, min_published_date: date, max_items: int) -> list[DataEntry]:
-        # construct data frame from all articles
-        articles = self.get_articles(keyword, min_published_date, max_items)
-        df = DataFrame(articles)
-
-        # transform articles date data
-        df['date'] = to_datetime(df['date']).dt.date
-        df = df[df['date'] >= min_published_date]
-        return [DataEntry(r['date'], r['body']) for _, r in df.iterrows()]
-
-    def load_feed(self, keyword: str, min_published_date: date, max_items: int) -> list[FeedEntry]:
-        # construct data frame from all articles
-        articles = self.get_articles(keyword, min_published_date, max_items)
-        df = DataFrame(articles)
-
-        # transform articles date data
-        df['date'] = to_datetime(df['date']).dt.date
-        return [FeedEntry(r['title'], r['url'], r['body'], r['date']) for _, r in df.iterrows()]
+        # failed requests are retried by scheduler, EventRegistry would retry them on its own every 5 seconds forever
+        self.event_registry = EventRegistry(apiKey=api_key, repeatFailedRequestCount=0)
+        # EventRegistry creates its own session and has no parameter for it, so its private attribute is replaced,
+        # if it is renamed by new version of the library, connections wouldn't be shared silently
+        if not hasattr(self.event_registry, '_reqSession'):
+            raise AttributeError('EventRegistry client has no _reqSession attribute, HTTP session can\'t be shared')
+        self.event_registry._reqSession = session or get_shared_session()
+        self.scheduler = scheduler
+
+    @staticmethod
+    def classify_error(error: Exception) -> str | None:
+        # EventRegistry raises plain Exception with HTTP status in message for failed responses
+        match = event_registry_status_pattern.search(str(error))
+        if match is None:
+            return classify_error(error)
+        status = int(match.group(1))
+        return 'throttled' if status in throttling_statuses else 'transient' if status in transient_statuses else None
+
+    def iter_articles(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[Article]:
+        return map(self.to_article, self.iter_raw_articles(keyword, min_published_date, max_items))
+
+    def iter_batches(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[DataBatch]:
+        min_ordinal = min_published_date.toordinal()
+        articles = self.iter_raw_articles(keyword, min_published_date, max_items)
+        while page := list(islice(articles, self.batch_size)):
+            # columns are built straight out of page, without creating Article and DataEntry objects
+            batch = DataBatch()
+            with default_metrics.span('normalize', provider=type(self).__name__):
+                for article in page:
+                    ordinal = parse_date(article['date']).toordinal()
+                    if ordinal >= min_ordinal:
+                        batch.dates.append(ordinal)
+                        batch.texts.append(article['body'])
+                        batch.urls.append(article.get('url'))
+            yield batch
+
+    @staticmethod
+    def to_article(article: dict) -> Article:
+        return Article(parse_date(article['date']), article.get('title'), article.get('url'),
+                       article['body'], article['body'], parse_timestamp(article.get('dateTime')))
 
     def get_articles(self, keyword: str, min_published_date: date, max_items: int) -> list[dict]:
+        return list(self.iter_raw_articles(keyword, min_published_date, max_items))
+
+    def iter_raw_articles(self, keyword: str, min_published_date: date, max_items: int) -> Iterator[dict]:
         # create query parameters
         q = QueryArticlesIter(keywords=keyword,
                               lang='eng',
                               dateStart=min_published_date.strftime('%Y-%m-%d'))
 
-        # execute query and move all received articles to list
-        return list(q.execQuery(self.event_registry, maxItems=max_items))
+        # execute query, which loads next page of articles only when previous one is iterated,
+        # every page request is sent through scheduler. QueryArticlesIter restarts from the first page on every
+        # iter call, so it is wrapped in generator, which can be sliced by callers
+        articles = q.execQuery(ScheduledClient(self.event_registry, self, {'execQuery'}), maxItems=max_items)
+        return (article for article in articles)
+
+
+class ScheduledClient:
+    """
+    Proxy of API client, which sends calls of given methods through send_request of data provider,
+    for API libraries, which request pages by themselves.
+
+    Attributes:
+    - client (Any): Wrapped API client.
+    - provider (DataProvider): Data provider, which requests are sent through.
+    - methods (set[str]): Names of client methods, which send requests.
+    """
+
+    def __init__(self, client: Any, provider: DataProvider, methods: set[str]):
+        """
+        Constructor for ScheduledClient.
+
+        :param client: API client to wrap.
+        :param provider: data provider, which requests are sent through.
+        :param methods: names of client methods, which send requests.
+        """
+
+        self.client = client
+        self.provider = provider
+        self.methods = methods
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.client, name)
+        if name not in self.methods:
+            return attribute
+        return lambda *args, **kwargs: self.provider.send_request(lambda: attribute(*args, **kwargs))
@@ -0,0 +1,197 @@
+import re
+from hashlib import blake2b
+from typing import Iterable, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+from Backend.entries import Article, DataBatch, FeedEntry
+
+# query parameters, which only track where reader came from and don't change article
+tracking_parameters = {'fbclid', 'gclid', 'ocid', 'cmpid', 'ref', 'smid', 'src'}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes article URL, so links to the same article from different providers are equal:
+    scheme, "www." prefix, fragment, trailing slash and tracking query parameters are dropped,
+    host is lowercased and the rest of query parameters are sorted.
+
+    :param url: article URL.
+    :return: normalized URL.
+    """
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix('www.')
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not name.startswith('utm_') and name not in tracking_parameters)
+    return urlunsplit(('', host, parts.path.rstrip('/'), urlencode(query), ''))
+
+
+class DeduplicationIndex:
+    """
+    Index of seen articles, which finds exact duplicates by normalized URL and near-duplicates by MinHash of text.
+
+    Text is represented by the set of its word shingles and MinHash signature estimates Jaccard similarity
+    of these sets as the share of equal signature values. Signature is split into bands, and only texts,
+    which have the same values in at least one band (LSH buckets), are compared, so insertion cost depends on
+    bucket sizes, not on the number of indexed articles. Texts with similarity above about (1 / bands) ** (1 / rows)
+    almost always share a band, so they are found.
+
+    Texts shorter than shingle_size words are matched by URL only, as they have no meaningful signature.
+
+    Attributes:
+    - threshold (float): Min estimated Jaccard similarity of shingles of near-duplicate texts.
+    - shingle_size (int): Number of consecutive words, hashed together as single text feature.
+    - bands (int): Number of signature bands.
+    - rows (int): Number of signature values in band.
+    - max_cached_words (int): Max number of cached word hashes.
+    - urls (set[str]): Normalized URLs of indexed articles.
+    - signatures (list[np.ndarray]): MinHash signatures of indexed texts.
+    - buckets (list[dict[bytes, list[int]]]): Indices of signatures of indexed texts by values of every band.
+    - duplicates (int): Number of articles found to be duplicates.
+    """
+
+    word_pattern = re.compile(r'\w+')
+    multiplier = np.uint64(0x9E3779B97F4A7C15)
+
+    def __init__(
+            self,
+            threshold: float = 0.7,
+            shingle_size: int = 3,
+            bands: int = 16,
+            rows: int = 4,
+            max_cached_words: int = 200000,
+            seed: int = 0):
+        """
+        Constructor for DeduplicationIndex.
+
+        :param threshold: min estimated Jaccard similarity of shingles of near-duplicate texts.
+        :param shingle_size: number of consecutive words, hashed together as single text feature.
+        :param bands: number of signature bands, more bands find less similar candidates.
+        :param rows: number of signature values in band, more rows find more similar candidates.
+        :param max_cached_words: max number of cached word hashes.
+        :param seed: seed of hash functions of signature.
+        """
+
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = rows
+        self.max_cached_words = max_cached_words
+        self.urls = set()
+        self.signatures = []
+        self.buckets = [{} for _ in range(bands)]
+        self.duplicates = 0
+        self.word_hashes = {}
+
+        # every signature value is the minimum of its own hash function a * x + b over shingle hashes
+        random = np.random.default_rng(seed)
+        self.a = random.integers(1, 2 ** 63, bands * rows, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = random.integers(0, 2 ** 63, bands * rows, dtype=np.uint64)
+
+    def add(self, url: str | None, text: str | None) -> bool:
+        """
+        Adds article to the index, if it is not a duplicate of already indexed one.
+
+        :param url: article URL, None if it is unknown.
+        :param text: article text, None if it is unknown.
+        :return: True if article was added, False if it is a duplicate.
+        """
+
+        normalized_url = normalize_url(url) if url else None
+        signature = self.signature(text) if text else None
+        if normalized_url in self.urls or (signature is not None and self.find(signature)):
+            self.duplicates += 1
+            return False
+
+        if normalized_url is not None:
+            self.urls.add(normalized_url)
+        if signature is not None:
+            for band, buckets in zip(signature.reshape(self.bands, self.rows), self.buckets):
+                buckets.setdefault(band.tobytes(), []).append(len(self.signatures))
+            self.signatures.append(signature)
+        return True
+
+    def find(self, signature: np.ndarray) -> bool:
+        """
+        Checks whether index has text, which signature is similar to given one.
+
+        :param signature: MinHash signature of text.
+        :return: True if near-duplicate text is indexed.
+        """
+
+        checked = set()
+        for band, buckets in zip(signature.reshape(self.bands, self.rows), self.buckets):
+            for candidate in buckets.get(band.tobytes(), ()):
+                if candidate not in checked:
+                    checked.add(candidate)
+                    if np.count_nonzero(self.signatures[candidate] == signature) >= self.threshold * len(signature):
+                        return True
+        return False
+
+    def signature(self, text: str) -> np.ndarray | None:
+        """
+        Computes MinHash signature of set of word shingles of text.
+
+        :param text: text to compute signature of.
+        :return: array of bands * rows signature values or None if text is shorter than shingle_size words.
+        """
+
+        words = self.word_pattern.findall(text.lower())
+        if len(words) < self.shingle_size:
+            return None
+
+        hashes = np.fromiter(map(self.hash_word, words), dtype=np.uint64, count=len(words))
+
+        # shingle hash combines hashes of its words, so it depends on their order
+        count = len(words) - self.shingle_size + 1
+        shingles = hashes[:count].copy()
+        for offset in range(1, self.shingle_size):
+            shingles = shingles * self.multiplier ^ hashes[offset:offset + count]
+
+        return (np.unique(shingles)[:, None] * self.a + self.b).min(axis=0)
+
+    def hash_word(self, word: str) -> int:
+        value = self.word_hashes.get(word)
+        if value is None:
+            value = int.from_bytes(blake2b(word.encode('utf-8'), digest_size=8).digest(), 'big')
+            if len(self.word_hashes) < self.max_cached_words:
+                self.word_hashes[word] = value
+        return value
+
+    def filter_batch(self, batch: DataBatch) -> DataBatch:
+        """
+        Removes duplicates of indexed articles from batch and indexes the rest.
+
+        :param batch: DataBatch object.
+        :return: DataBatch object with articles, which are not duplicates.
+        """
+
+        result = DataBatch()
+        for ordinal, text, url in zip(batch.dates, batch.texts, batch.urls):
+            if self.add(url, text):
+                result.dates.append(ordinal)
+                result.texts.append(text)
+                result.urls.append(url)
+        return result
+
+    def filter_articles(self, articles: Iterable[Article]) -> Iterator[Article]:
+        """
+        Yields articles, which are not duplicates of indexed ones, and indexes them.
+
+        :param articles: iterable of Article objects.
+        :return: iterator over Article objects.
+        """
+
+        return (article for article in articles if self.add(article.url, article.text))
+
+    def filter_feed(self, entries: Iterable[FeedEntry]) -> Iterator[FeedEntry]:
+        """
+        Yields feed entries, which are not duplicates of indexed ones, and indexes them.
+
+        :param entries: iterable of FeedEntry objects.
+        :return: iterator over FeedEntry objects.
+        """
+
+        return (entry for entry in entries if self.add(entry.url, entry.description))
@@ -1,4 +1,6 @@
-from datetime import date
+from array import array
+from datetime import date, datetime
+from typing import Iterable, Iterator
 
 
 class DataEntry:
@@ -10,6 +12,8 @@ class DataEntry:
     - text (datetime.date): Main text of news post.
     """
 
+    __slots__ = ('date', 'text')
+
     def __init__(self, post_date: date, text: str):
         """
         Constructor for DataEntry.
@@ -33,6 +37,8 @@ class AnalysisEntry:
     - negative_count (int): Number of posts with negative sentiment.
     """
 
+    __slots__ = ('total_count', 'positive_count', 'neutral_count', 'negative_count')
+
     def __init__(self):
         """
         Constructor for DataEntry. Sets all attributes to 0.
@@ -55,6 +61,8 @@ class FeedEntry:
     - pubdate (datetime.date): Article date of publishing.
     """
 
+    __slots__ = ('title', 'url', 'description', 'pubdate')
+
     def __init__(self, title: str, link: str, description: str, pubdate: date):
         """
         Constructor for DataEntry. Sets all attributes to 0.
@@ -64,3 +72,146 @@ class FeedEntry:
         self.url = link
         self.description = description
         self.pubdate = pubdate
+
+
+class Article:
+    """
+    A class for holding normalized article data, which both DataEntry and FeedEntry are built from.
+
+    Attributes:
+    - date (datetime.date): Article date of publishing.
+    - title (str): Article title.
+    - url (str): Article link.
+    - description (str): Article description.
+    - text (str): Main text of article.
+    - published_at (datetime.datetime): Article time of publishing, None if provider doesn't tell it.
+    """
+
+    __slots__ = ('date', 'title', 'url', 'description', 'text', 'published_at')
+
+    def __init__(self, post_date: date, title: str, url: str, description: str, text: str,
+                 published_at: datetime = None):
+        """
+        Constructor for Article.
+
+        :param post_date: Article date of publishing.
+        :param title: Article title.
+        :param url: Article link.
+        :param description: Article description.
+        :param text: Main text of article.
+        :param published_at: Article time of publishing, None if provider doesn't tell it.
+        """
+
+        self.date = post_date
+        self.title = title
+        self.url = url
+        self.description = description
+        self.text = text
+        self.published_at = published_at
+
+    def to_data_entry(self) -> DataEntry:
+        """
+        Builds DataEntry for NLP analysis of article.
+
+        :return: DataEntry object.
+        """
+
+        return DataEntry(self.date, self.text)
+
+    def to_feed_entry(self) -> FeedEntry:
+        """
+        Builds FeedEntry for RSS Feed of article.
+
+        :return: FeedEntry object.
+        """
+
+        return FeedEntry(self.title, self.url, self.description, self.date)
+
+
+class DataBatch:
+    """
+    A class for holding data of several news posts in columns, which takes less memory
+    than separate DataEntry objects and is processed by analysis without building them.
+
+    Attributes:
+    - dates (array.array): Proleptic Gregorian ordinals of publishing dates of news posts.
+    - texts (list[str]): Main texts of news posts.
+    - urls (list[str]): Links of news posts, None for unknown ones.
+    """
+
+    __slots__ = ('dates', 'texts', 'urls')
+
+    def __init__(self, dates: Iterable[date] = (), texts: Iterable[str] = (), urls: Iterable[str] = ()):
+        """
+        Constructor for DataBatch.
+
+        :param dates: Publishing dates of news posts.
+        :param texts: Main texts of news posts, in the same order as dates.
+        :param urls: Links of news posts, in the same order as dates, empty if they are unknown.
+        """
+
+        self.dates = array('i', [d.toordinal() for d in dates])
+        self.texts = list(texts)
+        self.urls = list(urls) or [None] * len(self.texts)
+
+    @staticmethod
+    def from_entries(entries: Iterable[DataEntry]) -> 'DataBatch':
+        """
+        Creates batch out of data entries.
+
+        :param entries: iterable of DataEntry objects.
+        :return: DataBatch object.
+        """
+
+        batch = DataBatch()
+        for entry in entries:
+            batch.append(entry.date, entry.text)
+        return batch
+
+    def append(self, post_date: date, text: str, url: str = None) -> None:
+        """
+        Adds news post to the end of batch.
+
+        :param post_date: Publishing date of news post.
+        :param text: Main text of news post.
+        :param url: Link of news post, None if it is unknown.
+        """
+
+        self.dates.append(post_date.toordinal())
+        self.texts.append(text)
+        self.urls.append(url)
+
+    def iter_dates(self) -> Iterator[date]:
+        """
+        Iterates over publishing dates of news posts.
+
+        :return: iterator over dates.
+        """
+
+        return map(date.fromordinal, self.dates)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[DataEntry]:
+        return map(DataEntry, self.iter_dates(), self.texts)
+
+
+def to_batches(entries: Iterable[DataEntry | Article], batch_size: int) -> Iterator[DataBatch]:
+    """
+    Groups data entries or articles into batches. Links are kept for articles only.
+
+    :param entries: iterable of DataEntry or Article objects.
+    :param batch_size: max number of entries in batch.
+    :return: iterator over DataBatch objects.
+    """
+
+    batch = DataBatch()
+    for entry in entries:
+        batch.append(entry.date, entry.text, getattr(entry, 'url', None))
+        if len(batch) == batch_size:
+            yield batch
+            batch = DataBatch()
+
+    if len(batch):
+        yield batch
@@ -0,0 +1,201 @@
+from collections import OrderedDict
+from datetime import date
+from email.utils import formatdate, parsedate_to_datetime
+from hashlib import sha256
+from threading import Lock
+from time import time
+from typing import Callable, Iterable
+
+from Backend.data_providers import DataProvider, iter_provider_feed
+from Backend.deduplication import DeduplicationIndex
+from Backend.entries import FeedEntry
+from Backend.feeds import build_feed
+from Backend.fetching import ProviderStream
+
+
+class FeedSnapshot:
+    """
+    A class for serialized RSS Feed with its validators for conditional HTTP requests.
+
+    Attributes:
+    - body (bytes): Serialized RSS Feed in UTF-8.
+    - etag (str): Quoted strong entity tag, it changes only if the set of feed articles changes.
+    - last_modified (float): Time in seconds, when the set of feed articles changed last.
+    - loaded_at (float): Time in seconds, when articles of the snapshot were loaded last.
+    """
+
+    __slots__ = ('body', 'etag', 'last_modified', 'loaded_at')
+
+    def __init__(self, body: bytes, etag: str, last_modified: float, loaded_at: float):
+        """
+        Constructor for FeedSnapshot.
+        """
+
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.loaded_at = loaded_at
+
+    @property
+    def last_modified_header(self) -> str:
+        """
+        Last-Modified value in HTTP date format.
+        """
+
+        return formatdate(self.last_modified, usegmt=True)
+
+    def is_not_modified(self, if_none_match: str = None, if_modified_since: str = None) -> bool:
+        """
+        Checks conditional request headers against the snapshot, like HTTP does: If-None-Match takes precedence,
+        If-Modified-Since is used only without it.
+
+        :param if_none_match: value of If-None-Match header, None if it is absent.
+        :param if_modified_since: value of If-Modified-Since header, None if it is absent.
+        :return: True if client already has this snapshot and 304 Not Modified can be answered.
+        """
+
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+            return '*' in tags or self.etag in tags
+
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            # HTTP dates have precision of seconds
+            return int(self.last_modified) <= since
+
+        return False
+
+
+class FeedSnapshotStore:
+    """
+    Keeps serialized RSS Feeds per query and rebuilds them only when the deduplicated set of feed articles changes,
+    so feeds polled by RSS readers are serialized once per change instead of once per request.
+
+    Articles are deduplicated by URL and text and sorted newest first, so feed content doesn't depend on order,
+    in which providers respond.
+
+    Attributes:
+    - data_providers (list[DataProvider]): Providers, from which feed articles are loaded.
+    - provider_timeout (float): Max number of seconds to wait for every data provider, None to wait without limit.
+    - allow_partial_results (bool): If True, feeds are built from data of providers, that responded successfully.
+    - max_age (float): Number of seconds, during which snapshot is returned without reloading its articles.
+    - max_entries (int): Max number of kept snapshots. Least recently used ones are evicted first.
+    - builds (int): Number of times feed was serialized.
+    """
+
+    def __init__(
+            self,
+            data_providers: list[DataProvider],
+            provider_timeout: float = None,
+            allow_partial_results: bool = False,
+            max_age: float = 0,
+            max_entries: int = 1000,
+            clock: Callable[[], float] = time):
+        """
+        Constructor for FeedSnapshotStore.
+
+        :param data_providers: providers, from which feed articles are loaded.
+        :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+        :param allow_partial_results: if True, feeds are built from data of providers, that responded successfully,
+         otherwise error of the first failed provider is raised.
+        :param max_age: number of seconds, during which snapshot is returned without reloading its articles,
+         0 to reload articles on every request.
+        :param max_entries: max number of kept snapshots.
+        :param clock: function returning current time in seconds.
+        """
+
+        self.data_providers = data_providers
+        self.provider_timeout = provider_timeout
+        self.allow_partial_results = allow_partial_results
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.clock = clock
+        self.builds = 0
+
+        self.lock = Lock()
+        self.snapshots = OrderedDict()  # snapshots by query key in order of use
+
+    def get_snapshot(
+            self,
+            keyword: str,
+            min_post_date: date,
+            max_items_per_provider: int,
+            your_link: str) -> FeedSnapshot:
+        """
+        Returns snapshot of RSS Feed of articles, reusing serialized feed if articles didn't change.
+
+        :param keyword: keyword/phrase to do search on.
+        :param min_post_date: minimum published date for articles.
+        :param max_items_per_provider: max number of articles to retrieve from every data providers.
+        :param your_link: link to you RSS feed page.
+        :return: FeedSnapshot object.
+        """
+
+        key = (keyword, min_post_date, max_items_per_provider, your_link)
+        now = self.clock()
+        with self.lock:
+            snapshot = self.snapshots.get(key)
+            if snapshot is not None:
+                self.snapshots.move_to_end(key)
+                if now - snapshot.loaded_at < self.max_age:
+                    return snapshot
+
+        entries = ProviderStream(
+            lambda provider: iter_provider_feed(provider, keyword, min_post_date, max_items_per_provider),
+            self.data_providers,
+            self.provider_timeout,
+            self.allow_partial_results)
+        entries = deduplicate_feed_entries(entries)
+        etag = f'"{get_fingerprint(entries)}"'
+
+        if snapshot is not None and snapshot.etag == etag:
+            snapshot = FeedSnapshot(snapshot.body, etag, snapshot.last_modified, now)
+        else:
+            body = build_feed(keyword, min_post_date, entries, your_link).encode('utf-8')
+            snapshot = FeedSnapshot(body, etag, now, now)
+            with self.lock:
+                self.builds += 1
+
+        with self.lock:
+            self.snapshots[key] = snapshot
+            self.snapshots.move_to_end(key)
+            while len(self.snapshots) > self.max_entries:
+                self.snapshots.popitem(last=False)
+
+        return snapshot
+
+
+def deduplicate_feed_entries(entries: Iterable[FeedEntry]) -> list[FeedEntry]:
+    """
+    Removes duplicate feed entries, which have the same URL or nearly the same description, and sorts the rest
+    newest first. Of duplicate entries the first one in sorted order is kept, so the result doesn't depend on
+    input order.
+
+    :param entries: iterable of FeedEntry objects.
+    :return: list of unique FeedEntry objects.
+    """
+
+    def sort_key(entry: FeedEntry) -> tuple:
+        # providers may miss any of text fields
+        return entry.pubdate, entry.url or '', entry.title or '', entry.description or ''
+
+    return list(DeduplicationIndex().filter_feed(sorted(entries, key=sort_key, reverse=True)))
+
+
+def get_fingerprint(entries: Iterable[FeedEntry]) -> str:
+    """
+    Computes fingerprint of feed entries, which changes if any entry is added, removed or edited.
+
+    :param entries: iterable of FeedEntry objects.
+    :return: hexadecimal fingerprint string.
+    """
+
+    digest = sha256()
+    for entry in entries:
+        for value in (entry.url, entry.title, entry.description, entry.pubdate.isoformat()):
+            digest.update((value or '').encode('utf-8'))
+            digest.update(b'\0')
+    return digest.hexdigest()[:32]
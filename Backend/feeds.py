@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Iterable
+
+from Backend.entries import FeedEntry
+from Backend.lazy_imports import LazyImport
+from Backend.metrics import default_metrics
+
+Rss201rev2Feed = LazyImport('feedgenerator', 'Rss201rev2Feed')  # imported on first feed, analysis doesn't need it
+
+
+def build_feed(keyword: str, min_post_date: date, entries: Iterable[FeedEntry], your_link: str) -> str:
+    """
+    Builds RSS Feed out of feed entries.
+
+    :param keyword: keyword/phrase, the feed is built for.
+    :param min_post_date: minimum published date for articles.
+    :param entries: iterable of FeedEntry objects to add to the feed.
+    :param your_link: link to you RSS feed page.
+    :return: RSS Feed string
+    """
+
+    feed = Rss201rev2Feed(
+        title=f'{keyword} articles',
+        link=your_link,
+        description=f'Feed for articles, mentioning {keyword} since {min_post_date}.',
+        language='en'
+    )
+
+    for entry in entries:
+        feed.add_item(
+            title=entry.title,
+            link=entry.url,
+            description=entry.description,
+            pubdate=entry.pubdate,
+        )
+
+    with default_metrics.span('render_feed'):
+        return feed.writeString('utf-8')
@@ -0,0 +1,260 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Semaphore, Thread
+from time import monotonic
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+from Backend.data_providers import DataProvider
+
+T = TypeVar('T')
+
+cancel_check_interval = 0.1  # max number of seconds, consumer of ProviderStream waits before checking cancel event
+
+
+class FetchResult:
+    """
+    A class for holding combined results of loading data from several data providers.
+
+    Attributes:
+    - items (list): Items loaded from all providers, that responded in time, in providers order.
+    - failed_providers (list[DataProvider]): Providers, that raised an exception or timed out.
+    - errors (list[Exception]): Errors of failed providers, in the same order as failed_providers.
+    """
+
+    def __init__(self):
+        """
+        Constructor for FetchResult. Sets all attributes to empty lists.
+        """
+
+        self.items = []
+        self.failed_providers = []
+        self.errors = []
+
+
+def fetch_from_providers(
+        load: Callable[[DataProvider], list[T]],
+        data_providers: list[DataProvider],
+        timeout: float = None,
+        allow_partial_results: bool = False) -> FetchResult:
+    """
+    Calls load function for every data provider at the same time and concatenates results,
+    so total latency is the latency of the slowest provider instead of the sum of all of them.
+
+    :param load: function, that loads list of items from a single data provider.
+    :param data_providers: list of DataProvider objects, from which data must be loaded.
+    :param timeout: max number of seconds to wait for every provider, None to wait without limit.
+    :param allow_partial_results: if True, failed or timed out providers are skipped and reported in result,
+     otherwise their error is raised.
+    :return: FetchResult object with concatenated items and failed providers.
+    """
+
+    result = FetchResult()
+
+    # run every provider in its own thread, so all requests are sent at once
+    executor = ThreadPoolExecutor(max_workers=max(1, len(data_providers)))
+    try:
+        futures = [executor.submit(load, provider) for provider in data_providers]
+        wait(futures, timeout=timeout)
+
+        # collect results in providers order, so output doesn't depend on response timings
+        for provider, future in zip(data_providers, futures):
+            if not future.done():
+                error = TimeoutError(f'{type(provider).__name__} did not respond in {timeout} seconds')
+            elif future.exception() is not None:
+                error = future.exception()
+            else:
+                result.items += future.result()
+                continue
+
+            if not allow_partial_results:
+                raise error
+            result.failed_providers.append(provider)
+            result.errors.append(error)
+    finally:
+        # don't wait for timed out providers, their results will be discarded anyway
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return result
+
+
+class WaitClock:
+    """
+    Counts seconds, which consumer spent waiting for items, so time of processing items isn't counted
+    against providers.
+
+    Attributes:
+    - waited (float): Number of seconds consumer waited for items, not counting current wait.
+    - since (float): Time in seconds, when current wait started, None if consumer doesn't wait.
+    """
+
+    def __init__(self):
+        """
+        Constructor for WaitClock.
+        """
+
+        self.waited = 0.0
+        self.since = None
+        self.lock = Lock()
+
+    def start(self) -> None:
+        with self.lock:
+            self.since = monotonic()
+
+    def stop(self) -> None:
+        with self.lock:
+            self.waited += monotonic() - self.since
+            self.since = None
+
+    def now(self) -> float:
+        with self.lock:
+            return self.waited + (monotonic() - self.since if self.since is not None else 0.0)
+
+
+class ProviderStream(Generic[T]):
+    """
+    Iterates over items, loaded from several data providers at the same time, in order of their arrival.
+    Items of the same provider keep their order, items of different providers are interleaved.
+    Providers can't get ahead of consumer by more than max_queued items, so memory usage is bounded.
+    If max_concurrent is set, at most that many providers are queried at once and the rest wait for a free slot.
+    If cancel event is set, iteration stops shortly, even if consumer is waiting for items of slow providers.
+
+    Attributes:
+    - failed_providers (list[DataProvider]): Providers, that raised an exception or timed out, filled during iteration.
+    - errors (list[Exception]): Errors of failed providers, in the same order as failed_providers.
+    """
+
+    def __init__(
+            self,
+            iterate: Callable[[DataProvider], Iterable[T]],
+            data_providers: list[DataProvider],
+            timeout: float = None,
+            allow_partial_results: bool = False,
+            max_queued: int = 1000,
+            max_concurrent: int = None,
+            cancel: Event = None):
+        """
+        Constructor for ProviderStream. Providers are not queried until iteration starts.
+
+        :param iterate: function, that streams items from a single data provider.
+        :param data_providers: list of DataProvider objects, from which data must be loaded.
+        :param timeout: max number of seconds to wait for every provider, None to wait without limit.
+         Only time, when consumer waits for items after provider started, counts, time of processing items
+         and of waiting for free slot doesn't.
+        :param allow_partial_results: if True, failed or timed out providers are skipped and reported
+         in failed_providers, otherwise their error is raised.
+        :param max_queued: max number of loaded items, waiting to be processed by consumer.
+        :param max_concurrent: max number of providers queried at once, None to query all of them at once.
+        :param cancel: event, which stops iteration without error when set, None if iteration isn't cancelled.
+        """
+
+        self.iterate = iterate
+        self.data_providers = data_providers
+        self.timeout = timeout
+        self.allow_partial_results = allow_partial_results
+        self.max_queued = max_queued
+        self.max_concurrent = max_concurrent
+        self.cancel = cancel
+        self.failed_providers = []
+        self.errors = []
+
+    def __iter__(self) -> Iterator[T]:
+        queue = Queue(self.max_queued)  # queue of (provider index, item, error) tuples, item is None on completion
+        stop = Event()  # set when consumer stops iteration, so providers don't wait for free space in queue
+        slots = Semaphore(self.max_concurrent or len(self.data_providers) or 1)
+        clock = WaitClock()
+        started = {}  # consumer wait time, when provider got its slot, by provider index
+        released = set()  # indices of providers, which slots are released
+        lock = Lock()
+
+        def release(index: int) -> None:
+            # slot of timed out provider is released by consumer, so its thread mustn't release it again
+            with lock:
+                if index not in released:
+                    released.add(index)
+                    slots.release()
+
+        def put(message: tuple) -> bool:
+            while not stop.is_set():
+                try:
+                    queue.put(message, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def load(index: int, provider: DataProvider) -> None:
+            while not slots.acquire(timeout=0.1):
+                if stop.is_set():
+                    return
+            started[index] = clock.now()
+
+            try:
+                for item in self.iterate(provider):
+                    if not put((index, item, None)):
+                        return
+                put((index, None, None))
+            except Exception as error:
+                put((index, None, error))
+            finally:
+                release(index)
+
+        # run every provider in its own thread, so all requests are sent at once, if slots allow
+        for index, provider in enumerate(self.data_providers):
+            Thread(target=load, args=(index, provider), daemon=True).start()
+
+        pending = set(range(len(self.data_providers)))  # indices of providers, that haven't finished yet
+        try:
+            while pending:
+                clock.start()
+                try:
+                    message = queue.get(timeout=self.get_wait_timeout(pending, started, clock.now()))
+                except Empty:
+                    message = None
+                finally:
+                    clock.stop()
+
+                if self.cancel is not None and self.cancel.is_set():
+                    return
+                if message is None:
+                    if self.timeout is None:
+                        continue
+                    # providers, which didn't finish in time since they started, fail and free their slots
+                    for index in sorted(pending):
+                        if index in started and clock.now() - started[index] >= self.timeout:
+                            pending.discard(index)
+                            release(index)
+                            provider = self.data_providers[index]
+                            self.fail(provider, TimeoutError(
+                                f'{type(provider).__name__} did not respond in {self.timeout} seconds'))
+                    continue
+
+                index, item, error = message
+                if index not in pending:
+                    continue
+                if item is not None:
+                    yield item
+                    continue
+
+                pending.discard(index)
+                if error is not None:
+                    self.fail(self.data_providers[index], error)
+        finally:
+            stop.set()
+
+    def get_wait_timeout(self, pending: set[int], started: dict[int, float], now: float) -> float | None:
+        # cancel event can't wake consumer, which waits for queue, so consumer wakes up periodically to check it
+        max_timeout = None if self.cancel is None else cancel_check_interval
+        if self.timeout is None:
+            return max_timeout
+
+        # consumer waits until the first started provider runs out of time
+        remaining = [self.timeout - (now - started[index]) for index in pending if index in started]
+        # providers, waiting for free slot, are checked periodically, as they start when running ones finish
+        timeout = max(0.0, min(remaining)) if remaining else 0.1
+        return timeout if max_timeout is None else min(timeout, max_timeout)
+
+    def fail(self, provider: DataProvider, error: Exception) -> None:
+        if not self.allow_partial_results:
+            raise error
+        self.failed_providers.append(provider)
+        self.errors.append(error)
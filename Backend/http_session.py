@@ -0,0 +1,40 @@
+from threading import Lock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+pool_connections = 8  # number of hosts, which connection pools are kept for
+pool_maxsize = 32  # max number of kept-alive connections per host, enough for concurrent pages of all providers
+
+session_lock = Lock()
+shared_session = None
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Returns HTTP session, shared by all providers of the process. Session keeps pool of kept-alive connections
+    to every API host, so TCP connection setup and TLS handshake are done once per connection,
+    not once per request or provider.
+
+    :return: requests.Session object.
+    """
+
+    global shared_session
+    with session_lock:
+        if shared_session is None:
+            shared_session = create_session()
+        return shared_session
+
+
+def create_session() -> requests.Session:
+    """
+    Creates HTTP session with connection pools, sized for concurrent requests of providers.
+
+    :return: requests.Session object.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -0,0 +1,300 @@
+import json
+import os
+from collections import Counter
+from datetime import date
+from hashlib import sha1
+
+from Backend.analysis import AnalysisAccumulator, TextAnalyzer, default_analyzer, score_texts
+from Backend.data_providers import DataProvider
+from Backend.deduplication import DeduplicationIndex
+from Backend.entries import AnalysisEntry, Article, DataBatch
+from Backend.fetching import fetch_from_providers
+from Backend.score_cache import ScoreCache
+
+
+class AnalysisState:
+    """
+    A class for holding persistent analysis state of single keyword.
+
+    Attributes:
+    - min_date (datetime.date): Minimum published date of articles, the state covers.
+    - last_date (datetime.date): High-water mark, latest published date of analyzed articles, None if there are none.
+    - seen (set[str]): Keys of analyzed articles published on last_date, which providers return again on refresh.
+    - accumulator (AnalysisAccumulator): Accumulated analysis results of all analyzed articles.
+    """
+
+    def __init__(self, min_date: date):
+        """
+        Constructor for AnalysisState. Creates empty state, covering articles since min_date.
+
+        :param min_date: minimum published date of articles, the state covers.
+        """
+
+        self.min_date = min_date
+        self.last_date = None
+        self.seen = set()
+        self.accumulator = AnalysisAccumulator()
+
+    def to_dict(self) -> dict:
+        """
+        Converts state to JSON-serializable dictionary.
+
+        :return: dictionary with state data.
+        """
+
+        return {
+            'min_date': self.min_date.isoformat(),
+            'last_date': self.last_date.isoformat() if self.last_date else None,
+            'seen': sorted(self.seen),
+            'daily': {
+                d.isoformat(): [e.total_count, e.positive_count, e.neutral_count, e.negative_count]
+                for d, e in self.accumulator.daily.items()
+            },
+            'nouns': {d.isoformat(): dict(nouns) for d, nouns in self.accumulator.daily_nouns.items()}
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'AnalysisState':
+        """
+        Creates state from dictionary, created by to_dict.
+
+        :param data: dictionary with state data.
+        :return: AnalysisState object.
+        """
+
+        state = AnalysisState(date.fromisoformat(data['min_date']))
+        state.last_date = date.fromisoformat(data['last_date']) if data['last_date'] else None
+        state.seen = set(data['seen'])
+
+        for d, counts in data['daily'].items():
+            entry = AnalysisEntry()
+            entry.total_count, entry.positive_count, entry.neutral_count, entry.negative_count = counts
+            state.accumulator.daily[date.fromisoformat(d)] = entry
+        for d, nouns in data['nouns'].items():
+            state.accumulator.daily_nouns[date.fromisoformat(d)] = Counter(nouns)
+
+        return state
+
+
+class IncrementalAnalyzer:
+    """
+    Does NLP analysis of keywords, keeping persistent state for every keyword,
+    so repeated analysis only fetches and scores articles published since the last run.
+
+    Result is identical to full recompute with get_analysis as long as providers return all articles
+    of refreshed date range, i.e. max_items_per_provider is not reached.
+
+    Attributes:
+    - directory (str): Directory, where states of keywords are stored.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Constructor for IncrementalAnalyzer. Creates states directory if needed.
+
+        :param directory: directory, where states of keywords are stored.
+        """
+
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_analysis(
+            self,
+            keyword: str,
+            min_post_date: date,
+            data_providers: list[DataProvider],
+            max_items_per_provider: int,
+            provider_timeout: float = None,
+            allow_partial_results: bool = False,
+            score_cache: ScoreCache = None,
+            analyzer: TextAnalyzer = default_analyzer,
+            top_nouns: int = 20,
+            deduplicate: bool = False) -> dict:
+        """
+        Loads articles published since the last run of keyword from data providers, does NLP analysis on them,
+        merges results into keyword state and returns summary results of analysis.
+        If deduplicate is True, duplicate articles, which different providers return in the same refresh,
+        are analyzed once.
+
+        :param keyword: keyword/phrase to do search on.
+        :param min_post_date: minimum published date for articles.
+        :param data_providers: list of DataProvider object, from which data must be loaded.
+        :param max_items_per_provider: max number of articles to retrieve from every data providers.
+        :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+        :param allow_partial_results: if True, analysis is done on data of providers, that responded successfully,
+         otherwise error of the first failed provider is raised.
+        :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+        :param analyzer: NLP analyzer of texts.
+        :param top_nouns: number of the most common noun phrases in result.
+        :param deduplicate: if True, duplicate articles are dropped before analysis.
+        :return: dictionary in the format of get_analysis result.
+        """
+
+        # state can't be reused, if it doesn't cover requested date range
+        state = self.load_state(keyword)
+        if state is None or min_post_date < state.min_date:
+            state = AnalysisState(min_post_date)
+
+        refresh = fetch_new_articles(keyword, state.min_date, state.last_date, state.seen, data_providers,
+                                     max_items_per_provider, provider_timeout, allow_partial_results, deduplicate)
+        state.last_date, state.seen = refresh.last_date, refresh.seen
+
+        # new articles are analyzed at once
+        articles = refresh.articles
+        batch = DataBatch([article.date for article in articles], [article.text for article in articles])
+        polarities, noun_phrases = score_texts(batch.texts, score_cache, analyzer)
+        state.accumulator.add_batch(batch.dates, polarities, noun_phrases)
+
+        # partial results are not saved, see Refresh.complete
+        if refresh.complete:
+            self.save_state(keyword, state)
+
+        return state.accumulator.summary(min_post_date, top_nouns) | refresh.get_result_info()
+
+    def load_state(self, keyword: str) -> AnalysisState | None:
+        """
+        Loads stored state of keyword.
+
+        :param keyword: keyword/phrase to load state of.
+        :return: AnalysisState object or None if keyword wasn't analyzed yet.
+        """
+
+        path = self.get_state_path(keyword)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, encoding='utf-8') as file:
+            return AnalysisState.from_dict(json.load(file))
+
+    def save_state(self, keyword: str, state: AnalysisState) -> None:
+        """
+        Stores state of keyword, replacing previous one.
+
+        :param keyword: keyword/phrase to store state of.
+        :param state: AnalysisState object to store.
+        """
+
+        # write to temporary file first, so state isn't corrupted if process stops in the middle of writing
+        path = self.get_state_path(keyword)
+        with open(path + '.tmp', 'w', encoding='utf-8') as file:
+            json.dump(state.to_dict(), file)
+        os.replace(path + '.tmp', path)
+
+    def get_state_path(self, keyword: str) -> str:
+        return os.path.join(self.directory, sha1(keyword.encode('utf-8')).hexdigest() + '.json')
+
+
+class Refresh:
+    """
+    A class for holding articles of keyword, published since high-water mark of the previous refresh,
+    and the new high-water mark.
+
+    Attributes:
+    - articles (list[Article]): New articles, without duplicates, if they were dropped.
+    - last_date (datetime.date): New high-water mark, None if no articles were analyzed yet.
+    - seen (set[str]): Keys of articles published on last_date.
+    - duplicates (int): Number of dropped duplicate articles.
+    - failed_providers (list[DataProvider]): Providers, that raised an exception or timed out.
+    """
+
+    def __init__(self, last_date: date | None, seen: set[str]):
+        """
+        Constructor for Refresh. Starts with no articles and the high-water mark of the previous refresh.
+
+        :param last_date: high-water mark of the previous refresh, None if there was none.
+        :param seen: keys of articles published on last_date.
+        """
+
+        self.articles = []
+        self.last_date = last_date
+        self.seen = set(seen)
+        self.duplicates = 0
+        self.failed_providers = []
+
+    @property
+    def complete(self) -> bool:
+        """
+        Tells whether all providers responded, so the new high-water mark can be saved.
+        Articles of failed providers would be missed on next refresh, so partial results must not be saved.
+        """
+
+        return not self.failed_providers
+
+    def get_result_info(self) -> dict:
+        """
+        Returns 'duplicates' and 'failed_providers' keys of get_analysis result.
+        """
+
+        return {
+            'duplicates': self.duplicates,
+            'failed_providers': [type(provider).__name__ for provider in self.failed_providers]
+        }
+
+
+def fetch_new_articles(
+        keyword: str,
+        min_date: date,
+        last_date: date | None,
+        seen: set[str],
+        data_providers: list[DataProvider],
+        max_items_per_provider: int,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        deduplicate: bool = False) -> Refresh:
+    """
+    Loads articles of keyword, published since high-water mark of the previous refresh, from data providers.
+    Articles published on the high-water date are returned by providers again, so they are filtered by seen keys.
+
+    :param keyword: keyword/phrase to do search on.
+    :param min_date: minimum published date of articles, used if there was no previous refresh.
+    :param last_date: high-water mark of the previous refresh, None if there was none.
+    :param seen: keys of articles published on last_date, built by get_article_key.
+    :param data_providers: list of DataProvider object, from which data must be loaded.
+    :param max_items_per_provider: max number of articles to retrieve from every data providers.
+    :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+    :param allow_partial_results: if True, articles of providers, that responded successfully, are returned,
+     otherwise error of the first failed provider is raised.
+    :param deduplicate: if True, duplicate articles, which different providers return, are dropped.
+    :return: Refresh object.
+    """
+
+    fetch_date = last_date or min_date
+    fetch_result = fetch_from_providers(
+        lambda provider: [(get_article_key(provider, article), article)
+                          for article in provider.load_articles(keyword, fetch_date, max_items_per_provider)],
+        data_providers,
+        provider_timeout,
+        allow_partial_results)
+
+    # previous high-water mark is kept, because articles are not sorted by date
+    refresh = Refresh(last_date, seen)
+    refresh.failed_providers = fetch_result.failed_providers
+    index = DeduplicationIndex() if deduplicate else None
+    for key, article in fetch_result.items:
+        if article.date < fetch_date or (article.date == last_date and key in seen):
+            continue
+
+        if refresh.last_date is None or article.date > refresh.last_date:
+            refresh.last_date = article.date
+            refresh.seen = set()
+        if article.date == refresh.last_date:
+            refresh.seen.add(key)
+
+        # duplicates are looked for among articles of this refresh only
+        if not deduplicate or index.add(article.url, article.text):
+            refresh.articles.append(article)
+
+    refresh.duplicates = index.duplicates if deduplicate else 0
+    return refresh
+
+
+def get_article_key(provider: DataProvider, article: Article) -> str:
+    """
+    Builds key, identifying article of certain provider across refreshes.
+
+    :param provider: data provider, article was loaded from.
+    :param article: Article object.
+    :return: article key.
+    """
+
+    return f'{type(provider).__name__}:{article.url or sha1(article.text.encode("utf-8")).hexdigest()}'
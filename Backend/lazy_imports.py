@@ -0,0 +1,55 @@
+from importlib import import_module
+from threading import Lock
+from typing import Any
+
+
+class LazyImport:
+    """
+    Stand-in for a module or an attribute of a module, which is imported on first use, so modules, which need
+    heavy dependencies only in some code paths, are imported fast. Calls and attribute lookups are passed to
+    the imported object. It can't be used where real class is needed, like isinstance checks or except clauses,
+    modules are imported inside functions there.
+
+    Attributes:
+    - module_name (str): Name of module to import.
+    - attribute (str): Name of module attribute, None to stand for the module itself.
+    """
+
+    __slots__ = ('module_name', 'attribute', 'value', 'lock')
+
+    def __init__(self, module_name: str, attribute: str = None):
+        """
+        Constructor for LazyImport. Module isn't imported until it is used.
+
+        :param module_name: name of module to import.
+        :param attribute: name of module attribute, None to stand for the module itself.
+        """
+
+        self.module_name = module_name
+        self.attribute = attribute
+        self.value = None
+        self.lock = Lock()
+
+    def load(self) -> Any:
+        """
+        Imports module, if it isn't imported yet.
+
+        :return: module or its attribute.
+        """
+
+        if self.value is None:
+            with self.lock:
+                if self.value is None:
+                    module = import_module(self.module_name)
+                    self.value = module if self.attribute is None else getattr(module, self.attribute)
+        return self.value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        name = self.module_name if self.attribute is None else f'{self.module_name}.{self.attribute}'
+        return f'LazyImport({name}, loaded={self.value is not None})'
@@ -1,26 +1,72 @@
-from collections import Counter
+import asyncio
+import os
 from datetime import date, timedelta
-from feedgenerator import Rss201rev2Feed
+from queue import Queue
+from threading import Event, Thread
+from time import monotonic
+from typing import Callable, Iterable, Iterator
 
-from textblob import TextBlob
+import numpy as np
 
+from Backend.analysis import AnalysisAccumulator, TextAnalyzer, default_analyzer, score_texts
+from Backend.analysis_snapshots import AnalysisSnapshot, ScoredArticlesRecorder
 from Backend.api_keys import news_api_key, event_registry_api_key
-from Backend.data_providers import DataProvider, NewsApiDataProvider, EventRegistryDataProvider
-from Backend.entries import AnalysisEntry
+from Backend.article_store import ArticleStore, with_article_store
+from Backend.async_providers import AsyncDataProvider, gather_from_providers
+from Backend.data_providers import DataProvider, NewsApiDataProvider, EventRegistryDataProvider, \
+    iter_provider_articles, iter_provider_batches, iter_provider_feed
+from Backend.deduplication import DeduplicationIndex
+from Backend.entries import DataBatch, DataEntry, to_batches
+from Backend.feeds import build_feed
+from Backend.fetching import ProviderStream
+from Backend.metrics import default_metrics
+from Backend.parallel_scoring import ParallelScorer
+from Backend.score_cache import ScoreCache
 
 
 def get_analysis(
         keyword: str,
         min_post_date: date,
         data_providers: list[DataProvider],
-        max_items_per_provider: int) -> dict:
+        max_items_per_provider: int,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        score_cache: ScoreCache = None,
+        scorer: ParallelScorer = None,
+        analyzer: TextAnalyzer = default_analyzer,
+        top_nouns: int = 20,
+        nouns_capacity: int = None,
+        deduplicate: bool = False,
+        accumulator: AnalysisAccumulator = None,
+        progress: Callable[[dict], None] = None,
+        update_interval: float = 0.5,
+        cancel: Event = None) -> dict:
     """
     Loads data from data providers, does NLP analysis on it and returns summary results of analysis.
+    Data providers are queried concurrently and their articles are analyzed as soon as they are received.
+    If deduplicate is True, articles with the same URL or nearly the same text, which different providers return,
+    are analyzed once.
 
     :param keyword: keyword/phrase to do search on.
     :param min_post_date: minimum published date for articles.
     :param data_providers: list of DataProvider object, from which data must be loaded.
     :param max_items_per_provider: max number of articles to retrieve from every data providers.
+    :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+    :param allow_partial_results: if True, analysis is done on data of providers, that responded successfully,
+     otherwise error of the first failed provider is raised.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param scorer: pool of worker processes for NLP analysis, None to do analysis in current process.
+    :param analyzer: NLP analyzer of texts, if analysis is done in current process, scorer uses its own analyzer.
+    :param top_nouns: number of the most common noun phrases in result.
+    :param nouns_capacity: max number of noun phrases counted per day, the most common noun phrases are approximate
+     if it is reached, None to count all noun phrases exactly.
+    :param deduplicate: if True, duplicate articles are dropped before analysis.
+    :param accumulator: AnalysisAccumulator to add results to, None to create new one.
+    :param progress: function, which is called with partial results while pages are streamed in and with the final
+     result, None if progress isn't reported. They are in the format of iter_analysis results.
+    :param update_interval: min number of seconds between partial results, summary isn't built for every page.
+    :param cancel: event, which stops loading and analysis of next pages when set, results of already analyzed
+     articles are returned then and aren't sent to progress. None if analysis isn't cancelled.
     :return: dictionary in format:
      {
         'total':
@@ -38,71 +84,242 @@ def get_analysis(
             'negative': [int],
             'neutral': [int],
         },
-        'top20_nouns':
+        'top{top_nouns}_nouns':
         {
             'nouns': [str],
             'count': [int],
-        }
+        },
+        'duplicates': int,
+        'failed_providers': [str]
     }
     """
 
-    # load DataEntry lists from every provider and concatenate them
-    entries = sum([provider.load_data(keyword, min_post_date, max_items_per_provider)
-                   for provider in data_providers], [])
+    with default_metrics.span('get_analysis'):
+        # stream DataBatch objects from every provider, so analysis starts as soon as first page is loaded
+        batches = ProviderStream(
+            lambda provider: iter_provider_batches(provider, keyword, min_post_date, max_items_per_provider),
+            data_providers,
+            provider_timeout,
+            allow_partial_results,
+            max_queued=2 * len(data_providers),
+            cancel=cancel)
 
-    total_entry = AnalysisEntry()  # entry for holding total statistics data
-    dates_entries = {}  # dictionary of AnalysisEntry for every date
-    noun_phrases = []  # list of all nouns, recognized in articles
+        # duplicates are dropped in consuming thread, so index is not shared by threads
+        index = DeduplicationIndex() if deduplicate else None
 
-    # do analysis for every DataEntry
-    for data_entry in entries:
-        # receive or create new DataEntry for certain day
-        entry = dates_entries.setdefault(data_entry.date, AnalysisEntry())
+        def get_result_info() -> dict:
+            return {
+                'duplicates': index.duplicates if deduplicate else 0,
+                'failed_providers': [type(provider).__name__ for provider in batches.failed_providers]
+            }
 
-        # do NLP analysis for article text
-        blob = TextBlob(data_entry.text)
+        reporter = None if progress is None else ProgressReporter(progress, update_interval, top_nouns,
+                                                                  get_result_info)
+        loaded_batches = batches if reporter is None else reporter.count_pages(batches)
+        unique_batches = map(index.filter_batch, loaded_batches) if deduplicate else loaded_batches
 
-        # get text sentiment data
-        if blob.sentiment.polarity > 0.2:
-            entry.positive_count += 1
-            total_entry.positive_count += 1
-        elif blob.sentiment.polarity < -0.2:
-            entry.negative_count += 1
-            total_entry.negative_count += 1
-        else:
-            entry.neutral_count += 1
-            total_entry.neutral_count += 1
+        analysis = analyze_batches(unique_batches, score_cache, scorer, analyzer, top_nouns, nouns_capacity,
+                                   accumulator, None if reporter is None else reporter.report)
+        default_metrics.increment('duplicates', index.duplicates if deduplicate else 0)
 
-        # increase total counts
-        entry.total_count += 1
-        total_entry.total_count += 1
+    result = analysis | get_result_info()
+    if reporter is not None and (cancel is None or not cancel.is_set()):
+        reporter.finish(result)
+    return result
 
-        # add recognized nouns to nouns list
-        noun_phrases += blob.noun_phrases
 
-    # sort dates_entries by date
-    dates_entries = dict(sorted(dates_entries.items()))
-    most_common_nouns = Counter(noun_phrases).most_common(20)
+def get_analysis_snapshot(
+        keyword: str,
+        min_post_date: date,
+        data_providers: list[DataProvider],
+        max_items_per_provider: int,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        score_cache: ScoreCache = None,
+        analyzer: TextAnalyzer = default_analyzer,
+        top_nouns: int = 20,
+        deduplicate: bool = False) -> AnalysisSnapshot:
+    """
+    Does the same analysis as get_analysis in current process and returns its results with analysis results
+    of every analyzed article as a snapshot, which can be saved.
 
-    # return summary data of NLP
-    return {
-        'total': {
-            'count': total_entry.total_count,
-            'positive': total_entry.positive_count,
-            'negative': total_entry.negative_count,
-            'neutral': total_entry.neutral_count
-        },
-        'daily': {
-            'dates': [published_date for published_date in dates_entries.keys()],
-            'count': [entry.total_count for entry in dates_entries.values()],
-            'positive': [entry.positive_count for entry in dates_entries.values()],
-            'negative': [entry.negative_count for entry in dates_entries.values()],
-            'neutral': [entry.neutral_count for entry in dates_entries.values()],
+    :param keyword: keyword/phrase to do search on.
+    :param min_post_date: minimum published date for articles.
+    :param data_providers: list of DataProvider object, from which data must be loaded.
+    :param max_items_per_provider: max number of articles to retrieve from every data providers.
+    :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+    :param allow_partial_results: if True, analysis is done on data of providers, that responded successfully,
+     otherwise error of the first failed provider is raised.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param analyzer: NLP analyzer of texts.
+    :param top_nouns: number of the most common noun phrases in result.
+    :param deduplicate: if True, duplicate articles are dropped before analysis.
+    :return: AnalysisSnapshot object.
+    """
+
+    recorder = ScoredArticlesRecorder()
+    analysis = get_analysis(keyword, min_post_date, data_providers, max_items_per_provider, provider_timeout,
+                            allow_partial_results, score_cache, analyzer=analyzer, top_nouns=top_nouns,
+                            deduplicate=deduplicate, accumulator=recorder)
+    return AnalysisSnapshot(keyword, min_post_date, analysis, recorder.to_table())
+
+
+def iter_analysis(
+        keyword: str,
+        min_post_date: date,
+        data_providers: list[DataProvider],
+        max_items_per_provider: int,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        score_cache: ScoreCache = None,
+        scorer: ParallelScorer = None,
+        analyzer: TextAnalyzer = default_analyzer,
+        top_nouns: int = 20,
+        nouns_capacity: int = None,
+        deduplicate: bool = False,
+        update_interval: float = 0.5,
+        cancel: Event = None) -> Iterator[dict]:
+    """
+    Does the same analysis as get_analysis in worker thread and yields its partial results
+    while pages are streamed in, so results can be shown before all providers have responded.
+    Closing the iterator or setting cancel event stops analysis and loading of next pages.
+
+    :param keyword: keyword/phrase to do search on.
+    :param min_post_date: minimum published date for articles.
+    :param data_providers: list of DataProvider object, from which data must be loaded.
+    :param max_items_per_provider: max number of articles to retrieve from every data providers.
+    :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+    :param allow_partial_results: if True, analysis is done on data of providers, that responded successfully,
+     otherwise error of the first failed provider is raised.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param scorer: pool of worker processes for NLP analysis, None to do analysis in worker thread.
+    :param analyzer: NLP analyzer of texts, if analysis is done in worker thread, scorer uses its own analyzer.
+    :param top_nouns: number of the most common noun phrases in result.
+    :param nouns_capacity: max number of noun phrases counted per day, the most common noun phrases are approximate
+     if it is reached, None to count all noun phrases exactly.
+    :param deduplicate: if True, duplicate articles are dropped before analysis.
+    :param update_interval: min number of seconds between partial results, summary isn't built for every page.
+    :param cancel: event, which stops analysis without final result when set, None if analysis isn't cancelled.
+    :return: iterator of dictionaries in the format of get_analysis result with additional keys:
+     {
+        'progress':
+        {
+            'pages': int,
+            'articles_loaded': int,
+            'articles_analyzed': int
         },
-        'top20_nouns': {
-            'nouns': [item[0] for item in most_common_nouns],
-            'count': [item[1] for item in most_common_nouns],
+        'done': bool
+     }
+     the last one has 'done' set to True and the same analysis as get_analysis result.
+    """
+
+    cancel = cancel if cancel is not None else Event()
+    results = Queue()  # queue of (result, error) tuples, result is None, when analysis is finished
+
+    def run() -> None:
+        try:
+            get_analysis(keyword, min_post_date, data_providers, max_items_per_provider, provider_timeout,
+                         allow_partial_results, score_cache, scorer, analyzer, top_nouns, nouns_capacity, deduplicate,
+                         progress=lambda result: results.put((result, None)), update_interval=update_interval,
+                         cancel=cancel)
+            results.put((None, None))
+        except Exception as error:
+            results.put((None, error))
+
+    Thread(target=run, daemon=True).start()
+    try:
+        while not cancel.is_set():
+            result, error = results.get()
+            if error is not None:
+                raise error
+            if result is None or cancel.is_set():
+                break
+            yield result
+    except GeneratorExit:
+        # consumer closed the iterator, so worker stops after the current page
+        cancel.set()
+        raise
+
+
+def get_analysis_batch(
+        keywords: list[str],
+        min_post_date: date,
+        data_providers: list[DataProvider],
+        max_items_per_provider: int,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        score_cache: ScoreCache = None,
+        analyzer: TextAnalyzer = default_analyzer,
+        top_nouns: int = 20,
+        nouns_capacity: int = None,
+        deduplicate: bool = False,
+        max_concurrent_queries: int = 8) -> dict[str, dict]:
+    """
+    Does NLP analysis of articles of several keywords at once. It is equivalent to calling get_analysis for every
+    keyword, but queries of all keywords share the limit of concurrent provider queries,
+    and every distinct article text is analyzed once, even if it was loaded for several keywords.
+
+    :param keywords: keywords/phrases to do search on.
+    :param min_post_date: minimum published date for articles.
+    :param data_providers: list of DataProvider object, from which data must be loaded.
+    :param max_items_per_provider: max number of articles to retrieve from every data providers for every keyword.
+    :param provider_timeout: max number of seconds to wait for every query of data provider,
+     None to wait without limit.
+    :param allow_partial_results: if True, analysis is done on data of providers, that responded successfully,
+     otherwise error of the first failed provider is raised.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param analyzer: NLP analyzer of texts.
+    :param top_nouns: number of the most common noun phrases in result.
+    :param nouns_capacity: max number of noun phrases counted per day, the most common noun phrases are approximate
+     if it is reached, None to count all noun phrases exactly.
+    :param deduplicate: if True, duplicate articles of every keyword are dropped before analysis.
+    :param max_concurrent_queries: max number of provider queries of all keywords running at once.
+    :return: dictionary of get_analysis results by keyword.
+    """
+
+    keywords = list(dict.fromkeys(keywords))
+
+    # every query streams batches of single keyword from single provider, tagged with keyword
+    queries = [(keyword, provider) for keyword in keywords for provider in data_providers]
+    batches = ProviderStream(
+        lambda query: ((query[0], batch) for batch in
+                       iter_provider_batches(query[1], query[0], min_post_date, max_items_per_provider)),
+        queries,
+        provider_timeout,
+        allow_partial_results,
+        max_queued=2 * len(queries),
+        max_concurrent=max_concurrent_queries)
+
+    accumulators = {keyword: AnalysisAccumulator(nouns_capacity) for keyword in keywords}
+    indices = {keyword: DeduplicationIndex() for keyword in keywords}
+    scores = {}  # analysis results of every distinct text, shared by keywords
+
+    for keyword, batch in batches:
+        if deduplicate:
+            batch = indices[keyword].filter_batch(batch)
+
+        # only texts, which were not analyzed for other keywords, are analyzed
+        new_texts = list(dict.fromkeys(text for text in batch.texts if text not in scores))
+        if new_texts:
+            if score_cache is not None:
+                polarities, noun_phrases = score_cache.score_batch(new_texts, analyzer)
+            else:
+                polarities, noun_phrases = analyzer.score_batch(new_texts)
+            scores.update(zip(new_texts, zip(polarities.tolist(), noun_phrases)))
+
+        batch_scores = [scores[text] for text in batch.texts]
+        accumulators[keyword].add_batch(
+            batch.dates,
+            np.array([polarity for polarity, _ in batch_scores], dtype=np.float64),
+            [text_noun_phrases for _, text_noun_phrases in batch_scores])
+
+    return {
+        keyword: accumulators[keyword].summary(top_nouns=top_nouns) | {
+            'duplicates': indices[keyword].duplicates,
+            'failed_providers': [type(provider).__name__ for query_keyword, provider in batches.failed_providers
+                                 if query_keyword == keyword]
         }
+        for keyword in keywords
     }
 
 
@@ -111,43 +328,334 @@ def get_feed(
         min_post_date: date,
         data_providers: list[DataProvider],
         max_items_per_provider: int,
-        your_link: str) -> str:
+        your_link: str,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        deduplicate: bool = False) -> str:
     """
     Loads data from data providers and builds RSS Feed out of articles data.
+    Data providers are queried concurrently and their articles are added to feed in order of receiving.
+    If deduplicate is True, articles with the same URL or nearly the same text, which different providers return,
+    are added once.
+
+    :param keyword: keyword/phrase to do search on.
+    :param min_post_date: minimum published date for articles.
+    :param data_providers: list of DataProvider object, from which data must be loaded.
+    :param max_items_per_provider: max number of articles to retrieve from every data providers.
+    :param your_link: link to you RSS feed page.
+    :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+    :param allow_partial_results: if True, feed is built from data of providers, that responded successfully,
+     otherwise error of the first failed provider is raised.
+    :param deduplicate: if True, duplicate articles are not added to feed.
+    :return: RSS Feed string
+    """
+
+    # stream FeedEntry objects from every provider
+    entries = ProviderStream(
+        lambda provider: iter_provider_feed(provider, keyword, min_post_date, max_items_per_provider),
+        data_providers,
+        provider_timeout,
+        allow_partial_results)
+
+    if deduplicate:
+        entries = DeduplicationIndex().filter_feed(entries)
+
+    with default_metrics.span('get_feed'):
+        return build_feed(keyword, min_post_date, entries, your_link)
+
+
+def get_analysis_and_feed(
+        keyword: str,
+        min_post_date: date,
+        data_providers: list[DataProvider],
+        max_items_per_provider: int,
+        your_link: str,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        score_cache: ScoreCache = None,
+        scorer: ParallelScorer = None,
+        analyzer: TextAnalyzer = default_analyzer,
+        top_nouns: int = 20,
+        nouns_capacity: int = None,
+        deduplicate: bool = False) -> tuple[dict, str]:
+    """
+    Loads articles from data providers once and builds both NLP analysis and RSS Feed out of them.
+    It is equivalent to calling get_analysis and get_feed, but does half of API requests.
 
     :param keyword: keyword/phrase to do search on.
     :param min_post_date: minimum published date for articles.
     :param data_providers: list of DataProvider object, from which data must be loaded.
     :param max_items_per_provider: max number of articles to retrieve from every data providers.
     :param your_link: link to you RSS feed page.
+    :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+    :param allow_partial_results: if True, analysis and feed are built from data of providers,
+     that responded successfully, otherwise error of the first failed provider is raised.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param scorer: pool of worker processes for NLP analysis, None to do analysis in current process.
+    :param analyzer: NLP analyzer of texts, if analysis is done in current process, scorer uses its own analyzer.
+    :param top_nouns: number of the most common noun phrases in result.
+    :param nouns_capacity: max number of noun phrases counted per day, the most common noun phrases are approximate
+     if it is reached, None to count all noun phrases exactly.
+    :param deduplicate: if True, duplicate articles are dropped before analysis and are not added to feed.
+    :return: tuple of get_analysis result dictionary and RSS Feed string.
+    """
+
+    # stream Article objects from every provider
+    articles = ProviderStream(
+        lambda provider: iter_provider_articles(provider, keyword, min_post_date, max_items_per_provider),
+        data_providers,
+        provider_timeout,
+        allow_partial_results)
+    index = DeduplicationIndex() if deduplicate else None
+    feed_entries = []
+
+    # every article is added to feed and, if it is not older than min_post_date, analyzed
+    def iter_data_entries():
+        for article in index.filter_articles(articles) if deduplicate else articles:
+            feed_entries.append(article.to_feed_entry())
+            if article.date >= min_post_date:
+                yield article.to_data_entry()
+
+    analysis = analyze_entries(iter_data_entries(), score_cache, scorer, analyzer, top_nouns, nouns_capacity) | {
+        'duplicates': index.duplicates if deduplicate else 0,
+        'failed_providers': [type(provider).__name__ for provider in articles.failed_providers]
+    }
+    feed = build_feed(keyword, min_post_date, feed_entries, your_link)
+    return analysis, feed
+
+
+async def get_analysis_async(
+        keyword: str,
+        min_post_date: date,
+        data_providers: list[AsyncDataProvider | DataProvider],
+        max_items_per_provider: int,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        score_cache: ScoreCache = None,
+        analyzer: TextAnalyzer = default_analyzer,
+        top_nouns: int = 20,
+        nouns_capacity: int = None,
+        deduplicate: bool = False) -> dict:
+    """
+    Async version of get_analysis, which can be awaited by many requests at once from single event loop.
+    Data providers are awaited concurrently, blocking DataProvider objects are run in worker threads,
+    and NLP analysis is done in worker thread, so event loop isn't blocked.
+    Timed out blocking providers can't be interrupted, so they finish in background threads of SyncProviderAdapter
+    executor and their data is discarded.
+
+    :param keyword: keyword/phrase to do search on.
+    :param min_post_date: minimum published date for articles.
+    :param data_providers: list of AsyncDataProvider or DataProvider objects, from which data must be loaded.
+    :param max_items_per_provider: max number of articles to retrieve from every data providers.
+    :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+    :param allow_partial_results: if True, analysis is done on data of providers, that responded successfully,
+     otherwise error of the first failed provider is raised.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param analyzer: NLP analyzer of texts.
+    :param top_nouns: number of the most common noun phrases in result.
+    :param nouns_capacity: max number of noun phrases counted per day, the most common noun phrases are approximate
+     if it is reached, None to count all noun phrases exactly.
+    :param deduplicate: if True, duplicate articles are dropped before analysis.
+    :return: dictionary in the format of get_analysis result.
+    """
+
+    providers_batches, failed_providers, _ = await gather_from_providers(
+        lambda provider: provider.load_batches(keyword, min_post_date, max_items_per_provider),
+        data_providers,
+        provider_timeout,
+        allow_partial_results)
+
+    batches = [batch for provider_batches in providers_batches for batch in provider_batches]
+    index = DeduplicationIndex() if deduplicate else None
+    if deduplicate:
+        batches = [index.filter_batch(batch) for batch in batches]
+
+    analysis = await asyncio.to_thread(
+        analyze_batches, batches, score_cache, None, analyzer, top_nouns, nouns_capacity)
+    return analysis | {
+        'duplicates': index.duplicates if deduplicate else 0,
+        'failed_providers': [type(provider).__name__ for provider in failed_providers]
+    }
+
+
+async def get_feed_async(
+        keyword: str,
+        min_post_date: date,
+        data_providers: list[AsyncDataProvider | DataProvider],
+        max_items_per_provider: int,
+        your_link: str,
+        provider_timeout: float = None,
+        allow_partial_results: bool = False,
+        deduplicate: bool = False) -> str:
+    """
+    Async version of get_feed, which can be awaited by many requests at once from single event loop.
+    Data providers are awaited concurrently and blocking DataProvider objects are run in worker threads.
+
+    :param keyword: keyword/phrase to do search on.
+    :param min_post_date: minimum published date for articles.
+    :param data_providers: list of AsyncDataProvider or DataProvider objects, from which data must be loaded.
+    :param max_items_per_provider: max number of articles to retrieve from every data providers.
+    :param your_link: link to you RSS feed page.
+    :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+    :param allow_partial_results: if True, feed is built from data of providers, that responded successfully,
+     otherwise error of the first failed provider is raised.
+    :param deduplicate: if True, duplicate articles are not added to feed.
     :return: RSS Feed string
     """
 
-    feed = Rss201rev2Feed(
-        title=f'{keyword} articles',
-        link=your_link,
-        description=f'Feed for articles, mentioning {keyword} since {min_post_date}.',
-        language='en'
-    )
+    providers_entries, _, _ = await gather_from_providers(
+        lambda provider: provider.load_feed(keyword, min_post_date, max_items_per_provider),
+        data_providers,
+        provider_timeout,
+        allow_partial_results)
+
+    entries = [entry for provider_entries in providers_entries for entry in provider_entries]
+    if deduplicate:
+        entries = list(DeduplicationIndex().filter_feed(entries))
+
+    return build_feed(keyword, min_post_date, entries, your_link)
+
+
+def analyze_entries(
+        entries: Iterable[DataEntry],
+        score_cache: ScoreCache = None,
+        scorer: ParallelScorer = None,
+        analyzer: TextAnalyzer = default_analyzer,
+        top_nouns: int = 20,
+        nouns_capacity: int = None) -> dict:
+    """
+    Does NLP analysis on data entries and returns summary results of analysis.
+    Entries are consumed one by one, so they can be streamed.
+
+    :param entries: iterable of DataEntry objects to analyze.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param scorer: pool of worker processes for NLP analysis, None to do analysis in current process.
+    :param analyzer: NLP analyzer of texts, if analysis is done in current process, scorer uses its own analyzer.
+    :param top_nouns: number of the most common noun phrases in result.
+    :param nouns_capacity: max number of noun phrases counted per day, the most common noun phrases are approximate
+     if it is reached, None to count all noun phrases exactly.
+    :return: dictionary in the format of get_analysis result without 'failed_providers' key.
+    """
+
+    return analyze_batches(
+        to_batches(entries, DataProvider.batch_size), score_cache, scorer, analyzer, top_nouns, nouns_capacity)
+
+
+def analyze_batches(
+        batches: Iterable[DataBatch],
+        score_cache: ScoreCache = None,
+        scorer: ParallelScorer = None,
+        analyzer: TextAnalyzer = default_analyzer,
+        top_nouns: int = 20,
+        nouns_capacity: int = None,
+        accumulator: AnalysisAccumulator = None,
+        progress: Callable[[AnalysisAccumulator], None] = None) -> dict:
+    """
+    Does NLP analysis on data batches and returns summary results of analysis.
+    Batches are consumed one by one, so they can be streamed.
+
+    :param batches: iterable of DataBatch objects to analyze.
+    :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+    :param scorer: pool of worker processes for NLP analysis, None to do analysis in current process.
+    :param analyzer: NLP analyzer of texts, if analysis is done in current process, scorer uses its own analyzer.
+    :param top_nouns: number of the most common noun phrases in result.
+    :param nouns_capacity: max number of noun phrases counted per day, the most common noun phrases are approximate
+     if it is reached, None to count all noun phrases exactly.
+    :param accumulator: AnalysisAccumulator to add results to, None to create new one with nouns_capacity.
+    :param progress: function, which is called with accumulator after results of every batch are added to it,
+     None if progress isn't reported.
+    :return: dictionary in the format of get_analysis result without 'failed_providers' key.
+    """
+
+    accumulator = accumulator if accumulator is not None else AnalysisAccumulator(nouns_capacity)
+    if scorer is not None:
+        scorer.analyze_batches(batches, score_cache, accumulator, progress)
+        return accumulator.summary(top_nouns=top_nouns)
+
+    # do analysis for every batch of news posts at once
+    for batch in batches:
+        polarities, noun_phrases = score_texts(batch.texts, score_cache, analyzer)
+        with default_metrics.span('aggregate'):
+            accumulator.add_batch(batch.dates, polarities, noun_phrases)
+        default_metrics.increment('articles_analyzed', len(batch.texts))
+        if progress is not None:
+            progress(accumulator)
+
+    # return summary data of NLP
+    with default_metrics.span('summary'):
+        return accumulator.summary(top_nouns=top_nouns)
+
+
+class ProgressReporter:
+    """
+    Sends partial results of running analysis to callback, at most once per update_interval seconds,
+    and the final result, adding numbers of fetched pages, loaded and analyzed articles to them.
 
-    # load DataEntry lists from every provider and concatenate them
-    entries = sum([provider.load_feed(keyword, min_post_date, max_items_per_provider)
-                   for provider in data_providers], [])
+    Attributes:
+    - callback (Callable[[dict], None]): Function, which receives results.
+    - update_interval (float): Min number of seconds between partial results.
+    - top_nouns (int): Number of the most common noun phrases in results.
+    - get_result_info (Callable[[], dict]): Function, which returns 'duplicates' and 'failed_providers' of results.
+    - pages (int): Number of pages loaded from providers.
+    - articles_loaded (int): Number of articles loaded from providers.
+    - last_update (float): Time in seconds, when the last partial result was sent.
+    """
+
+    def __init__(self, callback: Callable[[dict], None], update_interval: float, top_nouns: int,
+                 get_result_info: Callable[[], dict]):
+        """
+        Constructor for ProgressReporter.
+
+        :param callback: function, which receives results.
+        :param update_interval: min number of seconds between partial results.
+        :param top_nouns: number of the most common noun phrases in results.
+        :param get_result_info: function, which returns 'duplicates' and 'failed_providers' of results.
+        """
+
+        self.callback = callback
+        self.update_interval = update_interval
+        self.top_nouns = top_nouns
+        self.get_result_info = get_result_info
+        self.pages = 0
+        self.articles_loaded = 0
+        self.last_update = monotonic()
 
-    for entry in entries:
-        feed.add_item(
-            title=entry.title,
-            link=entry.url,
-            description=entry.description,
-            pubdate=entry.pubdate,
-        )
+    def count_pages(self, batches: Iterable[DataBatch]) -> Iterator[DataBatch]:
+        for batch in batches:
+            self.pages += 1
+            self.articles_loaded += len(batch)
+            yield batch
 
-    return feed.writeString('utf-8')
+    def report(self, accumulator: AnalysisAccumulator) -> None:
+        if monotonic() - self.last_update < self.update_interval:
+            return
+
+        with default_metrics.span('summary'):
+            summary = accumulator.summary(top_nouns=self.top_nouns)
+        self.callback(summary | self.get_result_info() | self.get_progress(summary, False))
+        self.last_update = monotonic()
+
+    def finish(self, result: dict) -> None:
+        self.callback(result | self.get_progress(result, True))
+
+    def get_progress(self, result: dict, done: bool) -> dict:
+        return {
+            'progress': {
+                'pages': self.pages,
+                'articles_loaded': self.articles_loaded,
+                'articles_analyzed': result['total']['count']
+            },
+            'done': done
+        }
 
 
 if __name__ == '__main__':
     default_keyword = 'Ukraine'
     date = date.today() - timedelta(days=7)
     providers = [NewsApiDataProvider(news_api_key), EventRegistryDataProvider(event_registry_api_key)]
+    # loaded articles are kept only on request, so they can be queried later with LocalIndexDataProvider
+    article_store_path = os.environ.get('ARTICLE_STORE_PATH')
+    if article_store_path:
+        providers = with_article_store(providers, ArticleStore(article_store_path))
     rss_feed = get_feed(default_keyword, date, providers, 100, '/articles/')
     print(rss_feed)
@@ -0,0 +1,346 @@
+import logging
+from contextlib import contextmanager, nullcontext
+from cProfile import Profile
+from io import StringIO
+from pstats import Stats
+from threading import Lock
+from time import perf_counter
+from typing import Callable, ContextManager, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+# labels are kept as sorted tuples of name and value pairs, so they can be dictionary keys
+Labels = tuple[tuple[str, str], ...]
+
+
+class MetricsSink:
+    """
+    Provides a base class for receivers of timing spans and counters, recorded by Metrics.
+    """
+
+    def observe(self, name: str, seconds: float, labels: Labels) -> None:
+        """
+        Records duration of finished span.
+
+        :param name: name of span.
+        :param seconds: duration of span in seconds.
+        :param labels: labels of span.
+        """
+
+        raise NotImplementedError
+
+    def increment(self, name: str, value: float, labels: Labels) -> None:
+        """
+        Adds value to counter.
+
+        :param name: name of counter.
+        :param value: value to add.
+        :param labels: labels of counter.
+        """
+
+        raise NotImplementedError
+
+
+class SpanStats:
+    """
+    A class for holding running statistics of spans with the same name and labels.
+
+    Attributes:
+    - count (int): Number of finished spans.
+    - total (float): Total duration of spans in seconds.
+    - max (float): Max duration of span in seconds.
+    """
+
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        """
+        Constructor for SpanStats. Sets all statistics to 0.
+        """
+
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class InMemorySink(MetricsSink):
+    """
+    Metrics sink, which keeps counters and statistics of spans in memory.
+
+    Attributes:
+    - counters (dict[tuple[str, Labels], float]): Values of counters by name and labels.
+    - spans (dict[tuple[str, Labels], SpanStats]): Statistics of spans by name and labels.
+    """
+
+    def __init__(self):
+        """
+        Constructor for InMemorySink. Sets counters and spans to empty dictionaries.
+        """
+
+        self.counters = {}
+        self.spans = {}
+        self.lock = Lock()
+
+    def observe(self, name: str, seconds: float, labels: Labels) -> None:
+        with self.lock:
+            stats = self.spans.get((name, labels))
+            if stats is None:
+                stats = self.spans[name, labels] = SpanStats()
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+
+    def increment(self, name: str, value: float, labels: Labels) -> None:
+        with self.lock:
+            self.counters[name, labels] = self.counters.get((name, labels), 0) + value
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        """
+        Returns sum of counters with given name, which have all given labels.
+
+        :param name: name of counter.
+        :param labels: labels, which counters must have.
+        :return: sum of counters values.
+        """
+
+        with self.lock:
+            return sum(value for (counter_name, counter_labels), value in self.counters.items()
+                       if counter_name == name and labels.items() <= dict(counter_labels).items())
+
+    def get_span(self, name: str, **labels: str) -> SpanStats:
+        """
+        Returns combined statistics of spans with given name, which have all given labels.
+
+        :param name: name of span.
+        :param labels: labels, which spans must have.
+        :return: SpanStats object.
+        """
+
+        result = SpanStats()
+        with self.lock:
+            for (span_name, span_labels), stats in self.spans.items():
+                if span_name == name and labels.items() <= dict(span_labels).items():
+                    result.count += stats.count
+                    result.total += stats.total
+                    result.max = max(result.max, stats.max)
+        return result
+
+    def clear(self) -> None:
+        with self.lock:
+            self.counters.clear()
+            self.spans.clear()
+
+
+class LoggingSink(MetricsSink):
+    """
+    Metrics sink, which writes every span and counter increment to log.
+
+    Attributes:
+    - logger (logging.Logger): Logger, which records are written to.
+    - level (int): Level of log records.
+    """
+
+    def __init__(self, logger: logging.Logger = None, level: int = logging.DEBUG):
+        """
+        Constructor for LoggingSink.
+
+        :param logger: logger, which records are written to, logger of this module by default.
+        :param level: level of log records.
+        """
+
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def observe(self, name: str, seconds: float, labels: Labels) -> None:
+        self.logger.log(self.level, 'span %s%s took %.6fs', name, format_labels(labels), seconds)
+
+    def increment(self, name: str, value: float, labels: Labels) -> None:
+        self.logger.log(self.level, 'counter %s%s += %g', name, format_labels(labels), value)
+
+
+class PrometheusSink(InMemorySink):
+    """
+    Metrics sink, which keeps metrics in memory and renders them in Prometheus text exposition format:
+    every counter is a counter metric and spans are a summary metric with span name label.
+
+    Attributes:
+    - prefix (str): Prefix of names of rendered metrics.
+    """
+
+    def __init__(self, prefix: str = 'social_media_analysis'):
+        """
+        Constructor for PrometheusSink.
+
+        :param prefix: prefix of names of rendered metrics.
+        """
+
+        super().__init__()
+        self.prefix = prefix
+
+    def render(self) -> str:
+        """
+        Renders current values of metrics.
+
+        :return: metrics in Prometheus text exposition format.
+        """
+
+        with self.lock:
+            counters = sorted(self.counters.items())
+            spans = sorted((key, (stats.count, stats.total)) for key, stats in self.spans.items())
+
+        lines = []
+        for name in dict.fromkeys(name for (name, _), _ in counters):
+            lines.append(f'# TYPE {self.prefix}_{name}_total counter')
+            lines += [f'{self.prefix}_{name}_total{format_labels(labels)} {value:g}'
+                      for (counter_name, labels), value in counters if counter_name == name]
+
+        if spans:
+            lines.append(f'# TYPE {self.prefix}_span_seconds summary')
+            for (name, labels), (count, total) in spans:
+                span_labels = format_labels((('span', name),) + labels)
+                lines.append(f'{self.prefix}_span_seconds_count{span_labels} {count}')
+                lines.append(f'{self.prefix}_span_seconds_sum{span_labels} {total:.6f}')
+
+        return '\n'.join(lines) + '\n'
+
+
+class Span:
+    """
+    Context manager, which measures duration of its block and records it in metrics sink.
+    """
+
+    __slots__ = ('sink', 'name', 'labels', 'start')
+
+    def __init__(self, sink: MetricsSink, name: str, labels: Labels):
+        self.sink = sink
+        self.name = name
+        self.labels = labels
+        self.start = 0.0
+
+    def __enter__(self) -> 'Span':
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.sink.observe(self.name, perf_counter() - self.start, self.labels)
+
+
+class Metrics:
+    """
+    Entry point of instrumentation, which records timing spans and counters of analysis stages in pluggable sink.
+    Without sink metrics are disabled and recording methods return immediately, so instrumented code
+    doesn't slow down.
+
+    Attributes:
+    - sink (MetricsSink): Receiver of recorded metrics, None if metrics are disabled.
+    """
+
+    disabled_span = nullcontext()
+
+    def __init__(self, sink: MetricsSink = None):
+        """
+        Constructor for Metrics.
+
+        :param sink: receiver of recorded metrics, None to disable metrics.
+        """
+
+        self.sink = sink
+
+    def span(self, name: str, **labels: str) -> ContextManager:
+        """
+        Measures duration of with block.
+
+        :param name: name of span, usually name of analysis stage.
+        :param labels: labels of span, like provider name.
+        :return: context manager, measuring duration of its block.
+        """
+
+        if self.sink is None:
+            return self.disabled_span
+        return Span(self.sink, name, tuple(sorted(labels.items())))
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """
+        Adds value to counter.
+
+        :param name: name of counter.
+        :param value: value to add.
+        :param labels: labels of counter, like provider name.
+        """
+
+        if self.sink is not None:
+            self.sink.increment(name, value, tuple(sorted(labels.items())))
+
+    def count_items(self, items: Iterable[T], name: str, size: Callable[[T], int] = None, **labels: str) \
+            -> Iterable[T]:
+        """
+        Counts items of iterable as they are iterated.
+
+        :param items: iterable to count items of.
+        :param name: name of counter.
+        :param size: function, returning number to add to counter for every item, 1 per item by default.
+        :param labels: labels of counter, like provider name.
+        :return: iterable over the same items, items itself if metrics are disabled.
+        """
+
+        if self.sink is None:
+            return items
+        return self.iter_counted(items, name, size, tuple(sorted(labels.items())))
+
+    def iter_counted(self, items: Iterable[T], name: str, size: Callable[[T], int] | None, labels: Labels) \
+            -> Iterator[T]:
+        for item in items:
+            self.sink.increment(name, 1 if size is None else size(item), labels)
+            yield item
+
+
+# only one cProfile profiler can be active at a time since Python 3.12, so profiled blocks are run one by one
+profile_lock = Lock()
+
+
+@contextmanager
+def capture_profile(path: str = None) -> Iterator[Profile]:
+    """
+    Profiles with block with cProfile. Blocks, profiled in several threads at the same time, are run one by one.
+    Until Python 3.12 only current thread is profiled, since Python 3.12 calls of all threads are recorded, including
+    other requests of a service, which run meanwhile. Work of processes, like ParallelScorer workers, is seen only
+    as time, which is waited for it.
+
+    :param path: path to file, where profile is saved for pstats or snakeviz, None to not save it.
+    :return: context manager, returning Profile object.
+    """
+
+    with profile_lock:
+        profiler = Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            if path is not None:
+                profiler.dump_stats(path)
+
+
+def format_profile(profiler: Profile, sort: str = 'cumulative', limit: int = 30) -> str:
+    """
+    Formats the most expensive functions of profile as text table.
+
+    :param profiler: Profile object with captured profile.
+    :param sort: pstats sort key, like 'cumulative' or 'tottime'.
+    :param limit: number of functions in table.
+    :return: text table of functions.
+    """
+
+    stream = StringIO()
+    Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + '}'
+
+
+default_metrics = Metrics()  # metrics, recorded by analysis stages, disabled until sink is set
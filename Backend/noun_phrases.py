@@ -0,0 +1,124 @@
+import os
+import re
+from importlib.metadata import version
+
+from Backend.lazy_imports import LazyImport
+
+# textblob imports NLTK, which takes most of backend import time, so it is imported on first use
+TextBlob = LazyImport('textblob', 'TextBlob')
+
+
+class NounPhraseExtractor:
+    """
+    Base class for noun phrases extraction backends.
+
+    Attributes:
+    - version (str): Version of noun phrases extraction, cached results of other versions are not reused.
+    """
+
+    version = None
+
+    def extract(self, texts: list[str]) -> list[list[str]]:
+        """
+        Recognizes noun phrases in texts.
+
+        :param texts: list of texts to analyze.
+        :return: list of lowercase noun phrases of every text in the order of texts.
+        """
+
+        raise NotImplementedError
+
+
+class TextBlobNounPhraseExtractor(NounPhraseExtractor):
+    """
+    Reference noun phrases extraction backend, which runs TextBlob tagger and chunker on every text.
+    It needs NLTK corpora to be downloaded.
+    """
+
+    version = f'textblob-{version("textblob")}'
+
+    def extract(self, texts: list[str]) -> list[list[str]]:
+        return [list(TextBlob(text).noun_phrases) for text in texts]
+
+
+class LexiconNounPhraseExtractor(NounPhraseExtractor):
+    """
+    Fast noun phrases extraction backend, which doesn't need NLTK corpora.
+    Words are tagged by lookup in Brill lexicon, shipped with TextBlob, and tags of unknown words are guessed by
+    suffix rules and cached. Phrases are matched by precompiled regular expression over tags of the whole text,
+    which implements the grammar of TextBlob FastNPExtractor: proper nouns sequences ("new york"),
+    noun sequences ("oil prices") and nouns with preceding adjectives ("strong economy").
+
+    Attributes:
+    - tags (dict[str, str]): Cached one letter tag of every known word: P for proper nouns, N for nouns,
+     J for adjectives and X for all other words.
+    - max_cached_words (int): Max number of words in tags cache, tags of unknown words are not cached beyond it.
+    """
+
+    version = 'lexicon-1'
+
+    token_pattern = re.compile(r"\w+(?=n't)|n't|'\w+|\w+(?:[-.]\w+)*|[^\w\s]")
+    phrase_pattern = re.compile(r'P+|J+N+|N{2,}')
+    unknown_word_rules = [
+        (re.compile(r'^-?[0-9]+(.[0-9]+)?$'), 'X'),
+        (re.compile(r'^(the|a|an)$', re.IGNORECASE), 'X'),
+        (re.compile(r'.*able$'), 'J'),
+        (re.compile(r'^[A-Z]'), 'P'),
+        (re.compile(r'.*ness$'), 'N'),
+        (re.compile(r'.*(ly|ing|ed)$'), 'X'),
+        (re.compile(r'^\w'), 'N'),
+        (re.compile(''), 'X'),
+    ]
+
+    def __init__(self, max_cached_words: int = 200000):
+        """
+        Constructor for LexiconNounPhraseExtractor. Lexicon is loaded on first use.
+
+        :param max_cached_words: max number of words in tags cache.
+        """
+
+        self.max_cached_words = max_cached_words
+        self.tags = None
+
+    def extract(self, texts: list[str]) -> list[list[str]]:
+        if self.tags is None:
+            self.load_lexicon()
+        return [self.extract_text(text) for text in texts]
+
+    def extract_text(self, text: str) -> list[str]:
+        tokens = self.token_pattern.findall(text)
+        tags = ''.join([self.tags.get(token) or self.guess_tag(token) for token in tokens])
+        phrases = (' '.join(tokens[match.start():match.end()]).lower() for match in self.phrase_pattern.finditer(tags))
+        return [phrase for phrase in phrases if len(phrase) > 1]
+
+    def guess_tag(self, word: str) -> str:
+        tag = next(tag for pattern, tag in self.unknown_word_rules if pattern.match(word))
+        if len(self.tags) < self.max_cached_words:
+            self.tags[word] = tag
+        return tag
+
+    def load_lexicon(self) -> None:
+        """
+        Builds tags cache out of Brill lexicon.
+        """
+
+        import textblob.en
+        path = os.path.join(os.path.dirname(textblob.en.__file__), 'en-lexicon.txt')
+
+        tags = {}
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                parts = line.split()
+                if len(parts) != 2 or line.startswith(';;;'):
+                    continue
+                word, tag = parts
+                if tag in ('NNP', 'NNPS'):
+                    tags[word] = 'P'
+                elif tag in ('NN', 'NNS'):
+                    tags[word] = 'N'
+                elif tag == 'JJ':
+                    tags[word] = 'J'
+                else:
+                    tags[word] = 'X'
+
+        self.tags = tags
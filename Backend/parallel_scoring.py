@@ -0,0 +1,184 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from multiprocessing import get_all_start_methods, get_context
+from typing import Callable, Iterable
+
+import numpy as np
+
+from Backend.analysis import AnalysisAccumulator, TextAnalyzer, default_analyzer
+from Backend.entries import DataBatch, DataEntry, to_batches
+from Backend.score_cache import ScoreCache
+
+worker_analyzer = default_analyzer  # NLP analyzer of current worker process
+
+
+def init_worker(analyzer: TextAnalyzer) -> None:
+    """
+    Initializes worker process: sets its NLP analyzer and calls it once,
+    so lexicon, corpora and tagger are loaded when worker starts, not when it analyzes its first chunk.
+
+    :param analyzer: NLP analyzer of texts.
+    """
+
+    global worker_analyzer
+    worker_analyzer = analyzer
+    analyzer.score_batch(['Warm up text for news analysis.'])
+
+
+def ping_worker() -> None:
+    """
+    Does nothing, it is submitted to start worker processes in advance.
+    """
+
+
+def score_chunk(chunk: DataBatch, return_scores: bool) \
+        -> tuple[AnalysisAccumulator, tuple[np.ndarray, list[list[str]]] | None]:
+    """
+    Does NLP analysis of chunk of articles in worker process.
+
+    :param chunk: DataBatch with articles publishing dates and texts.
+    :param return_scores: if True, analysis results of every text are returned too.
+    :return: tuple of accumulated analysis results of chunk and tuple of polarities and noun phrases of texts or None.
+    """
+
+    polarities, noun_phrases = worker_analyzer.score_batch(chunk.texts)
+    accumulator = AnalysisAccumulator()
+    accumulator.add_batch(chunk.dates, polarities, noun_phrases)
+
+    return accumulator, (polarities, noun_phrases) if return_scores else None
+
+
+class ParallelScorer:
+    """
+    Does NLP analysis of articles in a pool of worker processes, so analysis uses all CPU cores.
+    Workers are started once and reused by all analyze calls, so every worker loads corpora and tagger only once.
+
+    Attributes:
+    - workers (int): Number of worker processes.
+    - chunk_size (int): Number of articles sent to worker at once.
+    - analyzer (TextAnalyzer): NLP analyzer of texts, which is sent to every worker.
+    - executor (ProcessPoolExecutor): Pool of worker processes.
+    """
+
+    def __init__(
+            self,
+            workers: int = None,
+            chunk_size: int = 64,
+            analyzer: TextAnalyzer = default_analyzer):
+        """
+        Constructor for ParallelScorer. Starts worker processes and waits until they are initialized.
+
+        :param workers: number of worker processes, number of CPU cores by default.
+        :param chunk_size: number of articles sent to worker at once.
+        :param analyzer: NLP analyzer of texts, its class must be importable by worker processes.
+        """
+
+        self.workers = workers or os.cpu_count()
+        self.chunk_size = chunk_size
+        self.analyzer = analyzer
+        # workers are started from a clean server process, not forked from this one: this process may have running
+        # threads of data providers, and locks held by them at the moment of fork would stay locked in workers forever
+        start_method = 'forkserver' if 'forkserver' in get_all_start_methods() else 'spawn'
+        self.executor = ProcessPoolExecutor(self.workers, mp_context=get_context(start_method),
+                                            initializer=init_worker, initargs=(analyzer,))
+
+        # pool starts workers on demand, so they are started here, not by the first analysis,
+        # errors of their initialization are raised here too
+        for future in [self.executor.submit(ping_worker) for _ in range(self.workers)]:
+            future.result()
+
+    def analyze(
+            self,
+            entries: Iterable[DataEntry],
+            score_cache: ScoreCache = None,
+            accumulator: AnalysisAccumulator = None) -> AnalysisAccumulator:
+        """
+        Does NLP analysis of data entries in worker processes and reduces their results.
+
+        :param entries: iterable of DataEntry objects to analyze.
+        :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+        :param accumulator: AnalysisAccumulator to add results to, None to create new one.
+        :return: AnalysisAccumulator with analysis results of all entries.
+        """
+
+        return self.analyze_batches(to_batches(entries, self.chunk_size), score_cache, accumulator)
+
+    def analyze_batches(
+            self,
+            batches: Iterable[DataBatch],
+            score_cache: ScoreCache = None,
+            accumulator: AnalysisAccumulator = None,
+            progress: Callable[[AnalysisAccumulator], None] = None) -> AnalysisAccumulator:
+        """
+        Does NLP analysis of data batches in worker processes and reduces their results.
+        Batches are consumed lazily and at most two chunks per worker are in flight, so batches can be streamed.
+
+        :param batches: iterable of DataBatch objects to analyze.
+        :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+        :param accumulator: AnalysisAccumulator to add results to, None to create new one.
+        :param progress: function, which is called in current thread with accumulator after results of every chunk
+         are added to it, None if progress isn't reported.
+        :return: AnalysisAccumulator with analysis results of all batches.
+        """
+
+        accumulator = accumulator if accumulator is not None else AnalysisAccumulator()
+        in_flight = deque()  # queue of (chunk keys, future) tuples in order of submitting
+
+        def collect() -> None:
+            keys, future = in_flight.popleft()
+            chunk_accumulator, scores = future.result()
+            accumulator.merge(chunk_accumulator)
+
+            if score_cache is not None:
+                polarities, noun_phrases = scores
+                score_cache.misses += len(keys)
+                score_cache.put_batch(keys, list(zip(polarities.tolist(), noun_phrases)))
+            if progress is not None:
+                progress(accumulator)
+
+        def submit(chunk: DataBatch, keys: list[str]) -> None:
+            in_flight.append((keys, self.executor.submit(score_chunk, chunk, score_cache is not None)))
+            if len(in_flight) >= 2 * self.workers:
+                collect()
+
+        chunk, keys = DataBatch(), []
+        for batch in batches:
+            for ordinal, text, url in zip(batch.dates, batch.texts, batch.urls):
+                # only texts, which are not cached, are sent to workers
+                if score_cache is not None:
+                    key = score_cache.get_key(text, self.analyzer.version)
+                    score = score_cache.get(key)
+                    if score is not None:
+                        score_cache.hits += 1
+                        accumulator.add(date.fromordinal(ordinal), *score)
+                        continue
+                    keys.append(key)
+
+                chunk.dates.append(ordinal)
+                chunk.texts.append(text)
+                chunk.urls.append(url)
+                if len(chunk) == self.chunk_size:
+                    submit(chunk, keys)
+                    chunk, keys = DataBatch(), []
+
+        if len(chunk):
+            submit(chunk, keys)
+        while in_flight:
+            collect()
+
+        return accumulator
+
+    def close(self) -> None:
+        """
+        Stops worker processes.
+        """
+
+        self.executor.shutdown()
+
+    def __enter__(self) -> 'ParallelScorer':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
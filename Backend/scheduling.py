@@ -0,0 +1,292 @@
+from random import random
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable, TypeVar
+
+import requests
+
+T = TypeVar('T')
+
+# HTTP statuses of responses, which are worth retrying
+throttling_statuses = {429}
+transient_statuses = {408, 500, 502, 503, 504}
+
+
+class QuotaExceededError(Exception):
+    """
+    Raised when request would exceed quota of provider requests in current period.
+    """
+
+
+class TokenBucket:
+    """
+    Token bucket, which allows bursts of up to capacity requests and rate requests per second on average.
+    Tokens are reserved ahead, so concurrent callers are delayed one after another instead of all at once.
+
+    Attributes:
+    - rate (float): Number of tokens added per second.
+    - capacity (float): Max number of tokens in bucket.
+    - tokens (float): Number of available tokens, negative if tokens are reserved ahead.
+    - updated_at (float): Time in seconds, when tokens were counted.
+    """
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        """
+        Constructor for TokenBucket. Bucket starts full.
+
+        :param rate: number of tokens added per second.
+        :param capacity: max number of tokens in bucket.
+        :param now: current time in seconds.
+        """
+
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Takes one token.
+
+        :param now: current time in seconds.
+        :return: number of seconds to wait before the token can be used.
+        """
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate) - 1
+        self.updated_at = now
+        return max(0.0, -self.tokens / self.rate)
+
+    def drain(self) -> None:
+        """
+        Drops available tokens, so next requests are spread at rate, when provider throttles requests.
+        """
+
+        self.tokens = min(self.tokens, 0.0)
+
+
+class ProviderQuota:
+    """
+    A class for holding running counters of requests to single provider.
+
+    Attributes:
+    - requests (int): Number of sent requests, including retries.
+    - retries (int): Number of retried requests.
+    - throttled (int): Number of requests, which provider rejected because of rate limits.
+    - failures (int): Number of requests, which failed after all retries.
+    - limit (int): Max number of requests in period, None if it is not limited.
+    - period (float): Length of quota period in seconds.
+    - used (int): Number of requests sent in current period.
+    - period_start (float): Time in seconds, when current period started.
+    """
+
+    def __init__(self, limit: int = None, period: float = 86400, now: float = 0.0):
+        """
+        Constructor for ProviderQuota. Sets all counters to 0.
+
+        :param limit: max number of requests in period, None if it is not limited.
+        :param period: length of quota period in seconds.
+        :param now: current time in seconds.
+        """
+
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+        self.limit = limit
+        self.period = period
+        self.used = 0
+        self.period_start = now
+
+    @property
+    def remaining(self) -> int | None:
+        """
+        Number of requests left in current period, None if it is not limited.
+        """
+
+        return None if self.limit is None else max(0, self.limit - self.used)
+
+
+def classify_error(error: Exception) -> str | None:
+    """
+    Tells whether request, which raised error, is worth retrying.
+
+    :param error: error of request.
+    :return: 'throttled' if provider rejected request because of rate limits, 'transient' if request may succeed
+     on retry, None if it will fail again.
+    """
+
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status in throttling_statuses:
+        return 'throttled'
+    # errors of requests library aren't subclasses of built-in ConnectionError and TimeoutError
+    if status in transient_statuses or isinstance(
+            error, (ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout)):
+        return 'transient'
+    return None
+
+
+def get_retry_after(error: Exception) -> float | None:
+    """
+    Reads number of seconds to wait before retry, which provider sent in Retry-After header.
+
+    :param error: error of request.
+    :return: number of seconds or None if provider didn't send it.
+    """
+
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers['Retry-After'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class RequestScheduler:
+    """
+    Scheduler of requests to data providers APIs, which is shared by providers, so limits hold for all their callers.
+    Requests of every provider are limited by its token bucket, transient errors are retried with exponential
+    backoff and full jitter, and running counters of requests are kept for every provider.
+
+    Attributes:
+    - rate (float): Default number of requests per second of every provider.
+    - burst (int): Default max number of requests sent at once to every provider.
+    - max_retries (int): Max number of retries of single request.
+    - base_delay (float): Max delay before the first retry in seconds, it doubles with every next retry.
+    - max_delay (float): Max delay before any retry in seconds.
+    - buckets (dict[str, TokenBucket]): Token buckets of providers by name.
+    - quotas (dict[str, ProviderQuota]): Counters of requests of providers by name.
+    """
+
+    def __init__(
+            self,
+            rate: float = 10.0,
+            burst: int = 10,
+            max_retries: int = 4,
+            base_delay: float = 0.5,
+            max_delay: float = 30.0,
+            clock: Callable[[], float] = monotonic,
+            sleep_function: Callable[[float], None] = sleep,
+            random_function: Callable[[], float] = random):
+        """
+        Constructor for RequestScheduler.
+
+        :param rate: default number of requests per second of every provider.
+        :param burst: default max number of requests sent at once to every provider.
+        :param max_retries: max number of retries of single request.
+        :param base_delay: max delay before the first retry in seconds, it doubles with every next retry.
+        :param max_delay: max delay before any retry in seconds.
+        :param clock: function returning current time in seconds.
+        :param sleep_function: function waiting given number of seconds.
+        :param random_function: function returning random number in range [0, 1), used for jitter.
+        """
+
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.sleep = sleep_function
+        self.random = random_function
+        self.buckets = {}
+        self.quotas = {}
+        self.lock = Lock()
+
+    def configure(
+            self,
+            name: str,
+            rate: float = None,
+            burst: int = None,
+            quota: int = None,
+            quota_period: float = 86400) -> None:
+        """
+        Sets limits of provider, replacing previous ones. Counters of requests are kept.
+
+        :param name: name of provider.
+        :param rate: number of requests per second, None for default rate.
+        :param burst: max number of requests sent at once, None for default burst.
+        :param quota: max number of requests in quota period, None if it is not limited.
+        :param quota_period: length of quota period in seconds.
+        """
+
+        with self.lock:
+            now = self.clock()
+            self.buckets[name] = TokenBucket(rate or self.rate, burst or self.burst, now)
+            quota_counters = self.get_quota(name)
+            quota_counters.limit = quota
+            quota_counters.period = quota_period
+
+    def call(
+            self,
+            name: str,
+            request: Callable[[], T],
+            classify: Callable[[Exception], str | None] = classify_error) -> T:
+        """
+        Sends request to provider, when its token bucket allows, retrying it on transient errors.
+
+        :param name: name of provider.
+        :param request: function, sending request and returning its result.
+        :param classify: function, telling whether error is 'throttled', 'transient' or None, if it is permanent.
+        :return: result of request.
+        """
+
+        for attempt in range(self.max_retries + 1):
+            self.sleep(self.acquire(name))
+
+            try:
+                return request()
+            except Exception as error:
+                kind = classify(error)
+                with self.lock:
+                    quota = self.quotas[name]
+                    if kind is None or attempt == self.max_retries:
+                        quota.failures += 1
+                        raise
+                    quota.retries += 1
+                    if kind == 'throttled':
+                        quota.throttled += 1
+                        self.buckets[name].drain()
+
+                # full jitter spreads retries of concurrent callers, Retry-After of provider is respected
+                delay = self.random() * min(self.max_delay, self.base_delay * 2 ** attempt)
+                self.sleep(max(delay, get_retry_after(error) or 0.0))
+
+    def acquire(self, name: str) -> float:
+        """
+        Reserves request of provider in its token bucket and quota.
+
+        :param name: name of provider.
+        :return: number of seconds to wait before sending request.
+        """
+
+        with self.lock:
+            now = self.clock()
+            bucket = self.buckets.get(name)
+            if bucket is None:
+                bucket = self.buckets[name] = TokenBucket(self.rate, self.burst, now)
+
+            quota = self.get_quota(name)
+            if now - quota.period_start >= quota.period:
+                quota.used = 0
+                quota.period_start = now
+            if quota.remaining == 0:
+                raise QuotaExceededError(f'{name} quota of {quota.limit} requests is exhausted')
+
+            quota.requests += 1
+            quota.used += 1
+            return bucket.reserve(now)
+
+    def get_quota(self, name: str) -> ProviderQuota:
+        """
+        Returns running counters of requests of provider.
+
+        :param name: name of provider.
+        :return: ProviderQuota object.
+        """
+
+        quota = self.quotas.get(name)
+        if quota is None:
+            quota = self.quotas[name] = ProviderQuota(now=self.clock())
+        return quota
+
+
+default_scheduler = RequestScheduler()
@@ -0,0 +1,168 @@
+import json
+import sqlite3
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from typing import Callable
+
+import numpy as np
+
+from Backend.analysis import TextAnalyzer, analyzer_version, default_analyzer, score_text
+from Backend.metrics import default_metrics
+
+
+class ScoreCache:
+    """
+    Content-addressed cache of NLP analysis results of article texts, so the same text is analyzed only once.
+    Results are kept in in-memory LRU tier and optionally in persistent SQLite tier.
+
+    Attributes:
+    - max_size (int): Max number of results in memory. Least recently used ones are evicted first.
+    - version (str): Version of NLP analysis, which is a part of cache key.
+    - hits (int): Number of texts, which analysis results were found in cache.
+    - misses (int): Number of texts, which were analyzed.
+    """
+
+    def __init__(self, max_size: int = 10000, path: str = None, version: str = analyzer_version):
+        """
+        Constructor for ScoreCache.
+
+        :param max_size: max number of results in memory.
+        :param path: path to SQLite database file of persistent tier, None to keep results in memory only.
+        :param version: version of NLP analysis, which is a part of cache key.
+        """
+
+        self.max_size = max_size
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.memory = OrderedDict()
+
+        # cache is shared by threads, so access to it is serialized with lock
+        self.lock = Lock()
+        self.connection = None
+        if path is not None:
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, polarity REAL, noun_phrases TEXT)')
+            self.connection.commit()
+
+    def score(self, text: str, score_function: Callable[[str], tuple[float, list[str]]] = score_text) \
+            -> tuple[float, list[str]]:
+        """
+        Returns cached analysis results of text or analyzes it and caches results.
+
+        :param text: text of article.
+        :param score_function: function doing NLP analysis of text, if it is not cached.
+        :return: tuple of text sentiment polarity and list of recognized noun phrases.
+        """
+
+        key = self.get_key(text)
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            default_metrics.increment('score_cache_hits')
+            return result
+
+        self.misses += 1
+        default_metrics.increment('score_cache_misses')
+        result = score_function(text)
+        self.put(key, result)
+        return result
+
+    def score_batch(self, texts: list[str], analyzer: TextAnalyzer = default_analyzer) \
+            -> tuple[np.ndarray, list[list[str]]]:
+        """
+        Returns cached analysis results of batch of texts. Texts, which are not cached, are analyzed as one batch.
+
+        :param texts: list of texts of articles.
+        :param analyzer: NLP analyzer of texts, which are not cached. Its version is a part of cache keys.
+        :return: tuple of array of sentiment polarities of texts and lists of noun phrases, recognized in every text.
+        """
+
+        keys = [self.get_key(text, analyzer.version) for text in texts]
+        results = [self.get(key) for key in keys]
+        missing = [index for index, result in enumerate(results) if result is None]
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        default_metrics.increment('score_cache_hits', len(texts) - len(missing))
+        default_metrics.increment('score_cache_misses', len(missing))
+
+        if missing:
+            polarities, noun_phrases = analyzer.score_batch([texts[index] for index in missing])
+            for index, polarity, text_noun_phrases in zip(missing, polarities.tolist(), noun_phrases):
+                results[index] = polarity, text_noun_phrases
+            self.put_batch([keys[index] for index in missing], [results[index] for index in missing])
+
+        return np.array([result[0] for result in results], dtype=np.float64), [result[1] for result in results]
+
+    def get(self, key: str) -> tuple[float, list[str]] | None:
+        """
+        Looks for analysis results in memory first and in persistent tier after that.
+
+        :param key: key of text, built by get_key.
+        :return: tuple of text sentiment polarity and list of recognized noun phrases or None if they are not cached.
+        """
+
+        with self.lock:
+            result = self.memory.get(key)
+            if result is not None:
+                self.memory.move_to_end(key)
+                return result
+
+            if self.connection is None:
+                return None
+            row = self.connection.execute(
+                'SELECT polarity, noun_phrases FROM scores WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+
+            result = row[0], json.loads(row[1])
+            self.put_in_memory(key, result)
+            return result
+
+    def put(self, key: str, result: tuple[float, list[str]]) -> None:
+        """
+        Stores analysis results in memory and persistent tier.
+
+        :param key: key of text, built by get_key.
+        :param result: tuple of text sentiment polarity and list of recognized noun phrases.
+        """
+
+        self.put_batch([key], [result])
+
+    def put_batch(self, keys: list[str], results: list[tuple[float, list[str]]]) -> None:
+        """
+        Stores analysis results of several texts in memory and persistent tier, which is written in one transaction.
+
+        :param keys: keys of texts, built by get_key.
+        :param results: tuples of text sentiment polarity and list of recognized noun phrases in the order of keys.
+        """
+
+        # store copies of noun phrases, so changes of the lists by caller don't affect cache
+        results = [(result[0], list(result[1])) for result in results]
+        with self.lock:
+            for key, result in zip(keys, results):
+                self.put_in_memory(key, result)
+            if self.connection is not None:
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO scores VALUES (?, ?, ?)',
+                    [(key, result[0], json.dumps(result[1])) for key, result in zip(keys, results)])
+                self.connection.commit()
+
+    def put_in_memory(self, key: str, result: tuple[float, list[str]]) -> None:
+        self.memory[key] = result
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_size:
+            self.memory.popitem(last=False)
+
+    def get_key(self, text: str, version: str = None) -> str:
+        """
+        Builds cache key of text out of text content and analysis version.
+
+        :param text: text of article.
+        :param version: version of NLP analysis, version of the cache by default.
+        :return: cache key.
+        """
+
+        return sha256(f'{version or self.version}\0{text}'.encode('utf-8')).hexdigest()
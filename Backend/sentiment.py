@@ -0,0 +1,224 @@
+import re
+from importlib.metadata import version
+from itertools import chain, repeat
+
+import numpy as np
+
+from Backend.lazy_imports import LazyImport
+
+# textblob imports NLTK, which takes most of backend import time, so it is imported on first use
+TextBlob = LazyImport('textblob', 'TextBlob')
+
+
+class SentimentAnalyzer:
+    """
+    Base class for sentiment analysis backends, which compute polarities of whole batch of texts at once.
+
+    Attributes:
+    - version (str): Version of sentiment analysis, cached results of other versions are not reused.
+    """
+
+    version = None
+
+    def polarities(self, texts: list[str]) -> np.ndarray:
+        """
+        Computes sentiment polarities of texts.
+
+        :param texts: list of texts to analyze.
+        :return: array of polarities in range [-1, 1] in the order of texts.
+        """
+
+        raise NotImplementedError
+
+
+class TextBlobSentimentAnalyzer(SentimentAnalyzer):
+    """
+    Reference sentiment analysis backend, which analyzes texts one by one with TextBlob.
+    """
+
+    version = f'textblob-{version("textblob")}'
+
+    def polarities(self, texts: list[str]) -> np.ndarray:
+        return np.array([TextBlob(text).sentiment.polarity for text in texts], dtype=np.float64)
+
+
+class LexiconSentimentAnalyzer(SentimentAnalyzer):
+    """
+    Sentiment analysis backend, which applies TextBlob polarity lexicon and its rules
+    (modifiers like "very good", negations like "not good" and exclamation marks) to all tokens of batch at once
+    with array operations, instead of walking tokens of every text one by one.
+
+    Its results match TextBlob with exception of emoticons and "(!)" irony marks, which are not assessed.
+
+    Attributes:
+    - vocabulary (dict[str, int]): Index of every known word and special token in feature arrays, unknown words are 0.
+    """
+
+    version = f'lexicon-{version("textblob")}'
+
+    # the same contractions, punctuation and abbreviations handling as TextBlob tokenizer has
+    contraction_pattern = re.compile(r"('d|'m|'s|'ll|'re|'ve|n't)")
+    separator_pattern = re.compile(r"['\"“”‘’]")
+    token_pattern = None  # built out of TextBlob tokenizer constants on first use by compile_token_pattern
+
+    negations = ('no', 'not', 'never')
+    exclamation = '!'
+
+    def __init__(self):
+        """
+        Constructor for LexiconSentimentAnalyzer. Lexicon is loaded on first use.
+        """
+
+        self.vocabulary = None
+
+    def polarities(self, texts: list[str]) -> np.ndarray:
+        if self.vocabulary is None:
+            self.load_lexicon()
+
+        tokens_per_text = [self.tokenize(text) for text in texts]
+        tokens = list(map(str.lower, chain.from_iterable(tokens_per_text)))
+
+        # dictionary lookups and lengths are computed by builtins, all the rest is done with arrays
+        ids = np.fromiter(map(self.vocabulary.get, tokens, repeat(0)), dtype=np.int32, count=len(tokens))
+        lengths = np.fromiter(map(len, tokens), dtype=np.int32, count=len(tokens))
+        documents = np.repeat(np.arange(len(texts)), [len(text_tokens) for text_tokens in tokens_per_text])
+
+        return self.score_tokens(ids, lengths, documents, len(texts))
+
+    def tokenize(self, text: str) -> list[str]:
+        if self.token_pattern is None:
+            LexiconSentimentAnalyzer.token_pattern = compile_token_pattern()
+        text = self.contraction_pattern.sub(r' \1', text)
+        text = self.separator_pattern.sub(' ', text)
+        return self.token_pattern.findall(text)
+
+    def load_lexicon(self) -> None:
+        """
+        Builds vocabulary and feature arrays out of TextBlob polarity lexicon.
+        """
+
+        from textblob.en import sentiment as lexicon
+        if not dict.__len__(lexicon):
+            lexicon.load()
+
+        words = [word for word in dict.keys(lexicon) if word not in self.negations]
+        special = [*self.negations, self.exclamation]
+        size = len(words) + len(special) + 1  # index 0 is for unknown words
+
+        self.known = np.zeros(size, dtype=bool)
+        self.polarity = np.zeros(size, dtype=np.float64)
+        self.intensity = np.ones(size, dtype=np.float64)
+        self.modifier = np.zeros(size, dtype=bool)
+        self.ends_with_ly = np.zeros(size, dtype=bool)
+        self.negation = np.zeros(size, dtype=bool)
+        self.is_exclamation = np.zeros(size, dtype=bool)
+
+        vocabulary = {}
+        for index, word in enumerate(words, 1):
+            vocabulary[word] = index
+            self.known[index] = True
+            self.polarity[index], _, self.intensity[index] = lexicon[word][None]
+            self.modifier[index] = any(pos in lexicon[word] for pos in lexicon.modifiers)
+            self.ends_with_ly[index] = word.endswith('ly')
+        for index, word in enumerate(special, len(words) + 1):
+            vocabulary[word] = index
+        self.negation[[vocabulary[word] for word in self.negations]] = True
+        self.is_exclamation[vocabulary[self.exclamation]] = True
+
+        self.vocabulary = vocabulary
+
+    def score_tokens(self, ids: np.ndarray, lengths: np.ndarray, documents: np.ndarray, count: int) -> np.ndarray:
+        """
+        Computes polarities of documents out of their tokens.
+        Every TextBlob rule, which depends on preceding words, is computed as the position of the last preceding
+        token, which changes the state of the rule, so all tokens are processed at once.
+
+        :param ids: vocabulary indices of tokens of all documents.
+        :param lengths: lengths of tokens.
+        :param documents: index of document of every token.
+        :param count: number of documents.
+        :return: array of polarities of documents.
+        """
+
+        known = self.known[ids]
+        if not known.any():
+            return np.zeros(count, dtype=np.float64)
+
+        positions = np.arange(len(ids))
+
+        def last_before(mask: np.ndarray) -> np.ndarray:
+            # position of the last preceding token of the same document, for which mask is True, -1 if there is none
+            last = np.maximum.accumulate(np.where(mask, positions, -1))
+            last = np.concatenate(([-1], last[:-1]))
+            return np.where((last >= 0) & (documents[np.maximum(last, 0)] == documents), last, -1)
+
+        def at(values: np.ndarray, index: np.ndarray) -> np.ndarray:
+            # values at positions, False or 0 for -1 positions
+            return np.where(index >= 0, values[np.maximum(index, 0)], 0).astype(values.dtype)
+
+        unknown_negation = self.negation[ids] & ~known
+
+        # modifier ("very good") is kept across unknown words of up to 2 characters,
+        # unknown negation after modifier ending with "ly" ("really not good") negates modifier's assessment
+        modifier_events = known | ((lengths > 2) & ~unknown_negation)
+        last_known = last_before(known)
+        last_event = last_before(modifier_events)
+        negates_modifier = unknown_negation & at(self.modifier[ids], last_event) & \
+            at(self.ends_with_ly[ids], last_event)
+        modifier_events |= (lengths > 2) & unknown_negation & ~negates_modifier
+        last_event = last_before(modifier_events)
+        modified = at(self.modifier[ids], last_event) & at(known, last_event)
+
+        # negation ("not good") is kept across unknown words of 1 character
+        last_event = last_before(known | (lengths > 1))
+        negated = at(self.negation[ids] & ~negates_modifier, last_event)
+
+        # every known word either starts new assessment or, if it is modified, is merged into the previous one
+        words = np.flatnonzero(known)
+        merged = modified[words]
+        starts = ~merged
+        groups = np.cumsum(starts) - 1
+        word_negated = negated[words]
+        intensity = self.intensity[ids[words]]
+        intensity = np.where(word_negated, 1.0 / intensity, intensity)
+
+        previous = np.searchsorted(words, last_known[words])  # index of previous known word in words
+        polarity = self.polarity[ids[words]]
+        polarity = np.where(merged, np.clip(polarity * intensity[np.maximum(previous, 0)], -1.0, 1.0), polarity)
+
+        # exclamation marks boost assessment of the last known word before them
+        group_of_position = np.full(len(ids), -1)
+        group_of_position[words] = groups
+        exclamations = np.flatnonzero(self.is_exclamation[ids])
+        exclamations = exclamations[last_known[exclamations] >= 0]
+        boosts = np.bincount(np.searchsorted(words, last_known[exclamations]), minlength=len(words))
+
+        # assessment polarity is the polarity of its last word, it is negated if any of its words is negated
+        last_words = np.concatenate((starts[1:], [True]))
+        scores = np.clip(polarity[last_words] * 1.25 ** boosts[last_words], -1.0, 1.0)
+        group_negated = np.bincount(groups, weights=word_negated, minlength=len(scores)) > 0
+        group_negated[group_of_position[last_known[negates_modifier]]] = True
+        scores = np.where(group_negated, scores * -0.5, scores)
+
+        # document polarity is average polarity of its assessments
+        group_documents = documents[words[starts]]
+        totals = np.bincount(group_documents, weights=scores, minlength=count)
+        sizes = np.bincount(group_documents, minlength=count)
+        return totals / np.maximum(sizes, 1)
+
+
+def compile_token_pattern() -> re.Pattern:
+    """
+    Compiles pattern of tokens of TextBlob tokenizer out of its punctuation and abbreviations.
+
+    :return: compiled regular expression, which finds all tokens of text.
+    """
+
+    from textblob._text import ABBREVIATIONS, PUNCTUATION
+
+    punctuation = re.escape(PUNCTUATION)
+    abbreviations = '|'.join(map(re.escape, sorted(ABBREVIATIONS, key=len, reverse=True)))
+    return re.compile(
+        rf'(?<![^\s{punctuation}])(?:(?:[A-Za-z]\.)+|[A-Z][bcdfghjklmnpqrstvwxz]+\.|{abbreviations})'
+        rf'(?=[{re.escape(PUNCTUATION.replace(".", ""))}]*(?:\s|$))'
+        rf'|\.\.\.|!|[^\s{punctuation}](?:\S*[^\s{punctuation}])?')
@@ -0,0 +1,321 @@
+import json
+import os
+from concurrent.futures import Future
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import BoundedSemaphore, Lock
+from typing import Callable, TypeVar
+from urllib.parse import parse_qs, urlsplit
+
+from Backend.analysis import TextAnalyzer, default_analyzer
+from Backend.api_keys import news_api_key, event_registry_api_key
+from Backend.article_store import ArticleStore, with_article_store
+from Backend.data_providers import DataProvider, NewsApiDataProvider, EventRegistryDataProvider
+from Backend.feed_snapshots import FeedSnapshot, FeedSnapshotStore
+from Backend.main import get_analysis
+from Backend.metrics import PrometheusSink, capture_profile, default_metrics
+from Backend.score_cache import ScoreCache
+
+T = TypeVar('T')
+
+
+class ServiceBusyError(Exception):
+    """
+    Raised when analysis service has too many requests waiting for computation.
+    """
+
+
+class AnalysisService:
+    """
+    Long-running analysis service, which keeps data providers clients and NLP models warm between requests.
+    Identical requests, which are computed at the same time, are coalesced into one computation.
+    At most max_concurrent computations run at once, other ones wait in queue of at most max_queued requests.
+
+    Attributes:
+    - data_providers (list[DataProvider]): Providers, from which data is loaded.
+    - article_store (ArticleStore): Store of all articles, loaded by providers, None if they aren't stored.
+    - provider_timeout (float): Max number of seconds to wait for every data provider, None to wait without limit.
+    - allow_partial_results (bool): If True, results are built from data of providers, that responded successfully.
+    - score_cache (ScoreCache): Cache of NLP analysis results, shared by all requests.
+    - analyzer (TextAnalyzer): NLP analyzer of texts.
+    - max_concurrent (int): Max number of computations running at once.
+    - max_queued (int): Max number of computations waiting for free slot.
+    - feed_snapshots (FeedSnapshotStore): Serialized RSS Feeds, which are rebuilt only when their articles change.
+    - profile_directory (str): Directory, where profiles of requests with profile=1 are saved, None to disable them.
+    - computations (int): Number of started computations, coalesced requests don't count.
+    """
+
+    def __init__(
+            self,
+            data_providers: list[DataProvider],
+            provider_timeout: float = None,
+            allow_partial_results: bool = False,
+            score_cache: ScoreCache = None,
+            analyzer: TextAnalyzer = default_analyzer,
+            max_concurrent: int = 4,
+            max_queued: int = 16,
+            feed_max_age: float = 0,
+            profile_directory: str = None,
+            article_store: ArticleStore = None):
+        """
+        Constructor for AnalysisService.
+
+        :param data_providers: providers, from which data is loaded.
+        :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+        :param allow_partial_results: if True, results are built from data of providers, that responded successfully,
+         otherwise error of the first failed provider is returned.
+        :param score_cache: cache of NLP analysis results, shared by all requests, None to create in-memory one.
+        :param analyzer: NLP analyzer of texts.
+        :param max_concurrent: max number of computations running at once.
+        :param max_queued: max number of computations waiting for free slot, other requests are rejected.
+        :param feed_max_age: number of seconds, during which RSS Feed is served without reloading its articles.
+        :param profile_directory: directory, where cProfile profiles of requests with profile=1 are saved,
+         None to ignore profile parameter, as profiling slows requests down.
+        :param article_store: store, where all articles, loaded by providers, are kept for local queries,
+         None to not store them.
+        """
+
+        self.article_store = article_store
+        if article_store is not None:
+            data_providers = with_article_store(data_providers, article_store)
+        self.data_providers = data_providers
+        self.provider_timeout = provider_timeout
+        self.allow_partial_results = allow_partial_results
+        self.score_cache = score_cache if score_cache is not None else ScoreCache()
+        self.analyzer = analyzer
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.feed_snapshots = FeedSnapshotStore(data_providers, provider_timeout, allow_partial_results, feed_max_age)
+        self.profile_directory = profile_directory
+        self.computations = 0
+
+        self.lock = Lock()
+        self.slots = BoundedSemaphore(max_concurrent)
+        self.in_flight = {}  # futures of running and queued computations by request key
+
+    def get_analysis(self, keyword: str, min_post_date: date, max_items_per_provider: int, profile: bool = False) \
+            -> dict:
+        """
+        Returns NLP analysis of articles in the format of get_analysis result.
+
+        :param keyword: keyword/phrase to do search on.
+        :param min_post_date: minimum published date for articles.
+        :param max_items_per_provider: max number of articles to retrieve from every data providers.
+        :param profile: if True and profile_directory is set, computation is profiled with cProfile.
+        :return: dictionary in the format of get_analysis result.
+        """
+
+        def compute() -> dict:
+            return get_analysis(
+                keyword,
+                min_post_date,
+                self.data_providers,
+                max_items_per_provider,
+                self.provider_timeout,
+                self.allow_partial_results,
+                self.score_cache,
+                analyzer=self.analyzer,
+                deduplicate=True)
+
+        key = ('analysis', keyword, min_post_date, max_items_per_provider)
+        if not profile or self.profile_directory is None:
+            return self.run(key, compute)
+
+        # profiled requests are not joined with regular ones, so their computation runs in profiled thread,
+        # concurrent profiled requests wait for each other in capture_profile
+        def compute_profiled() -> dict:
+            path = os.path.join(self.profile_directory, f'analysis-{datetime.now():%Y%m%d-%H%M%S-%f}.prof')
+            with capture_profile(path):
+                return compute()
+
+        return self.run(key + ('profile',), compute_profiled)
+
+    def get_feed(self, keyword: str, min_post_date: date, max_items_per_provider: int, your_link: str) -> str:
+        """
+        Returns RSS Feed of articles.
+
+        :param keyword: keyword/phrase to do search on.
+        :param min_post_date: minimum published date for articles.
+        :param max_items_per_provider: max number of articles to retrieve from every data providers.
+        :param your_link: link to you RSS feed page.
+        :return: RSS Feed string
+        """
+
+        return self.get_feed_snapshot(keyword, min_post_date, max_items_per_provider, your_link).body.decode('utf-8')
+
+    def get_feed_snapshot(
+            self,
+            keyword: str,
+            min_post_date: date,
+            max_items_per_provider: int,
+            your_link: str) -> FeedSnapshot:
+        """
+        Returns serialized RSS Feed of articles with its ETag and Last-Modified validators.
+
+        :param keyword: keyword/phrase to do search on.
+        :param min_post_date: minimum published date for articles.
+        :param max_items_per_provider: max number of articles to retrieve from every data providers.
+        :param your_link: link to you RSS feed page.
+        :return: FeedSnapshot object.
+        """
+
+        return self.run(
+            ('feed', keyword, min_post_date, max_items_per_provider, your_link),
+            lambda: self.feed_snapshots.get_snapshot(keyword, min_post_date, max_items_per_provider, your_link))
+
+    def run(self, key: tuple, compute: Callable[[], T]) -> T:
+        """
+        Returns result of computation of request, joining identical computation, if it is already running or queued.
+
+        :param key: key, identifying request.
+        :param compute: function, computing result of request.
+        :return: result of computation.
+        """
+
+        with self.lock:
+            future = self.in_flight.get(key)
+            joined = future is not None
+            if not joined:
+                # in_flight holds both running and queued computations
+                if len(self.in_flight) >= self.max_concurrent + self.max_queued:
+                    raise ServiceBusyError(f'{self.max_queued} requests are already waiting')
+                future = self.in_flight[key] = Future()
+
+        if joined:
+            return future.result()
+
+        try:
+            with self.slots:
+                with self.lock:
+                    self.computations += 1
+                future.set_result(compute())
+        except Exception as error:
+            future.set_exception(error)
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+
+        return future.result()
+
+    def warm_up(self) -> None:
+        """
+        Loads NLP models, so the first request doesn't wait for them.
+        """
+
+        self.analyzer.score_batch(['Warm up text for news analysis.'])
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handler of HTTP requests to analysis service:
+    - GET /analysis?keyword=...&min_date=YYYY-MM-DD&max_items=100 returns get_analysis result as JSON.
+    - GET /feed?keyword=...&min_date=YYYY-MM-DD&max_items=100 returns RSS Feed with ETag and Last-Modified headers,
+      conditional requests with If-None-Match or If-Modified-Since are answered with 304, if feed didn't change.
+    - GET /metrics returns metrics of analysis stages in Prometheus text format, if sink of default_metrics
+      is PrometheusSink.
+    Analysis requests with profile=1 are profiled, if service has profile directory.
+    """
+
+    server: 'AnalysisServer'
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == '/metrics':
+            self.send_metrics()
+            return
+
+        if url.path not in ('/analysis', '/feed'):
+            self.send_text(404, 'text/plain', f'Unknown path {url.path}')
+            return
+
+        try:
+            query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            keyword = query['keyword']
+            min_post_date = date.fromisoformat(query['min_date'])
+            max_items = int(query.get('max_items', 100))
+        except (KeyError, ValueError) as error:
+            self.send_text(400, 'text/plain', f'Invalid query: {error!r}')
+            return
+
+        service = self.server.service
+        try:
+            if url.path == '/analysis':
+                analysis = service.get_analysis(keyword, min_post_date, max_items, query.get('profile') == '1')
+                self.send_text(200, 'application/json', json.dumps(analysis, default=date.isoformat))
+            else:
+                self.send_feed(service.get_feed_snapshot(keyword, min_post_date, max_items, self.path))
+        except ServiceBusyError as error:
+            self.send_text(503, 'text/plain', str(error))
+        except Exception as error:
+            self.send_text(502, 'text/plain', f'Analysis failed: {error!r}')
+
+    def send_metrics(self) -> None:
+        sink = default_metrics.sink
+        if not isinstance(sink, PrometheusSink):
+            self.send_text(404, 'text/plain', 'Metrics are not collected')
+            return
+        self.send_text(200, 'text/plain; version=0.0.4; charset=utf-8', sink.render())
+
+    def send_feed(self, snapshot: FeedSnapshot) -> None:
+        if snapshot.is_not_modified(self.headers.get('If-None-Match'), self.headers.get('If-Modified-Since')):
+            self.send_response(304)
+            self.send_header('ETag', snapshot.etag)
+            self.send_header('Last-Modified', snapshot.last_modified_header)
+            self.end_headers()
+            return
+
+        self.send_body(200, 'application/rss+xml; charset=utf-8', snapshot.body, {
+            'ETag': snapshot.etag,
+            'Last-Modified': snapshot.last_modified_header,
+        })
+
+    def send_text(self, status: int, content_type: str, text: str) -> None:
+        self.send_body(status, content_type, text.encode('utf-8'))
+
+    def send_body(self, status: int, content_type: str, body: bytes, headers: dict[str, str] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # requests are not logged to stderr, so load tests are not slowed down by logging
+        pass
+
+
+class AnalysisServer(ThreadingHTTPServer):
+    """
+    HTTP server of analysis service, which handles every request in its own thread.
+
+    Attributes:
+    - service (AnalysisService): Service, which computes results of requests.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, service: AnalysisService, host: str = '127.0.0.1', port: int = 8000):
+        """
+        Constructor for AnalysisServer. Server starts listening, but doesn't handle requests until serve_forever.
+
+        :param service: service, which computes results of requests.
+        :param host: host to listen on.
+        :param port: port to listen on, 0 to choose free port.
+        """
+
+        super().__init__((host, port), AnalysisRequestHandler)
+        self.service = service
+
+
+if __name__ == '__main__':
+    providers = [NewsApiDataProvider(news_api_key), EventRegistryDataProvider(event_registry_api_key)]
+    default_metrics.sink = PrometheusSink()
+    analysis_service = AnalysisService(providers, provider_timeout=30, allow_partial_results=True,
+                                       article_store=ArticleStore('articles.sqlite3'))
+    analysis_service.warm_up()
+
+    with AnalysisServer(analysis_service) as server:
+        print(f'Serving on http://{server.server_address[0]}:{server.server_address[1]}')
+        server.serve_forever()
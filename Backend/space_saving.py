@@ -0,0 +1,72 @@
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+from typing import Iterable, Mapping
+
+
+class SpaceSavingCounter:
+    """
+    Approximate counter of the most frequent items (Space-Saving algorithm), which keeps counts of at most
+    2 * capacity items between updates, so its memory is bounded no matter how many items are counted.
+
+    When the number of counted items exceeds the limit, only capacity items with the largest counts are kept.
+    Items, which are counted after that, start from the largest evicted count, so every count is at least
+    the true count of item and at most the true count plus error. Every item, which true count is larger than error,
+    is kept. Counts are exact as long as no items were evicted, i.e. error is 0.
+
+    Attributes:
+    - capacity (int): Number of items with the largest counts, which are kept on eviction.
+    - counts (dict[str, int]): Counts of kept items.
+    - error (int): Largest count of evicted item, max overestimation of counts.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Constructor for SpaceSavingCounter.
+
+        :param capacity: number of items with the largest counts, which are kept on eviction.
+        """
+
+        self.capacity = capacity
+        self.counts = {}
+        self.error = 0
+
+    def update(self, items: 'Iterable[str] | Mapping[str, int] | SpaceSavingCounter') -> None:
+        """
+        Counts items. Like Counter.update, it accepts iterable of items and mapping of items to their counts.
+        Another SpaceSavingCounter is merged, adding its error to the error of this counter.
+
+        :param items: items or counts of items to add.
+        """
+
+        if isinstance(items, SpaceSavingCounter):
+            # items, which are absent in one of counters, could have up to its error count in it
+            for item, count in items.counts.items():
+                self.counts[item] = self.counts.get(item, self.error) + count
+            for item in self.counts.keys() - items.counts.keys():
+                self.counts[item] += items.error
+            self.error += items.error
+        else:
+            # items are counted by Counter first, so every distinct item is looked up once
+            if not isinstance(items, Mapping):
+                items = Counter(items)
+            for item, count in items.items():
+                self.counts[item] = self.counts.get(item, self.error) + count
+
+        if len(self.counts) > 2 * self.capacity:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Keeps only capacity items with the largest counts.
+        """
+
+        kept = dict(nlargest(self.capacity, self.counts.items(), key=itemgetter(1)))
+        self.error = max(self.error, max(count for item, count in self.counts.items() if item not in kept))
+        self.counts = kept
+
+    def items(self) -> Iterable[tuple[str, int]]:
+        return self.counts.items()
+
+    def __len__(self) -> int:
+        return len(self.counts)
@@ -0,0 +1,268 @@
+import json
+import sqlite3
+from collections import Counter
+from datetime import date, datetime, timedelta
+from threading import Lock
+
+from Backend.analysis import TextAnalyzer, default_analyzer, score_texts
+from Backend.data_providers import DataProvider
+from Backend.entries import Article
+from Backend.incremental import fetch_new_articles
+from Backend.score_cache import ScoreCache
+
+
+class TimeSeriesStore:
+    """
+    Persistent store of analysis results of keywords, aggregated into time buckets, so results of any date range,
+    like the last 7, 30 or 90 days, are answered by summing stored buckets instead of fetching and analyzing
+    articles again. Every bucket holds sentiment counts and noun phrases counts of articles published in it.
+
+    Buckets are days by default. In hourly mode articles, which providers return with publishing time,
+    are bucketed by hour, and the rest of them by day, so daily results are the same in both modes.
+
+    Like IncrementalAnalyzer, refreshes only fetch and analyze articles published since the last refresh,
+    which are loaded by fetch_new_articles.
+
+    Attributes:
+    - hourly (bool): If True, articles with known publishing time are bucketed by hour.
+    """
+
+    def __init__(self, path: str = ':memory:', hourly: bool = False):
+        """
+        Constructor for TimeSeriesStore. Creates tables if needed.
+
+        :param path: path to SQLite database file, ':memory:' to keep buckets in memory only.
+        :param hourly: if True, articles with known publishing time are bucketed by hour.
+        """
+
+        self.hourly = hourly
+
+        # store is shared by threads, so access to it is serialized with lock
+        self.lock = Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS buckets (
+                keyword TEXT, bucket TEXT, count INTEGER, positive INTEGER, neutral INTEGER, negative INTEGER,
+                PRIMARY KEY (keyword, bucket));
+            CREATE TABLE IF NOT EXISTS bucket_nouns (
+                keyword TEXT, bucket TEXT, noun TEXT, count INTEGER,
+                PRIMARY KEY (keyword, bucket, noun));
+            CREATE TABLE IF NOT EXISTS coverage (
+                keyword TEXT PRIMARY KEY, min_date TEXT, last_date TEXT, seen TEXT);
+        ''')
+        self.connection.commit()
+
+    def get_analysis(
+            self,
+            keyword: str,
+            min_post_date: date,
+            data_providers: list[DataProvider],
+            max_items_per_provider: int,
+            provider_timeout: float = None,
+            allow_partial_results: bool = False,
+            score_cache: ScoreCache = None,
+            analyzer: TextAnalyzer = default_analyzer,
+            top_nouns: int = 20,
+            deduplicate: bool = False) -> dict:
+        """
+        Loads articles published since the last refresh of keyword from data providers, does NLP analysis on them,
+        adds results to buckets of keyword and returns summary results of analysis since min_post_date.
+        If deduplicate is True, duplicate articles, which different providers return in the same refresh,
+        are analyzed once.
+
+        :param keyword: keyword/phrase to do search on.
+        :param min_post_date: minimum published date for articles.
+        :param data_providers: list of DataProvider object, from which data must be loaded.
+        :param max_items_per_provider: max number of articles to retrieve from every data providers.
+        :param provider_timeout: max number of seconds to wait for every data provider, None to wait without limit.
+        :param allow_partial_results: if True, analysis is done on data of providers, that responded successfully,
+         otherwise error of the first failed provider is raised.
+        :param score_cache: cache of NLP analysis results of article texts, None to analyze every text.
+        :param analyzer: NLP analyzer of texts.
+        :param top_nouns: number of the most common noun phrases in result.
+        :param deduplicate: if True, duplicate articles are dropped before analysis.
+        :return: dictionary in the format of get_analysis result.
+        """
+
+        # buckets can't be reused, if they don't cover requested date range
+        coverage = self.get_coverage(keyword)
+        reset = coverage is None or min_post_date < coverage[0]
+        min_date, last_date, seen = (min_post_date, None, set()) if reset else coverage
+        refresh = fetch_new_articles(keyword, min_date, last_date, seen, data_providers, max_items_per_provider,
+                                     provider_timeout, allow_partial_results, deduplicate)
+
+        # new articles are analyzed at once
+        polarities, noun_phrases = score_texts([article.text for article in refresh.articles], score_cache, analyzer)
+
+        with self.lock:
+            if reset:
+                self.clear(keyword)
+            self.add(keyword, [self.get_bucket(article) for article in refresh.articles], polarities.tolist(),
+                     noun_phrases)
+            self.connection.execute(
+                'INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?)',
+                (keyword, min_date.isoformat(), refresh.last_date and refresh.last_date.isoformat(),
+                 json.dumps(sorted(refresh.seen))))
+            result = self.summarize(keyword, min_post_date, None, top_nouns)
+
+            # partial results are not saved, see Refresh.complete
+            if refresh.complete:
+                self.connection.commit()
+            else:
+                self.connection.rollback()
+
+        return result | refresh.get_result_info()
+
+    def summary(self, keyword: str, min_date: date = None, max_date: date = None, top_nouns: int = 20) -> dict:
+        """
+        Sums stored buckets of keyword in date range without loading any articles.
+
+        :param keyword: keyword/phrase to summarize.
+        :param min_date: minimum publishing date of articles to summarize, None for no lower bound.
+        :param max_date: maximum publishing date of articles to summarize, None for no upper bound.
+        :param top_nouns: number of the most common noun phrases in result.
+        :return: dictionary in the format of get_analysis result without 'duplicates' and 'failed_providers' keys.
+        """
+
+        with self.lock:
+            return self.summarize(keyword, min_date, max_date, top_nouns)
+
+    def hourly_series(self, keyword: str, min_date: date = None, max_date: date = None) -> dict:
+        """
+        Returns sentiment counts of keyword by hour. Articles, which providers returned without publishing time,
+        are not included.
+
+        :param keyword: keyword/phrase to return series of.
+        :param min_date: minimum publishing date of articles, None for no lower bound.
+        :param max_date: maximum publishing date of articles, None for no upper bound.
+        :return: dictionary in format:
+         {
+            'hours': [datetime.datetime],
+            'count': [int],
+            'positive': [int],
+            'negative': [int],
+            'neutral': [int],
+         }
+        """
+
+        if not self.hourly:
+            raise ValueError('Store keeps daily buckets only')
+
+        condition, parameters = self.get_range_condition(keyword, min_date, max_date)
+        with self.lock:
+            rows = self.connection.execute(
+                f'SELECT bucket, count, positive, negative, neutral FROM buckets '
+                f'WHERE {condition} AND length(bucket) = 13 ORDER BY bucket', parameters).fetchall()
+
+        return {
+            'hours': [datetime.strptime(row[0], '%Y-%m-%dT%H') for row in rows],
+            'count': [row[1] for row in rows],
+            'positive': [row[2] for row in rows],
+            'negative': [row[3] for row in rows],
+            'neutral': [row[4] for row in rows],
+        }
+
+    def add(self, keyword: str, buckets: list[str], polarities: list[float], noun_phrases: list[list[str]]) -> None:
+        """
+        Adds analysis results of articles to buckets of keyword. Caller must hold the lock and commit.
+
+        :param keyword: keyword/phrase, articles were loaded for.
+        :param buckets: bucket of every article, built by get_bucket.
+        :param polarities: sentiment polarities of articles texts.
+        :param noun_phrases: noun phrases, recognized in every article text.
+        """
+
+        # counts are summed in memory first, so every bucket is written once
+        counts = {}
+        nouns = Counter()
+        for bucket, polarity, text_noun_phrases in zip(buckets, polarities, noun_phrases):
+            bucket_counts = counts.setdefault(bucket, [0, 0, 0, 0])
+            bucket_counts[0] += 1
+            bucket_counts[1 if polarity > 0.2 else 3 if polarity < -0.2 else 2] += 1
+            nouns.update((bucket, noun) for noun in text_noun_phrases)
+
+        self.connection.executemany(
+            'INSERT INTO buckets VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (keyword, bucket) DO UPDATE SET '
+            'count = count + excluded.count, positive = positive + excluded.positive, '
+            'neutral = neutral + excluded.neutral, negative = negative + excluded.negative',
+            [(keyword, bucket, *bucket_counts) for bucket, bucket_counts in counts.items()])
+        self.connection.executemany(
+            'INSERT INTO bucket_nouns VALUES (?, ?, ?, ?) ON CONFLICT (keyword, bucket, noun) DO UPDATE SET '
+            'count = count + excluded.count',
+            [(keyword, bucket, noun, count) for (bucket, noun), count in nouns.items()])
+
+    def summarize(self, keyword: str, min_date: date | None, max_date: date | None, top_nouns: int) -> dict:
+        # hourly buckets start with date of their day, so both kinds of buckets are summed by date
+        condition, parameters = self.get_range_condition(keyword, min_date, max_date)
+        daily = self.connection.execute(
+            f'SELECT substr(bucket, 1, 10) AS day, SUM(count), SUM(positive), SUM(negative), SUM(neutral) '
+            f'FROM buckets WHERE {condition} GROUP BY day ORDER BY day', parameters).fetchall()
+
+        # order nouns with equal counts alphabetically, like AnalysisAccumulator does
+        most_common_nouns = self.connection.execute(
+            f'SELECT noun, SUM(count) AS total FROM bucket_nouns WHERE {condition} '
+            f'GROUP BY noun ORDER BY total DESC, noun LIMIT ?', parameters + [top_nouns]).fetchall()
+
+        return {
+            'total': {
+                'count': sum(row[1] for row in daily),
+                'positive': sum(row[2] for row in daily),
+                'negative': sum(row[3] for row in daily),
+                'neutral': sum(row[4] for row in daily)
+            },
+            'daily': {
+                'dates': [date.fromisoformat(row[0]) for row in daily],
+                'count': [row[1] for row in daily],
+                'positive': [row[2] for row in daily],
+                'negative': [row[3] for row in daily],
+                'neutral': [row[4] for row in daily],
+            },
+            f'top{top_nouns}_nouns': {
+                'nouns': [row[0] for row in most_common_nouns],
+                'count': [row[1] for row in most_common_nouns],
+            }
+        }
+
+    def get_coverage(self, keyword: str) -> tuple[date, date | None, set[str]] | None:
+        """
+        Returns date range of articles of keyword, which are stored in buckets.
+
+        :param keyword: keyword/phrase to return coverage of.
+        :return: tuple of minimum published date of articles, high-water mark and keys of articles published on it,
+         None if keyword wasn't analyzed yet.
+        """
+
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT min_date, last_date, seen FROM coverage WHERE keyword = ?', (keyword,)).fetchone()
+        if row is None:
+            return None
+        return date.fromisoformat(row[0]), row[1] and date.fromisoformat(row[1]), set(json.loads(row[2]))
+
+    def clear(self, keyword: str) -> None:
+        for table in ('buckets', 'bucket_nouns', 'coverage'):
+            self.connection.execute(f'DELETE FROM {table} WHERE keyword = ?', (keyword,))
+
+    def get_bucket(self, article: Article) -> str:
+        """
+        Builds key of bucket, article belongs to. Keys are sorted in time order.
+
+        :param article: Article object.
+        :return: 'YYYY-MM-DD' for daily bucket or 'YYYY-MM-DDTHH' for hourly bucket.
+        """
+
+        if self.hourly and article.published_at is not None and article.published_at.date() == article.date:
+            return article.published_at.strftime('%Y-%m-%dT%H')
+        return article.date.isoformat()
+
+    @staticmethod
+    def get_range_condition(keyword: str, min_date: date | None, max_date: date | None) -> tuple[str, list]:
+        condition, parameters = 'keyword = ?', [keyword]
+        if min_date is not None:
+            condition += ' AND bucket >= ?'
+            parameters.append(min_date.isoformat())
+        if max_date is not None:
+            # hourly buckets of max_date are greater than its date, so they are bounded by the next date
+            condition += ' AND bucket < ?'
+            parameters.append((max_date + timedelta(days=1)).isoformat())
+        return condition, parameters
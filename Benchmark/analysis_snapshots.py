@@ -0,0 +1,76 @@
+import json
+import os
+from datetime import date, timedelta
+from random import Random
+from tempfile import TemporaryDirectory
+from timeit import timeit
+
+import numpy as np
+
+from Backend.analysis_snapshots import AnalysisSnapshot, ScoredArticlesRecorder
+
+articles_count = 1000000
+days = 365
+repeats = 5
+
+
+def get_directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+if __name__ == '__main__':
+    # scores of a year of articles are generated directly, so only saving and loading are measured
+    random = Random(0)
+    vocabulary = [f'noun phrase {i}' for i in range(20000)]
+    min_date = date(2024, 1, 1)
+    recorder = ScoredArticlesRecorder()
+    for start in range(0, articles_count, 1000):
+        recorder.add_batch([(min_date + timedelta(days=(start + i) * days // articles_count)).toordinal()
+                            for i in range(1000)],
+                           np.array([random.uniform(-1, 1) for _ in range(1000)]),
+                           [random.sample(vocabulary, 3) for _ in range(1000)])
+    snapshot = AnalysisSnapshot('test', min_date, recorder.summary() | {'duplicates': 0, 'failed_providers': []},
+                                recorder.to_table())
+    print(f'{articles_count} articles over {days} days')
+
+    with TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, 'snapshot')
+        json_path = os.path.join(directory, 'snapshot.json')
+
+        save_time = timeit(lambda: snapshot.save(snapshot_path), number=1)
+        print(f'snapshot: saved in {save_time:.3f}s, {get_directory_size(snapshot_path) / 2 ** 20:.1f}MB')
+
+        # the same data as JSON: analysis with ISO dates and list of [date, polarity, noun phrases] per article
+        def save_json() -> None:
+            articles = snapshot.articles
+            data = {
+                'analysis': snapshot.analysis | {'daily': snapshot.analysis['daily'] | {
+                    'dates': [d.isoformat() for d in snapshot.analysis['daily']['dates']]}},
+                'articles': [[str(articles.dates[i]), float(articles.polarities[i]), articles.get_noun_phrases(i)]
+                             for i in range(len(articles))]
+            }
+            with open(json_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file)
+
+        def load_json() -> dict:
+            with open(json_path, encoding='utf-8') as file:
+                return json.load(file)
+
+        save_time = timeit(save_json, number=1)
+        print(f'JSON: saved in {save_time:.3f}s, {os.path.getsize(json_path) / 2 ** 20:.1f}MB')
+
+        cases = [
+            ('snapshot, memory mapped', lambda: AnalysisSnapshot.load(snapshot_path)),
+            ('snapshot, read', lambda: AnalysisSnapshot.load(snapshot_path, mmap=False)),
+            ('JSON', load_json),
+        ]
+        for name, load in cases:
+            seconds = min(timeit(load, number=1) for _ in range(repeats))
+            print(f'load {name}: {seconds * 1000:.1f}ms')
+
+        # plotting needs only daily series, which are read on first access of memory mapped snapshot
+        loaded = AnalysisSnapshot.load(snapshot_path)
+        seconds = timeit(lambda: int(loaded.analysis['daily']['count'].sum()), number=1)
+        print(f'first access of daily series of memory mapped snapshot: {seconds * 1000:.2f}ms')
+        seconds = timeit(lambda: loaded.articles.to_accumulator().summary(), number=1)
+        print(f'summary rebuilt from memory mapped articles table: {seconds:.3f}s')
@@ -0,0 +1,42 @@
+import os
+from datetime import date, timedelta
+from tempfile import TemporaryDirectory
+from timeit import timeit
+
+from Backend.article_store import ArticleStore, LocalIndexDataProvider
+from Backend.entries import Article
+from Benchmark.synthetic_corpus import generate_entries
+
+corpus_size = 50000
+days = 365
+page_size = 100
+repeats = 20
+
+if __name__ == '__main__':
+    # titles have rare topic words, texts consist of a small vocabulary, so both rare and frequent tokens are queried
+    min_date = date(2024, 1, 1)
+    corpus = [Article(entry.date, f'Article {i} about topic{i % 500}', f'https://news.example.com/{i}',
+                      entry.text[:100], entry.text)
+              for i, entry in enumerate(generate_entries(corpus_size, min_date, days))]
+
+    with TemporaryDirectory() as directory:
+        store = ArticleStore(os.path.join(directory, 'articles.sqlite3'))
+        seconds = timeit(lambda: [store.add(corpus[i:i + page_size], 'stub')
+                                  for i in range(0, corpus_size, page_size)], number=1)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f'stored {store.count()} articles in pages of {page_size}: {corpus_size / seconds:.0f} articles/s, '
+              f'{size / 2 ** 20:.1f}MB')
+
+        provider = LocalIndexDataProvider(store)
+        last_month = min_date + timedelta(days=days - 30)
+        queries = [
+            ('rare word, all dates', 'topic42', min_date, 1000),
+            ('frequent word, last month', 'crisis', last_month, 100),
+            ('two frequent words, last month', 'bank crisis', last_month, 100),
+            ('frequent word, all dates', 'crisis', min_date, 100),
+        ]
+        for name, keyword, query_date, max_items in queries:
+            entries = provider.load_data(keyword, query_date, max_items)
+            seconds = min(timeit(lambda: provider.load_data(keyword, query_date, max_items), number=1)
+                          for _ in range(repeats))
+            print(f'{name:>32}: {len(entries)} entries in {seconds * 1000:.1f}ms')
@@ -0,0 +1,58 @@
+from datetime import date
+from random import Random
+from time import perf_counter
+
+from Backend.deduplication import DeduplicationIndex
+from Benchmark.synthetic_corpus import generate_entries
+
+articles_count = 50000
+checkpoints = [1000, 10000, 50000]
+duplicates_share = 0.2
+
+
+def edit(random: Random, text: str) -> str:
+    """
+    Makes near-duplicate of text, the way another outlet republishes wire story: one word is replaced
+    and credit line is appended.
+
+    :param random: random numbers generator.
+    :param text: original text.
+    :return: edited text.
+    """
+
+    words = text.split()
+    words[random.randrange(len(words))] = 'reportedly'
+    return ' '.join(words) + ' Reporting by agencies.'
+
+
+if __name__ == '__main__':
+    random = Random(0)
+    texts = [entry.text for entry in generate_entries(articles_count, date(2024, 1, 1))]
+
+    # some articles are republished by another provider under another URL
+    articles = []
+    for i, text in enumerate(texts):
+        if articles and random.random() < duplicates_share:
+            articles.append((f'https://mirror.example.com/{i}', edit(random, random.choice(articles)[1]), True))
+        else:
+            articles.append((f'https://news.example.com/{i}', text, False))
+
+    index = DeduplicationIndex()
+    found = missed = false_positives = 0
+    print(f'{articles_count} synthetic articles, {duplicates_share:.0%} near-duplicates')
+
+    start = last = perf_counter()
+    for i, (url, text, is_duplicate) in enumerate(articles, 1):
+        added = index.add(url, text)
+        found += is_duplicate and not added
+        missed += is_duplicate and added
+        false_positives += not is_duplicate and not added
+
+        if i in checkpoints:
+            now = perf_counter()
+            inserted = i - (checkpoints[checkpoints.index(i) - 1] if checkpoints.index(i) else 0)
+            print(f'{i} articles: {now - start:.2f}s total, {(now - last) / inserted * 1e6:.0f}us per insert '
+                  f'since previous checkpoint')
+            last = now
+
+    print(f'near-duplicates found: {found / (found + missed):.1%}, false positives: {false_positives}')
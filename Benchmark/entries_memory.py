@@ -0,0 +1,51 @@
+import tracemalloc
+from datetime import date, timedelta
+from time import perf_counter
+
+from Backend.entries import DataBatch, DataEntry
+
+articles_count = 100000
+
+
+class DictDataEntry:
+    # DataEntry the way it was before __slots__, with per-instance __dict__
+    def __init__(self, post_date: date, text: str):
+        self.date = post_date
+        self.text = text
+
+
+def build_dict_entries(dates: list[date], texts: list[str]) -> list[DictDataEntry]:
+    return [DictDataEntry(d, t) for d, t in zip(dates, texts)]
+
+
+def build_slotted_entries(dates: list[date], texts: list[str]) -> list[DataEntry]:
+    return [DataEntry(d, t) for d, t in zip(dates, texts)]
+
+
+def build_batch(dates: list[date], texts: list[str]) -> DataBatch:
+    return DataBatch(dates, texts)
+
+
+if __name__ == '__main__':
+    # dates and texts are shared by all containers, so only memory of containers themselves is measured
+    min_date = date(2024, 1, 1)
+    dates = [min_date + timedelta(days=i % 90) for i in range(articles_count)]
+    texts = [f'Article {i}' for i in range(articles_count)]
+
+    print(f'{articles_count} articles')
+    for name, build in [('dict entries', build_dict_entries),
+                        ('slotted entries', build_slotted_entries),
+                        ('DataBatch', build_batch)]:
+        # time and memory are measured in separate runs, because tracing slows down allocations
+        start = perf_counter()
+        container = build(dates, texts)
+        elapsed = perf_counter() - start
+        del container
+
+        tracemalloc.start()
+        container = build(dates, texts)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del container
+
+        print(f'{name:>15}: {size / articles_count:6.1f} bytes per article, built in {elapsed * 1000:6.1f}ms')
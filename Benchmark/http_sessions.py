@@ -0,0 +1,55 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import perf_counter
+
+import requests
+
+from Backend.http_session import create_session
+
+requests_count = 500
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open between requests, like API servers do
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # headers and body are written separately, so Nagle would delay responses
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        KeepAliveHandler.connections += 1
+
+    def do_GET(self) -> None:
+        body = b'{"status": "ok", "articles": []}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+if __name__ == '__main__':
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/v2/everything'
+    print(f'{requests_count} requests to local keep-alive server (no TLS, so real savings of HTTPS APIs are larger)')
+
+    session = create_session()
+    cases = [
+        ('requests.get per request', lambda: requests.get(url).json()),
+        ('shared pooled session', lambda: session.get(url).json()),
+    ]
+    for name, send in cases:
+        KeepAliveHandler.connections = 0
+        start = perf_counter()
+        for _ in range(requests_count):
+            send()
+        elapsed = perf_counter() - start
+        print(f'{name:>25}: {elapsed:.2f}s, {elapsed / requests_count * 1e3:.2f}ms per request, '
+              f'{KeepAliveHandler.connections} connections opened')
+
+    server.shutdown()
@@ -0,0 +1,97 @@
+import json
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+from collections import Counter
+from statistics import median
+from time import perf_counter
+
+# code of every entry point, importing and using only what its path needs, providers are created with fake keys
+scenarios = {
+    'import Backend.main': 'import Backend.main',
+    'feed path': '''
+from datetime import date
+from Backend.data_providers import EventRegistryDataProvider, NewsApiDataProvider
+from Backend.main import build_feed
+providers = [NewsApiDataProvider('key'), EventRegistryDataProvider('key')]
+build_feed('test', date(2024, 1, 1), [], '/articles/')
+''',
+    'analysis path': '''
+from datetime import date
+from Backend.data_providers import EventRegistryDataProvider, NewsApiDataProvider
+from Backend.main import get_analysis
+import Backend.noun_phrases
+providers = [NewsApiDataProvider('key'), EventRegistryDataProvider('key')]
+get_analysis('test', date(2024, 1, 1), [], 1)
+Backend.noun_phrases.TextBlob.load()  # imported by first analysis of texts
+''',
+    'server': 'import Backend.server',
+}
+
+heavy_packages = ('textblob', 'nltk', 'feedgenerator', 'newsapi', 'eventregistry', 'pandas')
+
+
+def run(code: str) -> tuple[float, str]:
+    """
+    Runs code in a new interpreter with -X importtime.
+
+    :param code: code to run.
+    :return: tuple of wall time of the process in seconds and its import time report.
+    """
+
+    start = perf_counter()
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                             env=os.environ | {'PYTHONPATH': os.getcwd()}, check=True)
+    return perf_counter() - start, process.stderr
+
+
+def parse_report(report: str) -> tuple[float, Counter]:
+    """
+    Parses report of -X importtime.
+
+    :param report: stderr of the process.
+    :return: tuple of total import time in seconds and import time of every top level package in seconds.
+    """
+
+    total, packages = 0, Counter()
+    for line in report.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, name = line.removeprefix('import time:').split('|')
+        packages[name.strip().split('.')[0]] += int(self_time) / 1e6
+        if not name.startswith('  '):  # modules, imported by the script itself, include time of nested imports
+            total += int(cumulative) / 1e6
+    return total, packages
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Measures cold start time of backend entry points with python -X importtime.')
+    parser.add_argument('--repeats', type=int, default=5, help='number of runs of every scenario')
+    parser.add_argument('--top', type=int, default=8, help='number of the slowest packages to show')
+    parser.add_argument('--output', help='path of JSON results')
+    arguments = parser.parse_args()
+
+    results = []
+    for name, code in scenarios.items():
+        runs = [run(code) for _ in range(arguments.repeats)]
+        reports = [parse_report(report) for _, report in runs]
+        imports = median(total for total, _ in reports)
+        packages = reports[-1][1]
+        loaded = [package for package in heavy_packages if packages[package]]
+
+        results.append({
+            'name': name,
+            'process_seconds': median(seconds for seconds, _ in runs),
+            'import_seconds': imports,
+            'packages': dict(packages.most_common(arguments.top)),
+            'heavy_packages': loaded,
+        })
+        print(f'{name:>20}: process {results[-1]["process_seconds"] * 1000:.0f}ms, imports {imports * 1000:.0f}ms, '
+              f'heavy packages: {", ".join(loaded) or "none"}')
+        print(' ' * 22 + ', '.join(f'{package} {seconds * 1000:.0f}ms'
+                                   for package, seconds in packages.most_common(arguments.top)))
+
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as file:
+            json.dump({'python': sys.version.split()[0], 'results': results}, file, indent=2)
@@ -0,0 +1,59 @@
+from datetime import date
+from time import perf_counter
+
+from Backend.analysis import TextAnalyzer
+from Backend.entries import Article
+from Backend.main import get_analysis, get_analysis_batch
+from Backend.noun_phrases import LexiconNounPhraseExtractor
+from Benchmark.stub_providers import CorpusDataProvider
+from Benchmark.synthetic_corpus import generate_entries
+
+keywords = [f'keyword{i}' for i in range(20)]
+delays = [0.05, 0.1]  # simulated latencies of providers in seconds
+corpus_size = 3000
+max_items = 300
+max_concurrent_queries = 8
+
+
+class CountingTextAnalyzer(TextAnalyzer):
+    """
+    Text analyzer, which counts analyzed texts.
+
+    Attributes:
+    - count (int): Number of analyzed texts.
+    """
+
+    def __init__(self):
+        super().__init__(noun_phrase_extractor=LexiconNounPhraseExtractor())
+        self.count = 0
+
+    def score_batch(self, texts: list[str]) -> tuple:
+        self.count += len(texts)
+        return super().score_batch(texts)
+
+
+if __name__ == '__main__':
+    min_date = date(2024, 1, 1)
+    corpus = [Article(entry.date, f'Article {i}', f'https://news.example.com/{i}', entry.text, entry.text)
+              for i, entry in enumerate(generate_entries(corpus_size, min_date))]
+    providers = [CorpusDataProvider(corpus, delay, f'stub{i}') for i, delay in enumerate(delays)]
+    print(f'{len(keywords)} keywords, {len(providers)} providers, {max_items} articles per query '
+          f'out of {corpus_size} shared ones')
+
+    analyzer = CountingTextAnalyzer()
+    analyzer.score_batch(['Warm up text.'])
+
+    analyzer.count = 0
+    start = perf_counter()
+    looped = {keyword: get_analysis(keyword, min_date, providers, max_items, analyzer=analyzer)
+              for keyword in keywords}
+    print(f'looped get_analysis: {perf_counter() - start:.2f}s, {analyzer.count} texts analyzed')
+
+    analyzer.count = 0
+    start = perf_counter()
+    batched = get_analysis_batch(keywords, min_date, providers, max_items, analyzer=analyzer,
+                                 max_concurrent_queries=max_concurrent_queries)
+    print(f'get_analysis_batch ({max_concurrent_queries} concurrent queries): {perf_counter() - start:.2f}s, '
+          f'{analyzer.count} texts analyzed')
+
+    print(f'results are identical: {looped == batched}')
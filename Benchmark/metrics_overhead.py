@@ -0,0 +1,39 @@
+from datetime import date
+from timeit import timeit
+
+from Backend.analysis import TextAnalyzer
+from Backend.entries import Article
+from Backend.main import get_analysis
+from Backend.metrics import InMemorySink, Metrics, default_metrics
+from Backend.noun_phrases import LexiconNounPhraseExtractor
+from Benchmark.stub_providers import CorpusDataProvider
+from Benchmark.synthetic_corpus import generate_entries
+
+corpus_size = 5000
+repeats = 5
+calls = 1000000
+
+if __name__ == '__main__':
+    # cost of single instrumentation call, which is paid per page or batch, not per article
+    metrics = Metrics()
+    span_time = timeit(lambda: metrics.span('test', provider='test').__enter__(), number=calls) / calls
+    increment_time = timeit(lambda: metrics.increment('test', 1, provider='test'), number=calls) / calls
+    print(f'disabled metrics: span {span_time * 1e9:.0f}ns, increment {increment_time * 1e9:.0f}ns per call')
+
+    min_date = date(2024, 1, 1)
+    corpus = [Article(entry.date, f'Article {i}', f'https://news.example.com/{i}', entry.text, entry.text)
+              for i, entry in enumerate(generate_entries(corpus_size, min_date))]
+    providers = [CorpusDataProvider(corpus, 0, f'stub{i}') for i in range(2)]
+    analyzer = TextAnalyzer(noun_phrase_extractor=LexiconNounPhraseExtractor())
+    print(f'get_analysis of {len(providers)} providers with {corpus_size} articles each')
+
+    for sink in [None, InMemorySink()]:
+        default_metrics.sink = sink
+        seconds = min(timeit(lambda: get_analysis('test', min_date, providers, corpus_size, analyzer=analyzer),
+                             number=1) for _ in range(repeats))
+        print(f'{type(sink).__name__ if sink else "disabled"}: {seconds:.3f}s')
+
+    sink = default_metrics.sink
+    for (name, labels), stats in sorted(sink.spans.items()):
+        print(f'  span {name}{dict(labels) or ""}: {stats.count // repeats} spans, '
+              f'{stats.total / repeats:.3f}s per get_analysis call')
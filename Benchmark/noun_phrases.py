@@ -0,0 +1,77 @@
+import tracemalloc
+from collections import Counter
+from datetime import date
+from heapq import nsmallest
+from time import perf_counter
+
+from textblob.exceptions import MissingCorpusError
+
+from Backend.noun_phrases import LexiconNounPhraseExtractor, NounPhraseExtractor, TextBlobNounPhraseExtractor
+from Backend.space_saving import SpaceSavingCounter
+from Benchmark.synthetic_corpus import generate_entries
+
+articles_count = 5000
+batch_size = 100
+counted_phrases = 2000000
+capacity = 1000
+
+
+def measure(extractor: NounPhraseExtractor, texts: list[str]) -> float:
+    """
+    Extracts noun phrases of texts in batches, the way get_analysis does it.
+
+    :param extractor: noun phrases extraction backend.
+    :param texts: texts of articles.
+    :return: number of analyzed articles per second.
+    """
+
+    # warm up, so time of loading lexicon or tagger isn't measured
+    extractor.extract(texts[:1])
+
+    start = perf_counter()
+    for i in range(0, len(texts), batch_size):
+        extractor.extract(texts[i:i + batch_size])
+    return len(texts) / (perf_counter() - start)
+
+
+def count(counter: Counter | SpaceSavingCounter, phrases: list[str]) -> tuple[list[str], float, int]:
+    """
+    Counts phrases and takes 20 the most common of them.
+
+    :param counter: empty counter.
+    :param phrases: phrases to count.
+    :return: tuple of the most common phrases, time of counting in seconds and peak memory in bytes.
+    """
+
+    tracemalloc.start()
+    start = perf_counter()
+    for i in range(0, len(phrases), 10000):
+        counter.update(phrases[i:i + 10000])
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return [item for item, _ in nsmallest(20, counter.items(), key=lambda item: (-item[1], item[0]))], elapsed, peak
+
+
+if __name__ == '__main__':
+    texts = [entry.text for entry in generate_entries(articles_count, date(2024, 1, 1))]
+    print(f'{articles_count} synthetic articles, batches of {batch_size}')
+
+    throughput = measure(LexiconNounPhraseExtractor(), texts)
+    print(f'LexiconNounPhraseExtractor: {throughput:.0f} articles/s')
+    try:
+        throughput = measure(TextBlobNounPhraseExtractor(), texts)
+        print(f'TextBlobNounPhraseExtractor: {throughput:.0f} articles/s')
+    except MissingCorpusError:
+        print('TextBlobNounPhraseExtractor: skipped, NLTK corpora are not downloaded')
+
+    # Zipf-like stream: a few frequent phrases and a long tail of unique ones
+    phrases = [f'phrase {i % 50}' if i % 4 else f'unique phrase {i}' for i in range(counted_phrases)]
+    print(f'\n{counted_phrases} counted phrases, {counted_phrases // 4 + 50} distinct')
+
+    expected, elapsed, peak = count(Counter(), phrases)
+    print(f'Counter: {elapsed:.2f}s, peak memory {peak / 2 ** 20:.1f} MiB')
+    top, elapsed, peak = count(SpaceSavingCounter(capacity), phrases)
+    print(f'SpaceSavingCounter({capacity}): {elapsed:.2f}s, peak memory {peak / 2 ** 20:.1f} MiB, '
+          f'top 20 agreement {len(set(top) & set(expected)) / 20:.0%}')
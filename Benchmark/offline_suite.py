@@ -0,0 +1,154 @@
+import json
+import os
+import platform
+import subprocess
+from argparse import ArgumentParser
+from datetime import date
+from statistics import median
+from time import perf_counter
+from typing import Callable
+
+from Backend.analysis import TextAnalyzer
+from Backend.data_providers import DataProvider, parse_date
+from Backend.main import get_analysis, get_feed
+from Backend.metrics import InMemorySink, default_metrics
+from Backend.noun_phrases import LexiconNounPhraseExtractor
+from Benchmark.replay_providers import ReplayEventRegistryDataProvider, ReplayNewsApiDataProvider, load_fixture
+from Benchmark.synthetic_corpus import generate_eventregistry_articles, generate_newsapi_articles
+
+synthetic_min_date = date(2024, 1, 1)
+
+
+def measure(name: str, function: Callable[[], object], repeats: int, articles: int) -> dict:
+    """
+    Runs benchmark case several times and collects its wall time and metrics of analysis stages.
+
+    :param name: name of the case.
+    :param function: function running the case once.
+    :param repeats: number of runs.
+    :param articles: number of articles, the case processes.
+    :return: JSON-serializable dictionary with results of the case.
+    """
+
+    sink = default_metrics.sink = InMemorySink()
+    times = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+
+    # stages are averaged over runs, counters are divided into values of single run
+    stages, counters = {}, {}
+    for (stage, labels), stats in sorted(sink.spans.items()):
+        key = stage + ''.join(f'[{value}]' for _, value in labels)
+        stages[key] = {'seconds': stats.total / repeats, 'calls': stats.count // repeats}
+    for (counter, labels), value in sorted(sink.counters.items()):
+        counters[counter + ''.join(f'[{value}]' for _, value in labels)] = value / repeats
+
+    return {
+        'name': name,
+        'articles': articles,
+        'seconds': {'min': min(times), 'median': median(times), 'max': max(times)},
+        'articles_per_second': articles / median(times),
+        'stages': stages,
+        'counters': counters,
+    }
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """
+    Prints change of median time of every case against baseline results.
+
+    :param results: results of current run.
+    :param baseline: results of previous run, written by this script.
+    """
+
+    baseline_cases = {case['name']: case for case in baseline['results']}
+    print(f'\ncompared with {baseline.get("commit") or "baseline"}:')
+    for case in results['results']:
+        previous = baseline_cases.get(case['name'])
+        if previous is not None:
+            change = case['seconds']['median'] / previous['seconds']['median'] - 1
+            print(f'{case["name"]:>28}: {previous["seconds"]["median"]:.3f}s -> {case["seconds"]["median"]:.3f}s '
+                  f'({change:+.1%})')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Benchmarks providers, analysis and feed on replayed API payloads.')
+    parser.add_argument('--articles', type=int, default=1000, help='number of synthetic articles per provider')
+    parser.add_argument('--latency', type=float, default=0.2, help='simulated latency of every page in seconds')
+    parser.add_argument('--repeats', type=int, default=3, help='number of runs of every case')
+    parser.add_argument('--fixtures', help='directory with newsapi.json and eventregistry.json, '
+                                           'recorded by record_fixtures.py, instead of synthetic articles')
+    parser.add_argument('--textblob', action='store_true',
+                        help='extract noun phrases with TextBlob (needs NLTK corpora) instead of lexicon extractor')
+    parser.add_argument('--output', default='benchmark_results.json', help='path of JSON results')
+    parser.add_argument('--compare', help='path of JSON results of previous run to compare with')
+    arguments = parser.parse_args()
+
+    if arguments.fixtures:
+        newsapi_articles = load_fixture(os.path.join(arguments.fixtures, 'newsapi.json'))
+        eventregistry_articles = load_fixture(os.path.join(arguments.fixtures, 'eventregistry.json'))
+        min_date = min(parse_date(article['publishedAt']) for article in newsapi_articles)
+    else:
+        newsapi_articles = generate_newsapi_articles(arguments.articles, synthetic_min_date)
+        eventregistry_articles = generate_eventregistry_articles(arguments.articles, synthetic_min_date, seed=1)
+        min_date = synthetic_min_date
+
+    news_api = ReplayNewsApiDataProvider(newsapi_articles, arguments.latency)
+    event_registry = ReplayEventRegistryDataProvider(eventregistry_articles, arguments.latency)
+    providers: list[DataProvider] = [news_api, event_registry]
+    max_items = max(len(newsapi_articles), len(eventregistry_articles))
+    total = len(newsapi_articles) + len(eventregistry_articles)
+
+    analyzer = TextAnalyzer() if arguments.textblob else TextAnalyzer(noun_phrase_extractor=LexiconNounPhraseExtractor())
+    analyzer.score_batch(['Warm up text for news analysis.'])
+
+    cases = [
+        ('newsapi.load_data', lambda: news_api.load_data('test', min_date, max_items), len(newsapi_articles)),
+        ('newsapi.load_feed', lambda: news_api.load_feed('test', min_date, max_items), len(newsapi_articles)),
+        ('eventregistry.load_data', lambda: event_registry.load_data('test', min_date, max_items),
+         len(eventregistry_articles)),
+        ('eventregistry.load_feed', lambda: event_registry.load_feed('test', min_date, max_items),
+         len(eventregistry_articles)),
+        ('get_analysis', lambda: get_analysis('test', min_date, providers, max_items, analyzer=analyzer), total),
+        ('get_feed', lambda: get_feed('test', min_date, providers, max_items, '/articles/'), total),
+    ]
+
+    results = {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {
+            'articles': {'newsapi': len(newsapi_articles), 'eventregistry': len(eventregistry_articles)},
+            'fixtures': arguments.fixtures,
+            'latency': arguments.latency,
+            'repeats': arguments.repeats,
+            'noun_phrases': 'textblob' if arguments.textblob else 'lexicon',
+        },
+        'results': [],
+    }
+
+    print(f'{total} articles, {arguments.latency}s per page, median of {arguments.repeats} runs')
+    for name, function, articles in cases:
+        case = measure(name, function, arguments.repeats, articles)
+        results['results'].append(case)
+        stages = ', '.join(f'{stage} {values["seconds"]:.3f}s' for stage, values in case['stages'].items())
+        print(f'{name:>28}: {case["seconds"]["median"]:.3f}s ({case["articles_per_second"]:.0f} articles/s); {stages}')
+    default_metrics.sink = None
+
+    with open(arguments.output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    print(f'results are written to {arguments.output}')
+
+    if arguments.compare:
+        with open(arguments.compare, encoding='utf-8') as file:
+            compare(results, json.load(file))
@@ -0,0 +1,49 @@
+import os
+import sys
+from datetime import date
+from time import perf_counter
+
+import numpy as np
+
+from Backend.analysis import AnalysisAccumulator, TextAnalyzer
+from Backend.entries import to_batches
+from Backend.parallel_scoring import ParallelScorer
+from Benchmark.synthetic_corpus import generate_entries
+
+articles_count = 3000
+
+
+class SentimentOnlyAnalyzer(TextAnalyzer):
+    # sentiment only analysis, for environments without NLTK corpora needed for noun phrases
+    def score_batch(self, texts: list[str]) -> tuple[np.ndarray, list[list[str]]]:
+        return self.sentiment_analyzer.polarities(texts), [[] for _ in texts]
+
+
+if __name__ == '__main__':
+    analyzer = SentimentOnlyAnalyzer() if '--sentiment-only' in sys.argv else TextAnalyzer()
+    entries = generate_entries(articles_count, date(2024, 1, 1))
+    print(f'{articles_count} synthetic articles, {os.cpu_count()} CPU cores, {type(analyzer).__name__}')
+
+    # analysis in current process, the way get_analysis does it without scorer
+    analyzer.score_batch([entries[0].text])
+    start = perf_counter()
+    accumulator = AnalysisAccumulator()
+    for batch in to_batches(entries, 100):
+        accumulator.add_batch(batch.dates, *analyzer.score_batch(batch.texts))
+    expected = accumulator.summary()
+    sequential_time = perf_counter() - start
+    print(f'sequential: {sequential_time:.2f}s')
+
+    workers = 1
+    while workers <= os.cpu_count():
+        with ParallelScorer(workers, analyzer=analyzer) as scorer:
+            # warm up workers, so time of starting processes and loading corpora isn't measured
+            scorer.analyze(entries[:workers * scorer.chunk_size])
+
+            start = perf_counter()
+            result = scorer.analyze(entries).summary()
+            elapsed = perf_counter() - start
+
+        assert result == expected
+        print(f'{workers:>2} workers: {elapsed:.2f}s (speedup {sequential_time / elapsed:.2f}x)')
+        workers *= 2
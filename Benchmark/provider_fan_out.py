@@ -0,0 +1,26 @@
+from datetime import date
+from time import perf_counter
+
+from Backend.fetching import fetch_from_providers
+from Benchmark.stub_providers import SleepingDataProvider
+
+delays = [0.5, 1.0, 1.5]  # simulated latencies of providers in seconds
+
+
+def load_serially(providers: list[SleepingDataProvider]) -> list:
+    # the way get_analysis loaded data before concurrent fan-out
+    return sum([provider.load_data('test', date.today(), 100) for provider in providers], [])
+
+
+def load_concurrently(providers: list[SleepingDataProvider]) -> list:
+    return fetch_from_providers(lambda provider: provider.load_data('test', date.today(), 100), providers).items
+
+
+if __name__ == '__main__':
+    stub_providers = [SleepingDataProvider(delay, f'stub{i}') for i, delay in enumerate(delays)]
+    print(f'providers latencies: {delays} (sum {sum(delays):.2f}s, max {max(delays):.2f}s)')
+
+    for name, load in [('serial', load_serially), ('concurrent', load_concurrently)]:
+        start = perf_counter()
+        items = load(stub_providers)
+        print(f'{name:>10}: {perf_counter() - start:.2f}s for {len(items)} entries')
@@ -0,0 +1,85 @@
+from datetime import date
+from time import perf_counter
+from unittest.mock import patch
+
+from pandas import DataFrame, to_datetime
+
+from Backend.data_providers import NewsApiDataProvider, EventRegistryDataProvider
+from Backend.entries import DataEntry, FeedEntry
+from Benchmark.synthetic_corpus import generate_newsapi_articles, generate_eventregistry_articles
+
+min_date = date(2024, 1, 1)
+sizes = [100, 1000, 10000]
+repeats = 5
+
+
+# reference pandas based implementations, the way providers transformed articles before
+def newsapi_load_data(articles: list[dict]) -> list[DataEntry]:
+    df = DataFrame(articles)
+    df['date'] = to_datetime(df['publishedAt']).dt.date
+    df = df[df['date'] >= min_date]
+    df['text'] = df['description'].fillna(df['content'])
+    return [DataEntry(r['date'], r['text']) for _, r in df.iterrows()]
+
+
+def newsapi_load_feed(articles: list[dict]) -> list[FeedEntry]:
+    df = DataFrame(articles)
+    df['date'] = to_datetime(df['publishedAt']).dt.date
+    df['description'] = df['description'].fillna(df['content'])
+    return [FeedEntry(r['title'], r['url'], r['description'], r['date']) for _, r in df.iterrows()]
+
+
+def eventregistry_load_data(articles: list[dict]) -> list[DataEntry]:
+    df = DataFrame(articles)
+    df['date'] = to_datetime(df['date']).dt.date
+    df = df[df['date'] >= min_date]
+    return [DataEntry(r['date'], r['body']) for _, r in df.iterrows()]
+
+
+def eventregistry_load_feed(articles: list[dict]) -> list[FeedEntry]:
+    df = DataFrame(articles)
+    df['date'] = to_datetime(df['date']).dt.date
+    return [FeedEntry(r['title'], r['url'], r['body'], r['date']) for _, r in df.iterrows()]
+
+
+def get_attributes(entry: DataEntry | FeedEntry) -> tuple:
+    return tuple(getattr(entry, attribute) for attribute in entry.__slots__)
+
+
+def measure(function, *args) -> tuple[float, list]:
+    # best of several runs, so results are less noisy
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        start = perf_counter()
+        result = function(*args)
+        best = min(best, perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    news_api_provider = NewsApiDataProvider('api key')
+    event_registry_provider = EventRegistryDataProvider('api key')
+
+    print(f'{"provider":>13} {"method":>9} {"articles":>8} {"pandas":>10} {"plain":>10} {"speedup":>8}')
+    for size in sizes:
+        newsapi_articles = generate_newsapi_articles(size, min_date)
+        eventregistry_articles = generate_eventregistry_articles(size, min_date)
+
+        # providers receive articles from fake API clients, so only transforming of articles is measured
+        with patch.object(NewsApiDataProvider, 'iter_pages', return_value=[newsapi_articles]), \
+                patch.object(EventRegistryDataProvider, 'iter_raw_articles',
+                             side_effect=lambda *args: iter(eventregistry_articles)):
+            cases = [
+                ('NewsAPI', 'load_data', newsapi_load_data, newsapi_articles, news_api_provider.load_data),
+                ('NewsAPI', 'load_feed', newsapi_load_feed, newsapi_articles, news_api_provider.load_feed),
+                ('EventRegistry', 'load_data', eventregistry_load_data, eventregistry_articles,
+                 event_registry_provider.load_data),
+                ('EventRegistry', 'load_feed', eventregistry_load_feed, eventregistry_articles,
+                 event_registry_provider.load_feed),
+            ]
+            for provider, method, reference, articles, load in cases:
+                reference_time, expected = measure(reference, articles)
+                plain_time, result = measure(load, 'test', min_date, size)
+                assert [get_attributes(e) for e in result] == [get_attributes(e) for e in expected]
+                print(f'{provider:>13} {method:>9} {size:>8} {reference_time * 1000:>8.2f}ms '
+                      f'{plain_time * 1000:>8.2f}ms {reference_time / plain_time:>7.1f}x')
@@ -0,0 +1,24 @@
+import json
+import os
+import sys
+from datetime import date, timedelta
+
+from Backend.api_keys import event_registry_api_key, news_api_key
+from Backend.data_providers import EventRegistryDataProvider, NewsApiDataProvider
+
+max_items = 1000
+
+if __name__ == '__main__':
+    # records raw API articles once, so offline_suite.py can replay real payloads without network access
+    directory = sys.argv[1] if len(sys.argv) > 1 else 'fixtures'
+    keyword = sys.argv[2] if len(sys.argv) > 2 else 'Ukraine'
+    min_date = date.today() - timedelta(days=7)
+    os.makedirs(directory, exist_ok=True)
+
+    providers = [('newsapi', NewsApiDataProvider(news_api_key)),
+                 ('eventregistry', EventRegistryDataProvider(event_registry_api_key))]
+    for name, provider in providers:
+        articles = provider.get_articles(keyword, min_date, max_items)
+        with open(os.path.join(directory, f'{name}.json'), 'w', encoding='utf-8') as file:
+            json.dump(articles, file)
+        print(f'{name}: recorded {len(articles)} articles about {keyword} since {min_date}')
@@ -0,0 +1,134 @@
+import json
+from datetime import date
+from time import sleep
+from typing import Any
+
+from Backend.data_providers import EventRegistryDataProvider, NewsApiDataProvider
+from Backend.scheduling import RequestScheduler
+
+# replayed requests are not limited, so only simulated latency and processing of pages are measured
+replay_scheduler = RequestScheduler(rate=1e6, burst=1000000)
+
+
+class ReplayNewsApiClient:
+    """
+    Fake NewsApiClient, which answers 'everything' requests with pages of recorded or synthetic articles
+    after simulated latency, the way NewsAPI pages them.
+
+    Attributes:
+    - articles (list[dict]): Articles in the format of NewsAPI 'everything' endpoint.
+    - latency (float): Number of seconds every page request takes.
+    - requests (int): Number of answered page requests.
+    """
+
+    def __init__(self, articles: list[dict], latency: float):
+        """
+        Constructor for ReplayNewsApiClient.
+
+        :param articles: articles in the format of NewsAPI 'everything' endpoint.
+        :param latency: number of seconds every page request takes.
+        """
+
+        self.articles = articles
+        self.latency = latency
+        self.requests = 0
+
+    def get_everything(self, q: str, from_param: date, page: int, page_size: int, **kwargs: Any) -> dict:
+        sleep(self.latency)
+        self.requests += 1
+        articles = [article for article in self.articles if article['publishedAt'][:10] >= from_param.isoformat()]
+        return {
+            'status': 'ok',
+            'totalResults': len(articles),
+            'articles': articles[(page - 1) * page_size:page * page_size]
+        }
+
+
+class ReplayEventRegistry:
+    """
+    Fake EventRegistry client, which answers article queries with pages of recorded or synthetic articles
+    after simulated latency, the way EventRegistry pages them.
+
+    Attributes:
+    - articles (list[dict]): Articles in the format of EventRegistry articles query.
+    - latency (float): Number of seconds every page request takes.
+    - requests (int): Number of answered page requests.
+    """
+
+    _verboseOutput = False  # read by QueryArticlesIter
+
+    def __init__(self, articles: list[dict], latency: float):
+        """
+        Constructor for ReplayEventRegistry.
+
+        :param articles: articles in the format of EventRegistry articles query.
+        :param latency: number of seconds every page request takes.
+        """
+
+        self.articles = articles
+        self.latency = latency
+        self.requests = 0
+
+    def execQuery(self, query: Any) -> dict:
+        sleep(self.latency)
+        self.requests += 1
+        parameters = query._getQueryParams()
+        page, count = parameters['articlesPage'], parameters['articlesCount']
+        articles = [article for article in self.articles if article['date'] >= parameters['dateStart']]
+        return {
+            'articles': {
+                'results': articles[(page - 1) * count:page * count],
+                'totalResults': len(articles),
+                'pages': -(-len(articles) // count)
+            }
+        }
+
+
+class ReplayNewsApiDataProvider(NewsApiDataProvider):
+    """
+    NewsApiDataProvider, which loads articles from ReplayNewsApiClient, so all paging and transforming code
+    of the provider runs without network access.
+    """
+
+    def __init__(self, articles: list[dict], latency: float, max_pages_in_flight: int = 4):
+        """
+        Constructor for ReplayNewsApiDataProvider.
+
+        :param articles: articles in the format of NewsAPI 'everything' endpoint.
+        :param latency: number of seconds every page request takes.
+        :param max_pages_in_flight: max number of pages requested at the same time.
+        """
+
+        self.client = ReplayNewsApiClient(articles, latency)
+        self.max_pages_in_flight = max_pages_in_flight
+        self.scheduler = replay_scheduler
+
+
+class ReplayEventRegistryDataProvider(EventRegistryDataProvider):
+    """
+    EventRegistryDataProvider, which loads articles from ReplayEventRegistry, so all paging and transforming code
+    of the provider runs without network access.
+    """
+
+    def __init__(self, articles: list[dict], latency: float):
+        """
+        Constructor for ReplayEventRegistryDataProvider.
+
+        :param articles: articles in the format of EventRegistry articles query.
+        :param latency: number of seconds every page request takes.
+        """
+
+        self.event_registry = ReplayEventRegistry(articles, latency)
+        self.scheduler = replay_scheduler
+
+
+def load_fixture(path: str) -> list[dict]:
+    """
+    Loads articles, recorded by record_fixtures.py.
+
+    :param path: path to JSON file with list of articles in the format of provider API.
+    :return: list of article dictionaries.
+    """
+
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
@@ -0,0 +1,46 @@
+from datetime import date
+from time import perf_counter
+
+import numpy as np
+
+from Backend.sentiment import LexiconSentimentAnalyzer, SentimentAnalyzer, TextBlobSentimentAnalyzer
+from Benchmark.synthetic_corpus import generate_entries
+
+articles_count = 5000
+batch_size = 100
+
+
+def measure(analyzer: SentimentAnalyzer, texts: list[str]) -> tuple[np.ndarray, float]:
+    """
+    Computes polarities of texts in batches, the way get_analysis does it.
+
+    :param analyzer: sentiment analysis backend.
+    :param texts: texts of articles.
+    :return: tuple of array of polarities and number of analyzed articles per second.
+    """
+
+    # warm up, so time of loading lexicon isn't measured
+    analyzer.polarities(texts[:1])
+
+    start = perf_counter()
+    polarities = np.concatenate([analyzer.polarities(texts[i:i + batch_size])
+                                 for i in range(0, len(texts), batch_size)])
+    return polarities, len(texts) / (perf_counter() - start)
+
+
+def get_buckets(polarities: np.ndarray) -> np.ndarray:
+    return np.where(polarities > 0.2, 1, np.where(polarities < -0.2, -1, 0))
+
+
+if __name__ == '__main__':
+    texts = [entry.text for entry in generate_entries(articles_count, date(2024, 1, 1))]
+    print(f'{articles_count} synthetic articles, batches of {batch_size}')
+
+    expected, reference_throughput = measure(TextBlobSentimentAnalyzer(), texts)
+    print(f'TextBlobSentimentAnalyzer: {reference_throughput:.0f} articles/s')
+
+    polarities, throughput = measure(LexiconSentimentAnalyzer(), texts)
+    print(f'LexiconSentimentAnalyzer: {throughput:.0f} articles/s (speedup {throughput / reference_throughput:.2f}x)')
+
+    print(f'max polarity difference: {np.abs(polarities - expected).max():.2e}, '
+          f'bucket agreement: {np.mean(get_buckets(polarities) == get_buckets(expected)):.2%}')
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+from statistics import quantiles
+from threading import Thread
+from time import perf_counter
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from Backend.analysis import TextAnalyzer
+from Backend.noun_phrases import LexiconNounPhraseExtractor
+from Backend.server import AnalysisServer, AnalysisService
+from Benchmark.stub_providers import SleepingDataProvider
+
+delays = [0.05, 0.1]  # simulated latencies of providers in seconds
+clients = 32
+requests_count = 1000
+keywords = [f'keyword{i}' for i in range(20)]
+
+
+def request(url: str) -> tuple[float, int]:
+    """
+    Sends GET request to analysis service.
+
+    :param url: URL of request.
+    :return: tuple of latency in seconds and HTTP status code.
+    """
+
+    start = perf_counter()
+    try:
+        with urlopen(url) as response:
+            response.read()
+            status = response.status
+    except HTTPError as error:
+        status = error.code
+    return perf_counter() - start, status
+
+
+if __name__ == '__main__':
+    providers = [SleepingDataProvider(delay, f'stub{i}') for i, delay in enumerate(delays)]
+    service = AnalysisService(
+        providers,
+        analyzer=TextAnalyzer(noun_phrase_extractor=LexiconNounPhraseExtractor()),
+        max_concurrent=8,
+        max_queued=64)
+    service.warm_up()
+
+    with AnalysisServer(service, port=0) as server:
+        Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+        random = Random(0)
+        urls = [f'{base_url}/{random.choice(["analysis", "feed"])}?keyword={random.choice(keywords)}'
+                f'&min_date=2024-01-01&max_items=100' for _ in range(requests_count)]
+
+        start = perf_counter()
+        with ThreadPoolExecutor(clients) as executor:
+            results = list(executor.map(request, urls))
+        elapsed = perf_counter() - start
+        server.shutdown()
+
+    latencies = [latency for latency, status in results if status == 200]
+    percentiles = quantiles(latencies, n=100)
+    print(f'{requests_count} requests from {clients} clients, providers latencies {delays}')
+    print(f'throughput: {requests_count / elapsed:.0f} requests/s, '
+          f'computations: {service.computations} (others were coalesced), '
+          f'rejected: {sum(status == 503 for _, status in results)}, '
+          f'failed: {sum(status not in (200, 503) for _, status in results)}')
+    print(f'latency p50: {percentiles[49] * 1000:.0f} ms, p99: {percentiles[98] * 1000:.0f} ms')
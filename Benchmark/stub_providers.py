@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+from random import Random
+from time import sleep
+
+from Backend.data_providers import DataProvider
+from Backend.entries import Article, DataEntry, FeedEntry
+
+
+class SleepingDataProvider(DataProvider):
+    """
+    Data provider stub, that simulates network latency by sleeping before returning generated articles.
+
+    Attributes:
+    - delay (float): Number of seconds every load call takes.
+    - name (str): Provider name used in generated articles.
+    """
+
+    def __init__(self, delay: float, name: str = 'stub'):
+        """
+        Constructor for SleepingDataProvider.
+
+        :param delay: number of seconds every load call takes.
+        :param name: provider name used in generated articles.
+        """
+
+        self.delay = delay
+        self.name = name
+
+    def load_data(self, keyword: str, min_published_date: date, max_items: int) -> list[DataEntry]:
+        sleep(self.delay)
+        return [DataEntry(min_published_date + timedelta(days=i % 7), f'{self.name} article {i} about {keyword}')
+                for i in range(max_items)]
+
+    def load_feed(self, keyword: str, min_published_date: date, max_items: int) -> list[FeedEntry]:
+        sleep(self.delay)
+        return [FeedEntry(f'{self.name} article {i}',
+                          f'https://{self.name}.example.com/{i}',
+                          f'{self.name} article {i} about {keyword}',
+                          min_published_date + timedelta(days=i % 7))
+                for i in range(max_items)]
+
+
+class CorpusDataProvider(DataProvider):
+    """
+    Data provider stub, that simulates network latency and returns random sample of shared corpus of articles
+    for every keyword, so articles of different keywords and providers overlap, as stories match several keywords.
+
+    Attributes:
+    - corpus (list[Article]): Articles, which are sampled.
+    - delay (float): Number of seconds every load call takes.
+    - name (str): Provider name used as a seed of samples.
+    """
+
+    def __init__(self, corpus: list[Article], delay: float, name: str = 'stub'):
+        """
+        Constructor for CorpusDataProvider.
+
+        :param corpus: articles, which are sampled.
+        :param delay: number of seconds every load call takes.
+        :param name: provider name used as a seed of samples.
+        """
+
+        self.corpus = corpus
+        self.delay = delay
+        self.name = name
+
+    def load_articles(self, keyword: str, min_published_date: date, max_items: int) -> list[Article]:
+        sleep(self.delay)
+        sample = Random(f'{self.name}:{keyword}').sample(self.corpus, min(max_items, len(self.corpus)))
+        return [article for article in sample if article.date >= min_published_date]
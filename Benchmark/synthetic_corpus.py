@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+from random import Random
+
+from Backend.entries import DataEntry
+
+# vocabulary of synthetic articles, sentiment words make polarities of articles differ
+nouns = ['government', 'economy', 'market', 'city', 'president', 'army', 'energy', 'company', 'election', 'border',
+         'minister', 'bank', 'support', 'report', 'talks', 'prices', 'people', 'region', 'agreement', 'crisis']
+adjectives = ['good', 'great', 'bad', 'terrible', 'new', 'old', 'strong', 'weak', 'important', 'difficult',
+              'happy', 'sad', 'successful', 'dangerous', 'local', 'national', 'international', 'free', 'poor', 'rich']
+verbs = ['said', 'announced', 'reported', 'rejected', 'approved', 'increased', 'decreased', 'supported', 'attacked']
+
+
+def generate_text(random: Random, sentences: int) -> str:
+    """
+    Generates text of article out of random sentences.
+
+    :param random: random numbers generator.
+    :param sentences: number of sentences in text.
+    :return: article text.
+    """
+
+    return ' '.join(f'The {random.choice(adjectives)} {random.choice(nouns)} {random.choice(verbs)} '
+                    f'{random.choice(adjectives)} {random.choice(nouns)} of the {random.choice(nouns)}.'
+                    for _ in range(sentences))
+
+
+def generate_entries(count: int, min_date: date, days: int = 7, seed: int = 0) -> list[DataEntry]:
+    """
+    Generates reproducible synthetic data entries.
+
+    :param count: number of entries.
+    :param min_date: minimum publishing date of entries.
+    :param days: number of days entries are published in.
+    :param seed: seed of random numbers generator.
+    :return: list of DataEntry objects.
+    """
+
+    random = Random(seed)
+    return [DataEntry(min_date + timedelta(days=random.randrange(days)), generate_text(random, random.randint(2, 6)))
+            for _ in range(count)]
+
+
+def generate_newsapi_articles(count: int, min_date: date, days: int = 7, seed: int = 0) -> list[dict]:
+    """
+    Generates reproducible synthetic articles in the format of NewsAPI 'everything' endpoint.
+
+    :param count: number of articles.
+    :param min_date: minimum publishing date of articles.
+    :param days: number of days articles are published in.
+    :param seed: seed of random numbers generator.
+    :return: list of article dictionaries.
+    """
+
+    random = Random(seed)
+    articles = []
+    for i in range(count):
+        published = min_date + timedelta(days=random.randrange(days))
+        text = generate_text(random, random.randint(2, 6))
+        has_description = random.random() < 0.9  # some NewsAPI articles have only content
+        articles.append({
+            'source': {'id': None, 'name': f'Source {i % 20}'},
+            'author': f'Author {i % 50}',
+            'title': f'Article {i} {text[:40]}',
+            'description': text if has_description else None,
+            'url': f'https://news{i % 20}.example.com/articles/{seed}-{i}',
+            'urlToImage': None,
+            'publishedAt': f'{published.isoformat()}T{random.randrange(24):02}:{random.randrange(60):02}:00Z',
+            'content': text + ' [+1234 chars]'
+        })
+    return articles
+
+
+def generate_eventregistry_articles(count: int, min_date: date, days: int = 7, seed: int = 0) -> list[dict]:
+    """
+    Generates reproducible synthetic articles in the format of EventRegistry articles query.
+
+    :param count: number of articles.
+    :param min_date: minimum publishing date of articles.
+    :param days: number of days articles are published in.
+    :param seed: seed of random numbers generator.
+    :return: list of article dictionaries.
+    """
+
+    random = Random(seed)
+    articles = []
+    for i in range(count):
+        published = min_date + timedelta(days=random.randrange(days))
+        time = f'{random.randrange(24):02}:{random.randrange(60):02}:00'
+        text = generate_text(random, random.randint(2, 6))
+        articles.append({
+            'uri': f'{seed}-{i}',
+            'lang': 'eng',
+            'date': published.isoformat(),
+            'time': time,
+            'dateTime': f'{published.isoformat()}T{time}Z',
+            'url': f'https://events{i % 20}.example.com/articles/{seed}-{i}',
+            'title': f'Event {i} {text[:40]}',
+            'body': text,
+            'source': {'uri': f'events{i % 20}.example.com', 'title': f'Events {i % 20}'},
+        })
+    return articles
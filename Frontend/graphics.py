@@ -1,74 +1,169 @@
-from matplotlib import gridspec, use
-from matplotlib.dates import DateFormatter
-from matplotlib.pyplot import Axes, get_current_fig_manager, figure
-
-use("TkAgg")
-
-
-def draw_graphs(keyword, data):
-    fig = figure(figsize=(10, 17))
-
-    gs = gridspec.GridSpec(2, 2, width_ratios=[2, 1], figure=fig)
-    ax1 = fig.add_subplot(gs[:, 0])
-    ax2 = fig.add_subplot(gs[0, 1])
-    ax3 = fig.add_subplot(gs[1, 1])
-
-    draw_plot(data, ax=ax1)
-    draw_pir_chart(data, ax=ax2)
-    draw_bar_chart(keyword, data, ax=ax3)
-
-    fig_manager = get_current_fig_manager()
-    fig_manager.set_window_title('NLP analysis')
-
-    fig.subplots_adjust(wspace=0.4, hspace=0.6)
-    fig.tight_layout()
-    fig.show()
-
-
-def draw_pir_chart(data: dict, ax: Axes) -> None:
-    total_count = data["total"]["count"]
-    positive_data = data["total"]["positive"]
-    negative_data = data["total"]["negative"]
-    neutral_data = data["total"]["neutral"]
-
-    exp = (0.1, 0.1, 0.3)
-    sizes = [positive_data, negative_data, neutral_data]
-    labels = ['Positive', 'Negative', 'Neutral']
-    labels_with_count = [f"{label}: {size}" for label, size in zip(labels, sizes)]
-    colors = ['#00FF00', '#FF4500', '#00FFFF']
-
-    ax.pie(sizes, labels=labels_with_count, colors=colors, autopct='%1.1f%%', explode=exp)
-    ax.set_title(f"Total sentiment distribution of {total_count} articles")
-
-
-def draw_bar_chart(keyword: str, data: dict, ax: Axes) -> None:
-    nouns_data = data["top20_nouns"]["nouns"]
-    count_data = data["top20_nouns"]["count"]
-
-    ax.bar(nouns_data, count_data, color='skyblue')
-    ax.set_xticks(range(len(nouns_data)))
-    ax.set_xticklabels(nouns_data, rotation=35, ha='right', fontsize=8)
-    ax.set_title(f'Top 20 Nouns, associated with {keyword} by frequency of mentioning')
-    ax.set_xlabel('Nouns')
-    ax.set_ylabel('Frequency')
+from math import cos, radians, sin
 
+from matplotlib import gridspec, use
+from matplotlib.dates import AutoDateLocator, DateFormatter
+from matplotlib.pyplot import Axes, Figure, figure, fignum_exists
 
-def draw_plot(data: dict, ax: Axes) -> None:
-    dates_data = data["daily"]["dates"]
-    total_count_data = data["daily"]["count"]
-    positive_data = data["daily"]["positive"]
-    negative_data = data["daily"]["negative"]
-    neutral_data = data["daily"]["neutral"]
+from Backend.analysis_snapshots import AnalysisSnapshot, get_top_nouns_key
 
-    ax.plot(dates_data, total_count_data, label='Total Count', color='black', linestyle='-')
-    ax.plot(dates_data, positive_data, label='Positive', color='#00FF00', linestyle='--')
-    ax.plot(dates_data, negative_data, label='Negative', color='#FF4500', linestyle='-.')
-    ax.plot(dates_data, neutral_data, label='Neutral', color='#00FFFF', linestyle=':')
+use("TkAgg")
 
-    ax.set_xlabel('Date')
-    ax.set_ylabel('Number of Publications')
-    ax.set_title(" Sentiment Breakdown of Daily Publications")
-    ax.grid(True)
-    ax.legend()
-    ax.set_xticklabels(dates_data, rotation=25, ha='right', fontsize=10)
-    ax.xaxis.set_major_formatter(DateFormatter('%d-%m-%Y'))
+sentiments = ['positive', 'negative', 'neutral']
+sentiment_labels = ['Positive', 'Negative', 'Neutral']
+sentiment_colors = ['#00FF00', '#FF4500', '#00FFFF']
+pie_explode = (0.1, 0.1, 0.3)
+
+
+class Dashboard:
+    """
+    Window with daily sentiment plot, total sentiment pie chart and top nouns bar chart. The figure and its artists
+    are created once and updated in place, so partial results can be redrawn many times while analysis runs.
+
+    Attributes:
+    - top_nouns (int): Number of bars of nouns chart.
+    - figure (Figure): Figure of the dashboard, None until results are shown.
+    - lines (list[Line2D]): Lines of total, positive, negative and neutral daily counts.
+    - wedges (list[Wedge]): Wedges of pie chart in the order of sentiments.
+    - pie_labels (list[Text]): Labels of wedges with counts.
+    - pie_percents (list[Text]): Percents of wedges.
+    - bars (BarContainer): Bars of nouns chart.
+    """
+
+    def __init__(self, top_nouns: int = 20):
+        """
+        Constructor for Dashboard. Figure is created, when results are shown for the first time.
+
+        :param top_nouns: number of bars of nouns chart.
+        """
+
+        self.top_nouns = top_nouns
+        self.figure = None
+        self.lines = []
+        self.wedges = []
+        self.pie_labels = []
+        self.pie_percents = []
+        self.bars = None
+
+    def show(self, keyword: str, data: dict, partial: bool = False) -> None:
+        """
+        Shows results of analysis, opening the window again if it was closed.
+
+        :param keyword: keyword/phrase, the analysis is done for.
+        :param data: dictionary in the format of get_analysis result.
+        :param partial: True if analysis is still running and more results are coming.
+        """
+
+        created = self.figure is None or not fignum_exists(self.figure.number)
+        if created:
+            self.create_figure()
+
+        self.update_plot(data)
+        self.update_pie_chart(data)
+        self.update_bar_chart(keyword, data)
+        self.figure.suptitle('Partial results, analysis is running...' if partial else '')
+
+        if created:
+            self.figure.tight_layout()
+            self.figure.show()
+        else:
+            self.figure.canvas.draw_idle()
+
+    def create_figure(self) -> Figure:
+        self.figure = figure(figsize=(10, 17))
+        self.figure.canvas.manager.set_window_title('NLP analysis')
+
+        gs = gridspec.GridSpec(2, 2, width_ratios=[2, 1], figure=self.figure)
+        self.draw_plot(self.figure.add_subplot(gs[:, 0]))
+        self.draw_pie_chart(self.figure.add_subplot(gs[0, 1]))
+        self.draw_bar_chart(self.figure.add_subplot(gs[1, 1]))
+
+        self.figure.subplots_adjust(wspace=0.4, hspace=0.6)
+        return self.figure
+
+    def draw_plot(self, ax: Axes) -> None:
+        ax.xaxis_date()
+        self.lines = [
+            ax.plot([], [], label='Total Count', color='black', linestyle='-')[0],
+            ax.plot([], [], label='Positive', color=sentiment_colors[0], linestyle='--')[0],
+            ax.plot([], [], label='Negative', color=sentiment_colors[1], linestyle='-.')[0],
+            ax.plot([], [], label='Neutral', color=sentiment_colors[2], linestyle=':')[0],
+        ]
+
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Number of Publications')
+        ax.set_title(" Sentiment Breakdown of Daily Publications")
+        ax.grid(True)
+        ax.legend()
+        ax.tick_params(axis='x', labelrotation=25, labelsize=10)
+        ax.xaxis.set_major_locator(AutoDateLocator(minticks=1, maxticks=12))  # no hourly ticks for few days
+        ax.xaxis.set_major_formatter(DateFormatter('%d-%m-%Y'))
+
+    def draw_pie_chart(self, ax: Axes) -> None:
+        # wedges are created with equal sizes, update_pie_chart moves them to actual angles
+        self.wedges, self.pie_labels, self.pie_percents = ax.pie(
+            [1, 1, 1], labels=sentiment_labels, colors=sentiment_colors, autopct='%1.1f%%', explode=pie_explode)
+
+    def draw_bar_chart(self, ax: Axes) -> None:
+        self.bars = ax.bar(range(self.top_nouns), [0] * self.top_nouns, color='skyblue')
+        ax.set_xticks(range(self.top_nouns))
+        ax.set_xlabel('Nouns')
+        ax.set_ylabel('Frequency')
+
+    def update_plot(self, data: dict) -> None:
+        daily = data["daily"]
+        for line, key in zip(self.lines, ['count'] + sentiments):
+            line.set_data(daily["dates"], daily[key])
+
+        ax = self.lines[0].axes
+        ax.relim()
+        ax.autoscale_view()
+
+    def update_pie_chart(self, data: dict) -> None:
+        total_count = data["total"]["count"]
+        sizes = [data["total"][sentiment] for sentiment in sentiments]
+
+        # angles are computed the way Axes.pie does, starting at 0 degrees counterclockwise
+        theta = 0.0
+        for wedge, label, percent, size, label_text, explode in zip(
+                self.wedges, self.pie_labels, self.pie_percents, sizes, sentiment_labels, pie_explode):
+            fraction = size / total_count if total_count else 0
+            wedge.set_theta1(360 * theta)
+            wedge.set_theta2(360 * (theta + fraction))
+            theta += fraction
+
+            angle = radians(wedge.theta1 + wedge.theta2) / 2
+            x, y = explode * cos(angle), explode * sin(angle)
+            wedge.set_center((x, y))
+            label.set_position((x + 1.1 * cos(angle), y + 1.1 * sin(angle)))
+            label.set_horizontalalignment('left' if cos(angle) > 0 else 'right')
+            label.set_text(f"{label_text}: {size}")
+            percent.set_position((x + 0.6 * cos(angle), y + 0.6 * sin(angle)))
+            percent.set_text(f'{fraction:.1%}')
+            for artist in (wedge, label, percent):
+                artist.set_visible(fraction > 0)
+
+        self.wedges[0].axes.set_title(f"Total sentiment distribution of {total_count} articles")
+
+    def update_bar_chart(self, keyword: str, data: dict) -> None:
+        top_nouns = data[get_top_nouns_key(data)]
+        nouns_data = list(top_nouns["nouns"][:self.top_nouns])
+        count_data = list(top_nouns["count"][:self.top_nouns])
+
+        for i, bar in enumerate(self.bars):
+            bar.set_height(count_data[i] if i < len(count_data) else 0)
+
+        ax = self.bars[0].axes
+        ax.set_xticklabels(nouns_data + [''] * (self.top_nouns - len(nouns_data)), rotation=35, ha='right',
+                           fontsize=8)
+        ax.set_ylim(0, max(count_data, default=0) * 1.1 or 1)
+        ax.set_title(f'Top {self.top_nouns} Nouns, associated with {keyword} by frequency of mentioning')
+
+
+dashboard = Dashboard()  # dashboard of frontend, reused by every analysis
+
+
+def draw_graphs(keyword: str, data: dict | AnalysisSnapshot, partial: bool = False) -> None:
+    # loaded snapshot is plotted straight from its memory mapped daily series
+    if isinstance(data, AnalysisSnapshot):
+        data = data.analysis
+    dashboard.show(keyword, data, partial)
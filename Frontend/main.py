@@ -1,3 +1,5 @@
+from queue import Empty, Queue
+from threading import Event, Thread
 from tkinter import Tk, Label, Button, StringVar, Entry
 from tkinter.messagebox import showerror
 
@@ -31,37 +33,108 @@ choose_your_date_here_label = Label(
     font=('Georgia', 14)
 )
 
+# providers are created once, so their API clients and kept-alive connections are reused by all analyses
+providers = [NewsApiDataProvider(news_api_key), EventRegistryDataProvider(event_registry_api_key)]
+
 entry_text = StringVar(value="Ukraine")  # entry text for keyword input
 calendar = Calendar(win, selectmode='day', year=2024, month=2, day=10)  # calendar for date choosing
 
+max_items_per_provider = 100
+poll_interval = 100  # milliseconds between checks of messages of analysis worker
 
-def analyze():
+# messages of analysis worker as (job, keyword, result, error) tuples, job is cancel event of analysis
+messages = Queue()
+current_job = None  # cancel event of running analysis, None if analysis isn't running
+status_text = StringVar(value="")  # progress of running analysis
+
+
+def run_analysis(job, keyword, min_published_date):
+    # runs in worker thread, so window keeps responding while providers are loaded and articles are scored
     try:
-        # set parameters
-        keyword = entry_text.get()
-        min_published_date = calendar.selection_get()
-        providers = [NewsApiDataProvider(news_api_key), EventRegistryDataProvider(event_registry_api_key)]
-        max_items_per_provider = 100
+        get_analysis(keyword, min_published_date, providers, max_items_per_provider,
+                     progress=lambda result: messages.put((job, keyword, result, None)), cancel=job)
+    except Exception as ex:
+        messages.put((job, keyword, None, ex))
 
-        # get analysis data
-        data = get_analysis(keyword, min_published_date, providers, max_items_per_provider)
 
-        # draw graphs
-        draw_graphs(entry_text.get(), data)
+def analyze():
+    global current_job
 
-    except Exception as ex:
-        # show message box with error message in case of exception
-        showerror(title='An error occurred!', message=str(ex))
+    # set parameters
+    keyword = entry_text.get()
+    min_published_date = calendar.selection_get()
+
+    current_job = Event()
+    Thread(target=run_analysis, args=(current_job, keyword, min_published_date), daemon=True).start()
+
+    status_text.set("Loading articles...")
+    analise_button.config(state='disabled')
+    cancel_button.config(state='normal')
+
+
+def cancel():
+    global current_job
+
+    # worker stops after current page, its remaining messages are ignored
+    current_job.set()
+    current_job = None
+    finish("Analysis is cancelled")
+
+
+def finish(status):
+    status_text.set(status)
+    analise_button.config(state='normal')
+    cancel_button.config(state='disabled')
+
+
+def poll_messages():
+    global current_job
+
+    # only the latest result is drawn, if several pages were analyzed since the previous check
+    latest = None
+    while True:
+        try:
+            job, keyword, result, error = messages.get_nowait()
+        except Empty:
+            break
+        if job is not current_job:
+            continue
+        if error is not None:
+            current_job = None
+            finish("Analysis failed")
+            # show message box with error message in case of exception
+            showerror(title='An error occurred!', message=str(error))
+            latest = None
+            break
+        latest = keyword, result
+
+    if latest is not None:
+        keyword, result = latest
+        progress = result["progress"]
+        try:
+            draw_graphs(keyword, result, partial=not result["done"])
+        except Exception as ex:
+            showerror(title='An error occurred!', message=str(ex))
+
+        if result["done"]:
+            current_job = None
+            finish(f"Done: {progress['pages']} pages fetched, {progress['articles_analyzed']} articles scored")
+        else:
+            status_text.set(f"{progress['pages']} pages fetched, {progress['articles_analyzed']} articles scored...")
+
+    win.after(poll_interval, poll_messages)
 
 
 # set text entry and button
 get_keyword_entry = Entry(win, width=20, font=('Arial', 16), textvariable=entry_text)
 analise_button = Button(win, width=10, text="Analyze", padx=20, pady=10, command=analyze)
+cancel_button = Button(win, width=10, text="Cancel", padx=20, pady=5, command=cancel, state='disabled')
+status_label = Label(win, textvariable=status_text, background="#E0FFFF", font=('Arial', 11))
 
 # set window parameters
 win.config(background="#E0FFFF")
 win.title("Social media analysis service")
-win.geometry("500x500")
+win.geometry("500x600")
 win.resizable(False, False)
 
 # pack components
@@ -69,7 +142,10 @@ social_media_analysis_service_label.pack()
 get_keyword_entry.pack()
 choose_your_date_here_label.pack()
 calendar.pack()
-analise_button.pack(pady=25)
+analise_button.pack(pady=(25, 5))
+cancel_button.pack()
+status_label.pack(pady=10)
 
-# run main loop
+# run main loop, checking messages of analysis worker
+win.after(poll_interval, poll_messages)
 win.mainloop()
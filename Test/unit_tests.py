@@ -1,13 +1,49 @@
-from datetime import date
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from tempfile import TemporaryDirectory
+from threading import Event, Lock, Thread
+from time import perf_counter, sleep
+from types import SimpleNamespace
 from unittest import TestCase, main
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
+import numpy as np
+import requests
 from eventregistry import QueryArticlesIter
 from newsapi import NewsApiClient
+from newsapi.newsapi_exception import NewsAPIException
 
-from Backend.data_providers import NewsApiDataProvider, EventRegistryDataProvider
-from Backend.entries import DataEntry, AnalysisEntry, FeedEntry
-from Backend.main import get_analysis
+from Backend.analysis import AnalysisAccumulator, TextAnalyzer
+from Backend.analysis_snapshots import AnalysisSnapshot
+from Backend.article_store import ArticleStore, LocalIndexDataProvider, with_article_store
+from Backend.async_providers import AsyncDataProvider
+from Backend.caching import CachedDataProvider
+from Backend.data_providers import DataProvider, NewsApiDataProvider, EventRegistryDataProvider
+from Backend.deduplication import DeduplicationIndex, normalize_url
+from Backend.entries import Article, DataBatch, DataEntry, AnalysisEntry, FeedEntry
+from Backend.feed_snapshots import FeedSnapshotStore
+from Backend.http_session import get_shared_session
+from Backend.fetching import fetch_from_providers, ProviderStream
+from Backend.incremental import IncrementalAnalyzer
+from Backend.main import get_analysis, get_analysis_and_feed, get_analysis_async, get_analysis_batch, get_feed, \
+    get_feed_async, analyze_entries, get_analysis_snapshot, iter_analysis
+from Backend.metrics import InMemorySink, Metrics, PrometheusSink, capture_profile, default_metrics, format_profile
+from Backend.noun_phrases import LexiconNounPhraseExtractor
+from Backend.parallel_scoring import ParallelScorer
+from Backend.scheduling import QuotaExceededError, RequestScheduler
+from Backend.score_cache import ScoreCache
+from Backend.server import AnalysisServer, AnalysisService
+from Backend.sentiment import LexiconSentimentAnalyzer, TextBlobSentimentAnalyzer
+from Backend.space_saving import SpaceSavingCounter
+from Backend.time_series import TimeSeriesStore
 
 newsapi_test_data = [
     {
@@ -61,6 +97,22 @@ class DataEntryTests(TestCase):
         self.assertEqual(data_entry.date, date(2022, 1, 1))
         self.assertEqual(data_entry.text, 'Test text')
 
+    def test_data_entry_has_no_instance_dict(self):
+        data_entry = DataEntry(date(2022, 1, 1), 'Test text')
+        self.assertFalse(hasattr(data_entry, '__dict__'))
+
+
+class DataBatchTests(TestCase):
+    def test_data_batch_round_trip(self):
+        batch = DataBatch.from_entries(entries_test_data)
+        batch.append(date(2022, 1, 4), 'Test text 4')
+
+        entries = list(batch)
+
+        self.assertEqual(len(batch), 4)
+        self.assertEqual([e.date for e in entries], [date(2022, 1, i) for i in range(1, 5)])
+        self.assertEqual([e.text for e in entries], [f'Test text {i}' for i in range(1, 5)])
+
 
 class AnalysisEntryTests(TestCase):
     def test_data_entry_creation(self):
@@ -80,6 +132,21 @@ class FeedEntryTests(TestCase):
         self.assertEqual(feed_entry.pubdate, date(2020, 1, 1))
 
 
+class ArticleTests(TestCase):
+    def test_article_projections(self):
+        article = Article(date(2022, 1, 1), 'Title', 'URL', 'Description', 'Text')
+
+        data_entry = article.to_data_entry()
+        feed_entry = article.to_feed_entry()
+
+        self.assertEqual(data_entry.date, date(2022, 1, 1))
+        self.assertEqual(data_entry.text, 'Text')
+        self.assertEqual(feed_entry.title, 'Title')
+        self.assertEqual(feed_entry.url, 'URL')
+        self.assertEqual(feed_entry.description, 'Description')
+        self.assertEqual(feed_entry.pubdate, date(2022, 1, 1))
+
+
 class NewsApiDataProviderTests(TestCase):
     @patch.object(NewsApiClient, 'get_everything')
     def test_load_data(self, mock_get_everything):
@@ -108,6 +175,19 @@ class NewsApiDataProviderTests(TestCase):
                 page=p,
                 language='en')
 
+    @patch.object(NewsApiClient, 'get_everything')
+    def test_load_batch(self, mock_get_everything):
+        # arrange
+        mock_get_everything.side_effect = newsapi_test_data
+        news_api_data_provider = NewsApiDataProvider(api_key='api key')
+
+        # act
+        batch = news_api_data_provider.load_batch('test', date(2022, 1, 2), 10)
+
+        # assert
+        self.assertEqual(list(batch.iter_dates()), [date(2022, 1, 2), date(2022, 1, 3)])
+        self.assertEqual(batch.texts, ['Test description 2', 'Test content 3'])
+
     @patch.object(NewsApiClient, 'get_everything')
     def test_load_data_max_items_overflow(self, mock_get_everything):
         # arrange
@@ -129,6 +209,176 @@ class NewsApiDataProviderTests(TestCase):
                 page=p,
                 language='en')
 
+    @patch.object(NewsApiClient, 'get_everything')
+    def test_get_articles_requests_remaining_pages_concurrently(self, mock_get_everything):
+        # arrange
+        def get_page(page, page_size, **kwargs):
+            sleep(0.2)
+            return {
+                'articles': [{'id': (page - 1) * page_size + i} for i in range(page_size)],
+                'totalResults': 1000
+            }
+
+        mock_get_everything.side_effect = get_page
+        news_api_data_provider = NewsApiDataProvider(api_key='api key', max_pages_in_flight=4)
+
+        # act
+        start = perf_counter()
+        articles = news_api_data_provider.get_articles('test', date(2022, 1, 1), 450)
+        elapsed = perf_counter() - start
+
+        # assert
+        self.assertEqual([article['id'] for article in articles], list(range(450)))
+        self.assertEqual(mock_get_everything.call_count, 5)
+        self.assertLess(elapsed, 0.6)
+
+    @patch.object(NewsApiClient, 'get_everything')
+    def test_pages_are_not_loaded_far_ahead_of_consumer(self, mock_get_everything):
+        # arrange
+        mock_get_everything.side_effect = lambda page, page_size, **kwargs: {
+            'articles': [{'id': (page - 1) * page_size + i} for i in range(page_size)],
+            'totalResults': 1000
+        }
+        news_api_data_provider = NewsApiDataProvider(api_key='api key', max_pages_in_flight=2)
+
+        # act
+        pages = news_api_data_provider.iter_pages('test', date(2022, 1, 1), 1000)
+        next(pages)
+        next(pages)
+        sleep(0.2)
+        call_count = mock_get_everything.call_count
+        pages.close()
+
+        # assert
+        # the first page, the yielded second page and at most two pages ahead of consumer
+        self.assertEqual(call_count, 4)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ThrottlingNewsApiClient:
+    # fails first requests with given NewsAPI error code, then returns pages of newsapi_test_data
+    def __init__(self, failures, code='rateLimited'):
+        self.failures = failures
+        self.code = code
+        self.calls = 0
+
+    def get_everything(self, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise NewsAPIException({'status': 'error', 'code': self.code, 'message': 'Test error'})
+        return newsapi_test_data[kwargs['page'] - 1]
+
+
+class RequestSchedulerTests(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = RequestScheduler(rate=2, burst=2, base_delay=0.5, clock=self.clock,
+                                          sleep_function=self.clock.sleep, random_function=lambda: 1.0)
+
+    def test_requests_are_limited_by_token_bucket(self):
+        # act
+        results = [self.scheduler.call('provider', lambda: i) for i in range(6)]
+
+        # assert
+        self.assertEqual(results, list(range(6)))
+        self.assertEqual(self.clock.sleeps, [0, 0, 0.5, 0.5, 0.5, 0.5])
+        self.assertEqual(self.scheduler.get_quota('provider').requests, 6)
+
+    def test_throttled_requests_are_retried_with_backoff(self):
+        # arrange
+        provider = NewsApiDataProvider('api key', scheduler=self.scheduler)
+        provider.client = ThrottlingNewsApiClient(failures=2)
+
+        # act
+        entries = provider.load_data('test', date(2022, 1, 1), 10)
+
+        # assert
+        quota = self.scheduler.get_quota('NewsApiDataProvider')
+        self.assertEqual(len(entries), 3)
+        self.assertEqual((quota.requests, quota.retries, quota.throttled, quota.failures), (5, 2, 2, 0))
+        # backoff doubles on every retry, then the third page waits for a token
+        self.assertEqual([delay for delay in self.clock.sleeps if delay], [0.5, 1.0, 0.5])
+
+    def test_permanent_errors_are_not_retried(self):
+        # arrange
+        provider = NewsApiDataProvider('api key', scheduler=self.scheduler)
+        provider.client = ThrottlingNewsApiClient(failures=1, code='apiKeyInvalid')
+
+        # act
+        with self.assertRaises(NewsAPIException):
+            provider.load_data('test', date(2022, 1, 1), 10)
+
+        # assert
+        quota = self.scheduler.get_quota('NewsApiDataProvider')
+        self.assertEqual((quota.requests, quota.retries, quota.failures), (1, 0, 1))
+
+    def test_connection_errors_of_requests_are_retried(self):
+        # arrange
+        errors = [requests.ConnectionError('connection refused'), requests.Timeout('read timed out')]
+
+        def request():
+            if errors:
+                raise errors.pop(0)
+            return 'result'
+
+        # act
+        result = self.scheduler.call('provider', request)
+
+        # assert
+        quota = self.scheduler.get_quota('provider')
+        self.assertEqual(result, 'result')
+        self.assertEqual((quota.requests, quota.retries, quota.failures), (3, 2, 0))
+
+    @patch('eventregistry.EventRegistry.time.sleep')
+    def test_event_registry_errors_are_classified_by_status(self, sleep_mock):
+        # arrange
+        def response(status_code):
+            return MagicMock(status_code=status_code, text='error', headers={}, json=lambda: {'status': status_code})
+
+        session = MagicMock()
+        session.post.side_effect = [response(429), response(503), response(200), response(401)]
+        provider = EventRegistryDataProvider('api key', scheduler=self.scheduler, session=session)
+
+        def request():
+            return provider.event_registry.jsonRequest('/api/v1/article/getArticles', {})
+
+        # act
+        result = provider.send_request(request)
+        with self.assertRaises(Exception):
+            provider.send_request(request)
+
+        # assert
+        quota = self.scheduler.get_quota('EventRegistryDataProvider')
+        self.assertEqual(result, {'status': 200})
+        self.assertEqual((quota.requests, quota.retries, quota.throttled, quota.failures), (4, 2, 1, 1))
+
+    def test_requests_over_quota_are_rejected_until_next_period(self):
+        # arrange
+        self.scheduler.configure('provider', quota=2, quota_period=60)
+
+        # act
+        self.scheduler.call('provider', lambda: None)
+        self.scheduler.call('provider', lambda: None)
+        with self.assertRaises(QuotaExceededError):
+            self.scheduler.call('provider', lambda: None)
+        self.clock.now += 60
+        self.scheduler.call('provider', lambda: None)
+
+        # assert
+        self.assertEqual(self.scheduler.get_quota('provider').remaining, 1)
+
 
 class EventRegistryDataProviderTests(TestCase):
     @patch.object(QueryArticlesIter, 'execQuery', return_value=eventregistry_test_data)
@@ -151,6 +401,25 @@ class EventRegistryDataProviderTests(TestCase):
         self.assertEqual(data_entries[2].date, date(2022, 1, 3))
         self.assertEqual(data_entries[2].text, 'Test article 3')
 
+    def test_iter_batches_loads_every_page_once(self):
+        # arrange
+        articles = [{'date': '2022-01-01', 'body': f'Article {i}', 'url': f'URL {i}'} for i in range(250)]
+        event_registry_data_provider = EventRegistryDataProvider('api key')
+        event_registry_data_provider.event_registry = MagicMock(_verboseOutput=False)
+
+        def exec_query(query):
+            page = query._getQueryParams()['articlesPage']
+            return {'articles': {'results': articles[(page - 1) * 100:page * 100], 'pages': 3}}
+
+        event_registry_data_provider.event_registry.execQuery.side_effect = exec_query
+
+        # act
+        batches = list(event_registry_data_provider.iter_batches('test', date(2022, 1, 1), 1000))
+
+        # assert
+        self.assertEqual([len(batch) for batch in batches], [100, 100, 50])
+        self.assertEqual(event_registry_data_provider.event_registry.execQuery.call_count, 3)
+
 
 class MainTests(TestCase):
     @patch('Backend.data_providers.NewsApiDataProvider')
@@ -177,6 +446,1160 @@ class MainTests(TestCase):
         self.assertLessEqual(len(data_entries['top20_nouns']['nouns']), 20)
         self.assertLessEqual(len(data_entries['top20_nouns']['count']), 20)
 
+    @patch('Backend.noun_phrases.TextBlob')
+    def test_get_analysis_and_feed_loads_articles_once(self, text_blob_mock):
+        # arrange
+        text_blob_mock.return_value.noun_phrases = ['test']
+        provider = MagicMock()
+        provider.load_articles.return_value = [
+            Article(date(2021, 12, 31), 'Old title', 'URL 1', 'Description 1', 'Bad text 1'),
+            Article(date(2022, 1, 1), 'New title', 'URL 2', 'Description 2', 'Great text 2'),
+        ]
+
+        # act
+        analysis, feed = get_analysis_and_feed('test', date(2022, 1, 1), [provider], 10, '/articles/')
+
+        # assert
+        provider.load_articles.assert_called_once_with('test', date(2022, 1, 1), 10)
+        self.assertEqual(analysis['total']['count'], 1)
+        self.assertEqual(analysis['total']['positive'], 1)
+        self.assertEqual(analysis['top20_nouns']['nouns'], ['test'])
+        self.assertIn('Old title', feed)
+        self.assertIn('New title', feed)
+
+
+def create_sleeping_provider(delay, result):
+    provider = MagicMock()
+    provider.load_data.side_effect = lambda *args: sleep(delay) or result
+    return provider
+
+
+class FetchFromProvidersTests(TestCase):
+    def test_providers_are_loaded_concurrently(self):
+        # arrange
+        providers = [create_sleeping_provider(0.3, [1, 2]), create_sleeping_provider(0.3, [3])]
+
+        # act
+        start = perf_counter()
+        result = fetch_from_providers(lambda p: p.load_data(), providers)
+        elapsed = perf_counter() - start
+
+        # assert
+        self.assertEqual(result.items, [1, 2, 3])
+        self.assertEqual(result.failed_providers, [])
+        self.assertLess(elapsed, 0.55)
+
+    def test_timed_out_provider_is_skipped_with_partial_results(self):
+        # arrange
+        slow_provider = create_sleeping_provider(1, [1])
+        fast_provider = create_sleeping_provider(0, [2])
+
+        # act
+        result = fetch_from_providers(lambda p: p.load_data(), [slow_provider, fast_provider], 0.1, True)
+
+        # assert
+        self.assertEqual(result.items, [2])
+        self.assertEqual(result.failed_providers, [slow_provider])
+        self.assertIsInstance(result.errors[0], TimeoutError)
+
+    def test_failed_provider_error_is_raised_without_partial_results(self):
+        # arrange
+        failing_provider = MagicMock()
+        failing_provider.load_data.side_effect = ValueError('provider error')
+
+        # act & assert
+        with self.assertRaises(ValueError):
+            fetch_from_providers(lambda p: p.load_data(), [failing_provider, create_sleeping_provider(0, [1])])
+
+
+def iter_slowly(items, delay):
+    for item in items:
+        yield item
+        sleep(delay)
+
+
+class ProviderStreamTests(TestCase):
+    def test_items_are_yielded_before_providers_finish(self):
+        # arrange
+        stream = ProviderStream(lambda items: iter_slowly(items, 0.5), [[1, 2], [3]])
+
+        # act
+        start = perf_counter()
+        iterator = iter(stream)
+        first_items = {next(iterator), next(iterator)}
+        first_items_time = perf_counter() - start
+        items = list(iterator)
+
+        # assert
+        self.assertEqual(first_items, {1, 3})
+        self.assertEqual(items, [2])
+        self.assertLess(first_items_time, 0.3)
+
+    def test_timed_out_provider_is_skipped_with_partial_results(self):
+        # arrange
+        providers = [[1, 2], [3]]
+        stream = ProviderStream(lambda items: iter_slowly(items, 1 if items == [1, 2] else 0), providers, 0.3, True)
+
+        # act
+        items = sorted(stream)
+
+        # assert
+        self.assertEqual(items, [1, 3])
+        self.assertEqual(stream.failed_providers, [[1, 2]])
+        self.assertIsInstance(stream.errors[0], TimeoutError)
+
+    def test_failed_provider_error_is_raised_without_partial_results(self):
+        # arrange
+        def iterate(items):
+            yield from items
+            raise ValueError('provider error')
+
+        # act & assert
+        with self.assertRaises(ValueError):
+            list(ProviderStream(iterate, [[1, 2]]))
+
+    def test_cancel_stops_waiting_for_slow_provider(self):
+        # arrange
+        def iterate(items):
+            sleep(5)
+            yield from items
+
+        cancel = Event()
+        stream = ProviderStream(iterate, [[1, 2]], cancel=cancel)
+        Thread(target=lambda: sleep(0.1) or cancel.set(), daemon=True).start()
+
+        # act
+        start = perf_counter()
+        items = list(stream)
+
+        # assert
+        self.assertEqual(items, [])
+        self.assertLess(perf_counter() - start, 1)
+
+    def test_concurrent_providers_are_limited(self):
+        # arrange
+        lock, running, max_running = Lock(), [0], [0]
+
+        def iterate(items):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            sleep(0.1)
+            with lock:
+                running[0] -= 1
+            return items
+
+        # act
+        items = sorted(ProviderStream(iterate, [[i] for i in range(6)], 0.15, max_concurrent=2))
+
+        # assert
+        self.assertEqual(items, list(range(6)))
+        self.assertEqual(max_running[0], 2)
+
+    def test_provider_overriding_load_data_only_is_streamed(self):
+        # arrange
+        class LoadDataProvider(DataProvider):
+            def load_data(self, keyword, min_published_date, max_items):
+                return entries_test_data
+
+        # act
+        entries = list(LoadDataProvider().iter_data('test', date(2022, 1, 1), 10))
+
+        # assert
+        self.assertEqual(entries, entries_test_data)
+
+
+articles_test_data = [
+    Article(date(2022, 1, 3), 'Title 3', 'URL 3', 'Description 3', 'Text 3'),
+    Article(date(2022, 1, 2), 'Title 2', 'URL 2', 'Description 2', 'Text 2'),
+    Article(date(2022, 1, 1), 'Title 1', 'URL 1', 'Description 1', 'Text 1'),
+]
+
+
+class CachedDataProviderTests(TestCase):
+    def setUp(self):
+        self.now = 0
+        self.provider = MagicMock()
+        self.provider.load_articles.return_value = articles_test_data
+        self.cached_provider = CachedDataProvider(self.provider, ttl=60, max_entries=2, clock=lambda: self.now)
+
+    def test_repeated_query_is_answered_from_cache(self):
+        # act
+        first = self.cached_provider.load_data('test', date(2022, 1, 1), 10)
+        second = self.cached_provider.load_data('test', date(2022, 1, 1), 10)
+
+        # assert
+        self.provider.load_articles.assert_called_once()
+        self.assertEqual([e.text for e in first], [e.text for e in second])
+        self.assertEqual((self.cached_provider.hits, self.cached_provider.misses), (1, 1))
+
+    def test_narrower_query_is_filtered_from_cached_superset(self):
+        # act
+        self.cached_provider.load_articles('test', date(2022, 1, 1), 10)
+        articles = self.cached_provider.load_articles('test', date(2022, 1, 2), 1)
+
+        # assert
+        self.provider.load_articles.assert_called_once()
+        self.assertEqual([a.title for a in articles], ['Title 3'])
+
+    def test_wider_query_is_not_answered_from_cache(self):
+        # act
+        self.cached_provider.load_articles('test', date(2022, 1, 2), 10)
+        self.cached_provider.load_articles('test', date(2022, 1, 1), 10)
+        self.cached_provider.load_articles('other', date(2022, 1, 2), 10)
+
+        # assert
+        self.assertEqual(self.provider.load_articles.call_count, 3)
+
+    def test_expired_query_is_refetched(self):
+        # act
+        self.cached_provider.load_articles('test', date(2022, 1, 1), 10)
+        self.now = 61
+        self.cached_provider.load_articles('test', date(2022, 1, 1), 10)
+
+        # assert
+        self.assertEqual(self.provider.load_articles.call_count, 2)
+
+    def test_least_recently_used_query_is_evicted(self):
+        # act
+        for keyword in ['first', 'second', 'first', 'third', 'first', 'second']:
+            self.now += 1
+            self.cached_provider.load_articles(keyword, date(2022, 1, 1), 10)
+
+        # assert
+        self.assertEqual((self.cached_provider.hits, self.cached_provider.misses), (2, 4))
+
+
+class ListDataProvider(DataProvider):
+    def __init__(self, articles):
+        self.articles = articles
+        self.requested_dates = []
+
+    def load_articles(self, keyword, min_published_date, max_items):
+        self.requested_dates.append(min_published_date)
+        return [article for article in self.articles if article.date >= min_published_date][:max_items]
+
+
+def create_text_blob_mock(text):
+    # polarity and noun phrases depend on text, so results of different articles differ
+    return MagicMock(sentiment=MagicMock(polarity=len(text) % 3 * 0.3 - 0.3), noun_phrases=text.split()[:2])
+
+
+@patch('Backend.noun_phrases.TextBlob', side_effect=create_text_blob_mock)
+class IncrementalAnalyzerTests(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.analyzer = IncrementalAnalyzer(self.directory.name)
+        self.provider = ListDataProvider([
+            Article(date(2022, 1, 1), 'Title', 'URL 1', 'Description', 'first news text'),
+            Article(date(2022, 1, 2), 'Title', 'URL 2', 'Description', 'second news article text'),
+        ])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_refresh_is_identical_to_full_recompute(self, text_blob_mock):
+        # act
+        self.analyzer.get_analysis('test', date(2022, 1, 1), [self.provider], 100)
+        self.provider.articles += [
+            Article(date(2022, 1, 2), 'Title', 'URL 3', 'Description', 'third news text'),
+            Article(date(2022, 1, 3), 'Title', 'URL 4', 'Description', 'fourth article text'),
+        ]
+        refreshed = self.analyzer.get_analysis('test', date(2022, 1, 1), [self.provider], 100)
+        recomputed = get_analysis('test', date(2022, 1, 1), [self.provider], 100)
+
+        # assert
+        self.assertEqual(refreshed, recomputed)
+        self.assertEqual(self.provider.requested_dates[:2], [date(2022, 1, 1), date(2022, 1, 2)])
+        self.assertEqual(text_blob_mock.call_count, 4 + 4)
+
+    def test_state_is_reused_by_new_analyzer_for_narrower_range(self, text_blob_mock):
+        # act
+        self.analyzer.get_analysis('test', date(2022, 1, 1), [self.provider], 100)
+        result = IncrementalAnalyzer(self.directory.name).get_analysis('test', date(2022, 1, 2), [self.provider], 100)
+
+        # assert
+        self.assertEqual(result, get_analysis('test', date(2022, 1, 2), [self.provider], 100))
+        self.assertEqual(self.provider.requested_dates[1], date(2022, 1, 2))
+
+
+class ScoreCacheTests(TestCase):
+    def test_same_text_is_analyzed_once(self):
+        # arrange
+        score_function = MagicMock(return_value=(0.5, ['test']))
+        score_cache = ScoreCache()
+
+        # act
+        results = [score_cache.score(text, score_function) for text in ['a', 'b', 'a', 'a']]
+
+        # assert
+        self.assertEqual(results, [(0.5, ['test'])] * 4)
+        self.assertEqual(score_function.call_count, 2)
+        self.assertEqual((score_cache.hits, score_cache.misses), (2, 2))
+
+    def test_least_recently_used_result_is_evicted_from_memory(self):
+        # arrange
+        score_function = MagicMock(return_value=(0.5, ['test']))
+        score_cache = ScoreCache(max_size=2)
+
+        # act
+        for text in ['a', 'b', 'a', 'c', 'a', 'b']:
+            score_cache.score(text, score_function)
+
+        # assert
+        self.assertEqual(score_function.call_count, 4)
+
+    def test_persistent_results_are_reused_only_for_same_version(self):
+        # arrange
+        score_function = MagicMock(return_value=(0.5, ['test']))
+
+        # act
+        with TemporaryDirectory() as directory:
+            path = f'{directory}/scores.sqlite3'
+            ScoreCache(path=path).score('a', score_function)
+            result = ScoreCache(path=path).score('a', score_function)
+            ScoreCache(path=path, version='other').score('a', score_function)
+
+        # assert
+        self.assertEqual(result, (0.5, ['test']))
+        self.assertEqual(score_function.call_count, 2)
+
+    def test_batch_results_are_persisted(self):
+        # arrange
+        analyzer = CountingTextAnalyzer()
+
+        # act
+        with TemporaryDirectory() as directory:
+            path = f'{directory}/scores.sqlite3'
+            expected = ScoreCache(path=path).score_batch(['a b', 'c d e', 'a b'], LengthTextAnalyzer())
+            polarities, noun_phrases = ScoreCache(path=path).score_batch(['c d e', 'a b'], analyzer)
+
+        # assert
+        self.assertEqual(polarities.tolist(), expected[0][1::-1].tolist())
+        self.assertEqual(noun_phrases, expected[1][1::-1])
+        self.assertEqual(analyzer.scored_texts, [])
+
+
+class LengthTextAnalyzer(TextAnalyzer):
+    # module level class, so it can be sent to worker processes
+    version = 'length'
+
+    def score_batch(self, texts):
+        return np.array([len(text) % 3 * 0.3 - 0.3 for text in texts]), [text.split()[:2] for text in texts]
+
+
+class CountingTextAnalyzer(LengthTextAnalyzer):
+    def __init__(self):
+        self.scored_texts = []
+
+    def score_batch(self, texts):
+        self.scored_texts += texts
+        return super().score_batch(texts)
+
+
+class AnalysisBatchTests(TestCase):
+    def test_results_are_identical_to_separate_analysis(self):
+        # arrange
+        providers = [
+            ListDataProvider([
+                Article(date(2022, 1, 1), 'Title', 'https://example.com/1', 'Description', 'first news text'),
+                Article(date(2022, 1, 2), 'Title', 'https://example.com/2', 'Description', 'second news article text'),
+            ]),
+            ListDataProvider([
+                Article(date(2022, 1, 2), 'Title', 'https://example.com/2', 'Description', 'second news article text'),
+                Article(date(2022, 1, 3), 'Title', 'https://other.com/3', 'Description', 'third news text'),
+            ]),
+        ]
+        keywords = ['first', 'second', 'third', 'first']
+        analyzer = CountingTextAnalyzer()
+
+        # act
+        results = get_analysis_batch(keywords, date(2022, 1, 1), providers, 10, analyzer=analyzer,
+                                     deduplicate=True, max_concurrent_queries=2)
+
+        # assert
+        self.assertEqual(list(results), ['first', 'second', 'third'])
+        for keyword, result in results.items():
+            self.assertEqual(result, get_analysis(keyword, date(2022, 1, 1), providers, 10,
+                                                  analyzer=LengthTextAnalyzer(), deduplicate=True))
+        self.assertEqual(results['first']['duplicates'], 1)
+        self.assertEqual(sorted(analyzer.scored_texts),
+                         ['first news text', 'second news article text', 'third news text'])
+
+
+class TimeSeriesStoreTests(TestCase):
+    def setUp(self):
+        self.provider = ListDataProvider([
+            Article(date(2022, 1, 1), 'Title', 'URL 1', 'Description', 'first news text',
+                    datetime(2022, 1, 1, 9, 30)),
+            Article(date(2022, 1, 2), 'Title', 'URL 2', 'Description', 'second news article text',
+                    datetime(2022, 1, 2, 9, 45)),
+            Article(date(2022, 1, 2), 'Title', 'URL 3', 'Description', 'third news text',
+                    datetime(2022, 1, 2, 17, 0)),
+        ])
+        self.analyzer = CountingTextAnalyzer()
+
+    def test_refresh_is_identical_to_full_recompute(self):
+        # arrange
+        store = TimeSeriesStore()
+
+        # act
+        store.get_analysis('test', date(2022, 1, 1), [self.provider], 100, analyzer=self.analyzer)
+        self.provider.articles.append(Article(date(2022, 1, 3), 'Title', 'URL 4', 'Description', 'fourth text'))
+        refreshed = store.get_analysis('test', date(2022, 1, 1), [self.provider], 100, analyzer=self.analyzer)
+
+        # assert
+        self.assertEqual(refreshed, get_analysis('test', date(2022, 1, 1), [self.provider], 100,
+                                                 analyzer=LengthTextAnalyzer()))
+        self.assertEqual(self.provider.requested_dates[:2], [date(2022, 1, 1), date(2022, 1, 2)])
+        self.assertEqual(len(self.analyzer.scored_texts), 4)
+
+    def test_overlapping_providers_are_deduplicated_only_on_request(self):
+        # arrange
+        providers = [self.provider, ListDataProvider(self.provider.articles[1:])]
+
+        # act
+        with TemporaryDirectory() as directory:
+            results = {
+                deduplicate: [
+                    TimeSeriesStore().get_analysis('test', date(2022, 1, 1), providers, 100,
+                                                   analyzer=LengthTextAnalyzer(), deduplicate=deduplicate),
+                    IncrementalAnalyzer(f'{directory}/{deduplicate}').get_analysis(
+                        'test', date(2022, 1, 1), providers, 100, analyzer=LengthTextAnalyzer(),
+                        deduplicate=deduplicate),
+                    get_analysis('test', date(2022, 1, 1), providers, 100, analyzer=LengthTextAnalyzer(),
+                                 deduplicate=deduplicate)]
+                for deduplicate in (False, True)
+            }
+
+        # assert
+        for deduplicate, (series_result, incremental_result, full_result) in results.items():
+            self.assertEqual(series_result, full_result)
+            self.assertEqual(incremental_result, full_result)
+        self.assertEqual((results[False][0]['total']['count'], results[False][0]['duplicates']), (5, 0))
+        self.assertEqual((results[True][0]['total']['count'], results[True][0]['duplicates']), (3, 2))
+
+    def test_date_ranges_are_summarized_from_stored_buckets(self):
+        # arrange
+        with TemporaryDirectory() as directory:
+            path = f'{directory}/series.sqlite3'
+            TimeSeriesStore(path).get_analysis('test', date(2022, 1, 1), [self.provider], 100,
+                                               analyzer=self.analyzer)
+
+            # act
+            result = TimeSeriesStore(path).summary('test', date(2022, 1, 2), date(2022, 1, 2))
+
+        # assert
+        expected = get_analysis('test', date(2022, 1, 2), [self.provider], 100, analyzer=LengthTextAnalyzer())
+        del expected['duplicates'], expected['failed_providers']
+        self.assertEqual(result, expected)
+        self.assertEqual(len(self.provider.requested_dates), 2)
+
+    def test_hourly_buckets_are_summed_by_day(self):
+        # arrange
+        store = TimeSeriesStore(hourly=True)
+
+        # act
+        result = store.get_analysis('test', date(2022, 1, 1), [self.provider], 100, analyzer=self.analyzer)
+        series = store.hourly_series('test', date(2022, 1, 2))
+
+        # assert
+        self.assertEqual(result['daily']['count'], [1, 2])
+        self.assertEqual(series['hours'], [datetime(2022, 1, 2, 9), datetime(2022, 1, 2, 17)])
+        self.assertEqual(series['count'], [1, 1])
+        self.assertRaises(ValueError, TimeSeriesStore().hourly_series, 'test')
+
+
+class MetricsTests(TestCase):
+    def setUp(self):
+        self.sink = default_metrics.sink = InMemorySink()
+        self.addCleanup(setattr, default_metrics, 'sink', None)
+
+    def test_stages_are_recorded(self):
+        # arrange
+        providers = [
+            ListDataProvider([
+                Article(date(2022, 1, 1), 'Title', 'https://example.com/1', 'Description', 'first news text'),
+                Article(date(2022, 1, 2), 'Title', 'https://example.com/2', 'Description', 'second news article text'),
+            ]),
+            SleepingListDataProvider([
+                Article(date(2022, 1, 2), 'Title', 'https://example.com/2', 'Description', 'second news article text'),
+            ], delay=0.01),
+        ]
+
+        # act
+        get_analysis('test', date(2022, 1, 1), providers, 10, score_cache=ScoreCache(), analyzer=LengthTextAnalyzer(),
+                     deduplicate=True)
+
+        # assert
+        self.assertEqual(self.sink.get_counter('articles_loaded'), 3)
+        self.assertEqual(self.sink.get_counter('articles_loaded', provider='ListDataProvider'), 2)
+        self.assertEqual(self.sink.get_counter('text_bytes', provider='SleepingListDataProvider'), 24)
+        self.assertEqual(self.sink.get_counter('duplicates'), 1)
+        self.assertEqual(self.sink.get_counter('articles_analyzed'), 2)
+        self.assertEqual(self.sink.get_counter('score_cache_misses'), 2)
+        self.assertEqual(self.sink.get_span('get_analysis').count, 1)
+        self.assertGreaterEqual(self.sink.get_span('aggregate').count, 1)
+
+    def test_disabled_metrics_record_nothing(self):
+        # arrange
+        metrics = Metrics()
+        items = [1, 2, 3]
+
+        # act
+        with metrics.span('test', provider='test'):
+            metrics.increment('test')
+        counted = metrics.count_items(items, 'test')
+
+        # assert
+        self.assertIs(counted, items)
+        self.assertEqual(self.sink.counters, {})
+
+    def test_prometheus_format(self):
+        # arrange
+        sink = PrometheusSink(prefix='test')
+        metrics = Metrics(sink)
+
+        # act
+        metrics.increment('pages', 2, provider='News "API"')
+        metrics.increment('pages', provider='News "API"')
+        sink.observe('score', 0.5, ())
+
+        # assert
+        self.assertEqual(sink.render(), '# TYPE test_pages_total counter\n'
+                                        'test_pages_total{provider="News \\"API\\""} 3\n'
+                                        '# TYPE test_span_seconds summary\n'
+                                        'test_span_seconds_count{span="score"} 1\n'
+                                        'test_span_seconds_sum{span="score"} 0.500000\n')
+
+    def test_concurrent_profiles_are_serialized(self):
+        # arrange
+        started = Event()
+        errors = []
+
+        def profile():
+            try:
+                with capture_profile():
+                    started.set()
+                    sleep(0.05)
+            except ValueError as error:
+                errors.append(error)
+
+        thread = Thread(target=profile)
+
+        # act
+        thread.start()
+        started.wait()
+        start = perf_counter()
+        with capture_profile() as profiler:
+            waited = perf_counter() - start
+        thread.join()
+
+        # assert
+        self.assertEqual(errors, [])
+        self.assertGreater(waited, 0.01)
+        self.assertIn('calls', format_profile(profiler))
+
+
+class AsyncListDataProvider(AsyncDataProvider):
+    def __init__(self, articles, delay=0.0):
+        self.articles = articles
+        self.delay = delay
+
+    async def load_articles(self, keyword, min_published_date, max_items):
+        await asyncio.sleep(self.delay)
+        return [article for article in self.articles if article.date >= min_published_date][:max_items]
+
+
+class AsyncAnalysisTests(TestCase):
+    def setUp(self):
+        self.articles = [
+            Article(date(2022, 1, 1), 'Title', 'https://example.com/1', 'Description', 'first news text'),
+            Article(date(2022, 1, 2), 'Title', 'https://example.com/2', 'Description', 'second news article text'),
+        ]
+        self.other_articles = [
+            Article(date(2022, 1, 2), 'Title', 'https://example.com/2', 'Description', 'second news article text'),
+            Article(date(2022, 1, 3), 'Title', 'https://other.com/3', 'Description', 'third news text'),
+        ]
+
+    def test_results_are_identical_to_sync_functions(self):
+        # arrange
+        sync_providers = [ListDataProvider(self.articles), ListDataProvider(self.other_articles)]
+        async_providers = [ListDataProvider(self.articles), AsyncListDataProvider(self.other_articles)]
+
+        # act
+        analysis = asyncio.run(get_analysis_async('test', date(2022, 1, 1), async_providers, 10,
+                                                  analyzer=LengthTextAnalyzer()))
+        feed = asyncio.run(get_feed_async('test', date(2022, 1, 1), async_providers, 10, '/feed'))
+
+        # assert
+        self.assertEqual(analysis, get_analysis('test', date(2022, 1, 1), sync_providers, 10,
+                                                analyzer=LengthTextAnalyzer()))
+        self.assertEqual(feed, get_feed('test', date(2022, 1, 1), sync_providers, 10, '/feed'))
+
+    def test_timed_out_provider_is_skipped_with_partial_results(self):
+        # arrange
+        providers = [AsyncListDataProvider(self.articles), AsyncListDataProvider(self.other_articles, delay=5)]
+
+        # act
+        start = perf_counter()
+        analysis = asyncio.run(get_analysis_async('test', date(2022, 1, 1), providers, 10, provider_timeout=0.1,
+                                                  allow_partial_results=True, analyzer=LengthTextAnalyzer()))
+
+        # assert
+        self.assertLess(perf_counter() - start, 1)
+        self.assertEqual(analysis['total']['count'], 2)
+        self.assertEqual(analysis['failed_providers'], ['AsyncListDataProvider'])
+        self.assertRaises(TimeoutError, asyncio.run, get_analysis_async(
+            'test', date(2022, 1, 1), providers, 10, provider_timeout=0.1, analyzer=LengthTextAnalyzer()))
+
+    def test_timed_out_blocking_provider_does_not_delay_next_calls(self):
+        # arrange
+        providers = [ListDataProvider(self.articles), SleepingListDataProvider(self.other_articles, delay=1)]
+
+        # act
+        start = perf_counter()
+        analysis = asyncio.run(get_analysis_async('test', date(2022, 1, 1), providers, 10, provider_timeout=0.1,
+                                                  allow_partial_results=True, analyzer=LengthTextAnalyzer()))
+        next_analysis = asyncio.run(get_analysis_async('test', date(2022, 1, 1), providers[:1], 10,
+                                                       provider_timeout=0.1, analyzer=LengthTextAnalyzer()))
+
+        # assert
+        self.assertLess(perf_counter() - start, 0.8)
+        self.assertEqual(analysis['failed_providers'], ['SleepingListDataProvider'])
+        self.assertEqual(analysis['total']['count'], 2)
+        self.assertEqual(next_analysis['total']['count'], 2)
+
+    @patch('Backend.data_providers.EventRegistry', return_value=SimpleNamespace())
+    def test_event_registry_without_session_attribute_is_rejected(self, event_registry_mock):
+        # act & assert
+        with self.assertRaises(AttributeError):
+            EventRegistryDataProvider('api key')
+
+    def test_providers_share_http_session(self):
+        # act
+        news_api_providers = [NewsApiDataProvider('api key'), NewsApiDataProvider('api key')]
+        event_registry_provider = EventRegistryDataProvider('api key')
+
+        # assert
+        self.assertIs(news_api_providers[0].client.request_method, get_shared_session())
+        self.assertIs(news_api_providers[1].client.request_method, get_shared_session())
+        self.assertIs(event_registry_provider.event_registry._reqSession, get_shared_session())
+
+
+class PagedListDataProvider(ListDataProvider):
+    batch_size = 2
+
+
+class IterAnalysisTests(TestCase):
+    def setUp(self):
+        self.articles = [Article(date(2022, 1, i % 3 + 1), 'Title', f'https://example.com/{i}', 'Description',
+                                 f'news number {i} ' + 'text ' * i) for i in range(7)]
+
+    def test_partial_results_lead_to_get_analysis_result(self):
+        # act
+        results = list(iter_analysis('test', date(2022, 1, 1), [PagedListDataProvider(self.articles)], 10,
+                                     analyzer=LengthTextAnalyzer(), update_interval=0))
+
+        # assert
+        self.assertEqual([result['done'] for result in results], [False] * 4 + [True])
+        self.assertEqual([result['total']['count'] for result in results], [2, 4, 6, 7, 7])
+        self.assertEqual(results[-1]['progress'], {'pages': 4, 'articles_loaded': 7, 'articles_analyzed': 7})
+        final = {key: value for key, value in results[-1].items() if key not in ('progress', 'done')}
+        self.assertEqual(final, get_analysis('test', date(2022, 1, 1), [PagedListDataProvider(self.articles)], 10,
+                                             analyzer=LengthTextAnalyzer()))
+
+    def test_cancelled_analysis_has_no_final_result(self):
+        # arrange
+        cancel = Event()
+
+        # act
+        results = []
+        for result in iter_analysis('test', date(2022, 1, 1), [PagedListDataProvider(self.articles)], 10,
+                                    analyzer=LengthTextAnalyzer(), update_interval=0, cancel=cancel):
+            results.append(result)
+            cancel.set()
+
+        # assert
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0]['done'])
+
+
+class AnalysisSnapshotTests(TestCase):
+    def setUp(self):
+        self.articles = [Article(date(2022, 1, i % 3 + 1), 'Title', f'https://example.com/{i}', 'Description',
+                                 f'news number {i} ' + 'text ' * i) for i in range(7)]
+
+    def test_saved_snapshot_is_loaded_memory_mapped(self):
+        # arrange
+        snapshot = get_analysis_snapshot('test', date(2022, 1, 1), [ListDataProvider(self.articles)], 10,
+                                         analyzer=LengthTextAnalyzer())
+
+        with TemporaryDirectory() as directory:
+            # act
+            snapshot.save(directory)
+            loaded = AnalysisSnapshot.load(directory)
+
+            # assert
+            self.assertIsInstance(loaded.analysis['daily']['count'], np.memmap)
+            self.assertIsInstance(loaded.articles.polarities, np.memmap)
+            self.assertEqual((loaded.keyword, loaded.min_date), ('test', date(2022, 1, 1)))
+            daily = {key: [date.fromisoformat(str(value)) for value in values] if key == 'dates' else values.tolist()
+                     for key, values in loaded.analysis['daily'].items()}
+            self.assertEqual(loaded.analysis | {'daily': daily}, snapshot.analysis)
+            self.assertEqual(len(loaded.articles), 7)
+            self.assertEqual(loaded.articles.get_noun_phrases(2), snapshot.articles.get_noun_phrases(2))
+            summary = {key: value for key, value in snapshot.analysis.items()
+                       if key not in ('duplicates', 'failed_providers')}
+            self.assertEqual(loaded.articles.to_accumulator().summary(), summary)
+
+
+class LazyImportTests(TestCase):
+    def test_heavy_dependencies_are_imported_on_first_use(self):
+        # arrange
+        code = """
+import sys
+from datetime import date
+from Backend.main import build_feed
+print(sorted(name for name in ('textblob', 'feedgenerator', 'newsapi', 'eventregistry') if name in sys.modules))
+build_feed('test', date(2024, 1, 1), [], '/articles/')
+print('feedgenerator' in sys.modules, 'textblob' in sys.modules)
+"""
+        project_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        # act
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                env=os.environ | {'PYTHONPATH': project_directory}).stdout
+
+        # assert
+        self.assertEqual(output.split('\n')[:2], ['[]', 'True False'])
+
+
+class ArticleStoreTests(TestCase):
+    def setUp(self):
+        self.articles = [
+            Article(date(2022, 1, 1), 'Oil prices', 'https://example.com/1', 'Markets', 'Oil prices fell on Monday.'),
+            Article(date(2022, 1, 2), 'Gas prices', 'https://example.com/2', 'Markets', 'Gas prices rose again.'),
+            Article(date(2022, 1, 3), 'Oil supply', 'https://example.com/3', 'Energy', 'New oil supply deal.'),
+        ]
+        self.other_articles = [
+            Article(date(2022, 1, 3), 'Oil supply', 'https://www.example.com/3/', 'Energy', 'New oil supply deal.'),
+            Article(date(2022, 1, 4), 'Oil prices', None, 'Markets', 'Oil prices recovered.'),
+        ]
+
+    def test_articles_loaded_by_providers_are_answered_locally(self):
+        # arrange
+        store = ArticleStore()
+        providers = with_article_store([ListDataProvider(self.articles), ListDataProvider(self.other_articles)],
+                                       store)
+        get_analysis('oil', date(2022, 1, 1), providers, 10, analyzer=LengthTextAnalyzer())
+
+        # act
+        local_provider = LocalIndexDataProvider(store)
+        entries = local_provider.load_data('Oil prices', date(2022, 1, 1), 10)
+        feed = local_provider.load_feed('oil', date(2022, 1, 2), 10)
+
+        # assert
+        self.assertEqual(store.count(), 4)
+        self.assertEqual([(entry.date, entry.text) for entry in entries], [
+            (date(2022, 1, 4), 'Oil prices recovered.'),
+            (date(2022, 1, 1), 'Oil prices fell on Monday.'),
+        ])
+        self.assertEqual([entry.title for entry in feed], ['Oil prices', 'Oil supply'])
+        self.assertEqual(store.get_latest_date('gas'), date(2022, 1, 2))
+        local_analysis = get_analysis('oil', date(2022, 1, 1), [local_provider], 10, analyzer=LengthTextAnalyzer())
+        self.assertEqual(local_analysis['total']['count'], 3)
+
+    def test_analysis_service_stores_loaded_articles(self):
+        # arrange
+        store = ArticleStore()
+        service = AnalysisService([ListDataProvider(articles_test_data)], analyzer=LengthTextAnalyzer(),
+                                  article_store=store)
+
+        # act
+        service.get_analysis('test', date(2022, 1, 1), 10)
+
+        # assert
+        self.assertEqual(store.count(), 3)
+        self.assertEqual(store.get_latest_date('text'), date(2022, 1, 3))
+
+    def test_search_matches_all_words_and_date_range(self):
+        # arrange
+        store = ArticleStore()
+        store.add(self.articles + self.other_articles)
+
+        # act
+        found = store.search('PRICES', date(2022, 1, 2), max_date=date(2022, 1, 3))
+        limited = store.search('prices', date(2022, 1, 1), max_items=2)
+
+        # assert
+        self.assertEqual([article.url for article in found], ['https://example.com/2'])
+        self.assertEqual([article.date for article in limited], [date(2022, 1, 4), date(2022, 1, 2)])
+        self.assertEqual(list(store.search('oil gas', date(2022, 1, 1))), [])
+        self.assertEqual(store.add(self.articles), 0)
+
+
+class ParallelScorerTests(TestCase):
+    def test_results_are_identical_to_sequential_analysis(self):
+        # arrange
+        entries = [DataEntry(date(2022, 1, i % 5 + 1), f'article {i} ' + 'text ' * (i % 7)) for i in range(50)]
+        analyzer = LengthTextAnalyzer()
+        score_cache = ScoreCache()
+        score_cache.score_batch([entries[0].text], analyzer)
+
+        # act
+        expected = analyze_entries(entries, analyzer=analyzer)
+        with ParallelScorer(workers=2, chunk_size=4, analyzer=analyzer) as scorer:
+            result = analyze_entries(entries, scorer=scorer)
+            cached_result = analyze_entries(entries, score_cache, scorer)
+
+        # assert
+        self.assertEqual(result, expected)
+        self.assertEqual(cached_result, expected)
+        self.assertEqual((score_cache.hits, score_cache.misses), (1, 50))
+
+    def test_top_nouns_are_configurable(self):
+        # arrange
+        entries = [DataEntry(date(2022, 1, 1), f'article {i % 7} text') for i in range(50)]
+
+        # act
+        result = analyze_entries(entries, analyzer=LengthTextAnalyzer(), top_nouns=3, nouns_capacity=4)
+
+        # assert
+        self.assertEqual(result['top3_nouns'], {'nouns': ['article', '0', '1'], 'count': [50, 8, 7]})
+
+
+# texts with every rule of TextBlob sentiment analysis: modifiers, negations, exclamation marks,
+# contractions, abbreviations and punctuation
+sentiment_test_texts = [
+    'The new agreement is a great success for the region.',
+    'Prices increased again and people are very unhappy about the terrible crisis.',
+    'It isn\'t a very good day for the market, I don\'t like it!',
+    'The minister is not happy. The talks were never successful.',
+    'Really not good news for the army, extremely bad news for the border!!!',
+    'Mr. Smith said the U.S. economy is strong... but not a strong one, e.g. weak exports.',
+    'The “free” elections were hardly fair; the results were (surprisingly) positive!',
+    'Nothing happened.',
+    '',
+    'Not bad at all! The company reported rather good, well-intentioned results.',
+]
+
+
+class SentimentAnalyzerTests(TestCase):
+    def test_lexicon_analyzer_matches_textblob(self):
+        # act
+        expected = TextBlobSentimentAnalyzer().polarities(sentiment_test_texts)
+        polarities = LexiconSentimentAnalyzer().polarities(sentiment_test_texts)
+
+        # assert
+        np.testing.assert_allclose(polarities, expected, atol=1e-9)
+        self.assertEqual((polarities > 0.2).tolist(), (expected > 0.2).tolist())
+        self.assertEqual((polarities < -0.2).tolist(), (expected < -0.2).tolist())
+
+    def test_batch_results_are_identical_to_single_text_results(self):
+        # arrange
+        analyzer = LexiconSentimentAnalyzer()
+
+        # act
+        polarities = analyzer.polarities(sentiment_test_texts)
+        single_polarities = [analyzer.polarities([text])[0] for text in sentiment_test_texts]
+
+        # assert
+        self.assertEqual(polarities.tolist(), single_polarities)
+
+    def test_add_batch_is_identical_to_add(self):
+        # arrange
+        batch = DataBatch.from_entries(DataEntry(date(2022, 1, i % 3 + 1), f'text {i}') for i in range(9))
+        polarities = np.array([-0.5, -0.2, 0.0, 0.2, 0.21, 1.0, -0.21, 0.1, 0.3])
+        noun_phrases = [[f'noun {i % 2}'] for i in range(9)]
+        accumulator = AnalysisAccumulator()
+        batch_accumulator = AnalysisAccumulator()
+
+        # act
+        for post_date, polarity, nouns in zip(batch.iter_dates(), polarities, noun_phrases):
+            accumulator.add(post_date, polarity, nouns)
+        batch_accumulator.add_batch(batch.dates, polarities, noun_phrases)
+
+        # assert
+        self.assertEqual(batch_accumulator.summary(), accumulator.summary())
+        self.assertEqual(batch_accumulator.summary()['total']['positive'], 3)
+
+
+class LexiconNounPhraseExtractorTests(TestCase):
+    def test_extract(self):
+        # arrange
+        extractor = LexiconNounPhraseExtractor()
+
+        # act
+        noun_phrases = extractor.extract([
+            'The new agreement is a great success for the region.',
+            'Ukraine\'s president met Volodymyr Zelensky to discuss oil prices in New York.',
+            '',
+        ])
+
+        # assert
+        self.assertEqual(noun_phrases, [
+            ['new agreement', 'great success'],
+            ['ukraine', 'volodymyr zelensky', 'oil prices', 'new york'],
+            [],
+        ])
+
+
+class SpaceSavingCounterTests(TestCase):
+    def test_counts_are_exact_until_eviction(self):
+        # arrange
+        items = [f'item {i % 5}' for i in range(23)]
+        counter = SpaceSavingCounter(capacity=3)
+
+        # act
+        counter.update(items)
+
+        # assert
+        self.assertEqual(dict(counter.items()), Counter(items))
+        self.assertEqual(counter.error, 0)
+
+    def test_frequent_items_are_kept_with_bounded_memory(self):
+        # arrange
+        items = [f'rare {i}' if i % 3 else f'frequent {i % 2}' for i in range(3000)]
+        counter = SpaceSavingCounter(capacity=10)
+        merged = SpaceSavingCounter(capacity=10)
+
+        # act
+        counter.update(items)
+        merged.update(items[:1500])
+        other = SpaceSavingCounter(capacity=10)
+        other.update(items[1500:])
+        merged.update(other)
+
+        # assert
+        for result in (counter, merged):
+            self.assertLessEqual(len(result), 20)
+            top = sorted(result.items(), key=lambda item: -item[1])[:2]
+            self.assertEqual(sorted(item for item, _ in top), ['frequent 0', 'frequent 1'])
+            for item, count in top:
+                self.assertLessEqual(500, count)
+                self.assertLessEqual(count, 500 + result.error)
+
+
+wire_story = ('The central bank raised interest rates by half a percentage point on Tuesday, '
+              'citing persistent inflation and a strong labour market. Officials said further increases '
+              'were likely this year, while markets had expected a smaller move. The decision was unanimous, '
+              'and the bank will publish its updated forecasts next month.')
+
+
+class DeduplicationIndexTests(TestCase):
+    def test_normalize_url(self):
+        # act
+        normalized = {normalize_url(url) for url in [
+            'https://www.example.com/news/story/?utm_source=feed&id=1#comments',
+            'http://example.com/news/story?id=1',
+            'HTTPS://EXAMPLE.COM/news/story?fbclid=abc&id=1',
+        ]}
+
+        # assert
+        self.assertEqual(len(normalized), 1)
+        self.assertNotEqual(normalize_url('https://example.com/news/story?id=2'), normalized.pop())
+
+    def test_duplicates_are_found_by_url_and_text(self):
+        # arrange
+        index = DeduplicationIndex()
+        index.add('https://example.com/story', wire_story)
+
+        # act
+        added = [
+            index.add('http://www.example.com/story/', 'Different text of the same page.'),
+            index.add('https://other.com/story', wire_story.replace('Tuesday', 'Wednesday') + ' Reporting by Reuters.'),
+            index.add('https://other.com/another', 'The city council approved the new budget for schools.'),
+            index.add(None, 'Too short'),
+            index.add(None, 'Too short'),
+        ]
+
+        # assert
+        self.assertEqual(added, [False, False, True, True, True])
+        self.assertEqual(index.duplicates, 2)
+
+    def test_duplicates_of_providers_are_analyzed_once(self):
+        # arrange
+        providers = [
+            ListDataProvider([Article(date(2022, 1, 1), 'Title', 'https://example.com/1', 'Description', wire_story)]),
+            ListDataProvider([
+                Article(date(2022, 1, 1), 'Title', 'https://www.example.com/1?utm_medium=api', 'Description', 'Text'),
+                Article(date(2022, 1, 2), 'Title', 'https://other.com/2', 'Description', 'Other text'),
+            ]),
+        ]
+
+        # act
+        result = get_analysis('test', date(2022, 1, 1), providers, 10, analyzer=LengthTextAnalyzer(),
+                              deduplicate=True)
+        unfiltered = get_analysis('test', date(2022, 1, 1), providers, 10, analyzer=LengthTextAnalyzer())
+
+        # assert
+        self.assertEqual((result['total']['count'], result['duplicates']), (2, 1))
+        self.assertEqual((unfiltered['total']['count'], unfiltered['duplicates']), (3, 0))
+
+
+class SleepingListDataProvider(ListDataProvider):
+    def __init__(self, articles, delay):
+        super().__init__(articles)
+        self.delay = delay
+
+    def load_articles(self, keyword, min_published_date, max_items):
+        sleep(self.delay)
+        return super().load_articles(keyword, min_published_date, max_items)
+
+
+class AnalysisServerTests(TestCase):
+    def setUp(self):
+        self.provider = SleepingListDataProvider([
+            Article(date(2022, 1, 1), 'First title', 'URL 1', 'Description', 'first news text'),
+            Article(date(2022, 1, 2), 'Second title', 'URL 2', 'Description', 'second news article text'),
+        ], delay=0.3)
+        self.service = AnalysisService([self.provider], analyzer=LengthTextAnalyzer(), max_concurrent=1, max_queued=1)
+        self.server = AnalysisServer(self.service, port=0)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, path, headers=None):
+        request = Request(f'http://127.0.0.1:{self.server.server_address[1]}{path}', headers=headers or {})
+        with urlopen(request) as response:
+            return response.headers['Content-Type'], response.read().decode('utf-8')
+
+    def request_headers(self, path, headers=None):
+        request = Request(f'http://127.0.0.1:{self.server.server_address[1]}{path}', headers=headers or {})
+        with urlopen(request) as response:
+            return response.headers
+
+    def test_get_analysis_and_feed(self):
+        # act
+        analysis_type, analysis = self.request('/analysis?keyword=test&min_date=2022-01-02&max_items=10')
+        feed_type, feed = self.request('/feed?keyword=test&min_date=2022-01-01')
+
+        # assert
+        self.assertEqual(analysis_type, 'application/json')
+        self.assertEqual(json.loads(analysis)['daily']['dates'], ['2022-01-02'])
+        self.assertEqual(json.loads(analysis)['total']['count'], 1)
+        self.assertTrue(feed_type.startswith('application/rss+xml'))
+        self.assertIn('Second title', feed)
+
+    def test_identical_requests_are_coalesced(self):
+        # act
+        with ThreadPoolExecutor(5) as executor:
+            results = list(executor.map(self.request, ['/analysis?keyword=test&min_date=2022-01-01'] * 5))
+
+        # assert
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(self.service.computations, 1)
+        self.assertEqual(len(self.provider.requested_dates), 1)
+
+    def test_requests_over_queue_limit_are_rejected(self):
+        # act
+        with ThreadPoolExecutor(3) as executor:
+            futures = []
+            for keyword in ['first', 'second', 'third']:
+                futures.append(executor.submit(self.request, f'/analysis?keyword={keyword}&min_date=2022-01-01'))
+                sleep(0.05)
+
+            with self.assertRaises(HTTPError) as context:
+                futures[2].result()
+            futures[0].result()
+            futures[1].result()
+
+        # assert
+        self.assertEqual(context.exception.code, 503)
+        self.assertEqual(self.service.computations, 2)
+
+    def test_invalid_query_is_rejected(self):
+        # act
+        with self.assertRaises(HTTPError) as context:
+            self.request('/analysis?keyword=test&min_date=yesterday')
+
+        # assert
+        self.assertEqual(context.exception.code, 400)
+
+    def test_metrics_are_exposed_and_requests_are_profiled(self):
+        # arrange
+        default_metrics.sink = PrometheusSink()
+        self.addCleanup(setattr, default_metrics, 'sink', None)
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.service.profile_directory = directory.name
+
+        # act
+        self.request('/analysis?keyword=test&min_date=2022-01-01&max_items=10&profile=1')
+        metrics_type, metrics = self.request('/metrics')
+
+        # assert
+        self.assertTrue(metrics_type.startswith('text/plain; version=0.0.4'))
+        self.assertIn('social_media_analysis_articles_loaded_total{provider="SleepingListDataProvider"} 2', metrics)
+        self.assertIn('social_media_analysis_span_seconds_count{span="get_analysis"} 1', metrics)
+        self.assertEqual(len(os.listdir(directory.name)), 1)
+
+    def test_unchanged_feed_is_answered_with_not_modified(self):
+        # arrange
+        path = '/feed?keyword=test&min_date=2022-01-01'
+        headers = self.request_headers(path)
+
+        # act
+        with self.assertRaises(HTTPError) as etag_context:
+            self.request(path, {'If-None-Match': headers['ETag']})
+        with self.assertRaises(HTTPError) as date_context:
+            self.request(path, {'If-Modified-Since': headers['Last-Modified']})
+        self.provider.articles.append(
+            Article(date(2022, 1, 3), 'Third title', 'URL 3', 'Description', 'third news text'))
+        _, feed = self.request(path, {'If-None-Match': headers['ETag']})
+
+        # assert
+        self.assertEqual(etag_context.exception.code, 304)
+        self.assertEqual(date_context.exception.code, 304)
+        self.assertIn('Third title', feed)
+        self.assertEqual(self.service.feed_snapshots.builds, 2)
+
+
+class FeedSnapshotStoreTests(TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.articles = [
+            Article(date(2022, 1, 1), 'First title', 'URL 1', 'Description', 'Text'),
+            Article(date(2022, 1, 2), 'Second title', 'URL 2', 'Description', 'Text'),
+        ]
+        self.providers = [ListDataProvider(self.articles), ListDataProvider(self.articles[::-1])]
+        self.store = FeedSnapshotStore(self.providers, clock=lambda: self.now)
+
+    def test_feed_is_rebuilt_only_when_articles_change(self):
+        # act
+        first = self.store.get_snapshot('test', date(2022, 1, 1), 10, '/feed')
+        self.now += 10
+        second = self.store.get_snapshot('test', date(2022, 1, 1), 10, '/feed')
+        self.now += 10
+        self.articles.append(Article(date(2022, 1, 3), 'Third title', 'URL 3', 'Description', 'Text'))
+        third = self.store.get_snapshot('test', date(2022, 1, 1), 10, '/feed')
+
+        # assert
+        self.assertEqual(self.store.builds, 2)
+        self.assertIs(first.body, second.body)
+        self.assertEqual((first.etag, first.last_modified), (second.etag, second.last_modified))
+        self.assertNotEqual(first.etag, third.etag)
+        self.assertEqual(third.last_modified, self.now)
+        self.assertEqual(third.body.count(b'<item>'), 3)
+        self.assertLess(third.body.index(b'Third title'), third.body.index(b'First title'))
+
+    def test_articles_are_not_reloaded_within_max_age(self):
+        # arrange
+        self.store.max_age = 60
+
+        # act
+        self.store.get_snapshot('test', date(2022, 1, 1), 10, '/feed')
+        self.now += 30
+        self.store.get_snapshot('test', date(2022, 1, 1), 10, '/feed')
+        self.now += 60
+        self.store.get_snapshot('test', date(2022, 1, 1), 10, '/feed')
+
+        # assert
+        self.assertEqual(len(self.providers[0].requested_dates), 2)
+
 
 if __name__ == '__main__':
     main()